@@ -9,21 +9,49 @@ MCP tool connectivity, skill injection, and guardrail middleware.
 |
 """
 
+import asyncio
+import atexit
+import collections
 import concurrent.futures
+import dataclasses
+import functools
+import itertools
 import json
 import logging
 import os
-import subprocess
+import re
+import shutil
+import tarfile
+import tempfile
 import time
 import threading
+import urllib.request
 import uuid
 from pathlib import Path
+from types import MappingProxyType
 
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 import fiftyone.core.utils as fou
 
 anthropic = fou.lazy_import("anthropic")
+httpx = fou.lazy_import("httpx")
+pymongo = fou.lazy_import("pymongo")
+
+try:
+    import orjson
+
+    def _dumps(obj, sort_keys=False):
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode()
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj, sort_keys=False):
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"))
+
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +61,228 @@ MAX_TOKENS = 8192
 
 DEFAULT_SKILLS_DIR = os.path.expanduser("~/.fiftyone/skills")
 SKILLS_REPO_URL = "https://github.com/voxel51/fiftyone-skills"
+SKILLS_TARBALL_URL = SKILLS_REPO_URL + "/archive/refs/heads/main.tar.gz"
+
+_DEFAULT_MCP_SERVERS = (
+    MappingProxyType(
+        {
+            "command": "fiftyone-mcp",
+            "args": (),
+            "enabled": True,
+            "label": "fiftyone-mcp-server",
+        }
+    ),
+)
+_DEFAULT_SETTINGS = MappingProxyType(
+    {
+        "model": DEFAULT_MODEL,
+        "max_tokens": MAX_TOKENS,
+        "permission_mode": "auto",
+        "persist_history": True,
+    }
+)
+
+_TRIG_TOOL_CALL_START = "%s/tool_call_start" % PLUGIN_NAME
+_TRIG_STREAM_CHUNK = "%s/stream_chunk" % PLUGIN_NAME
+_TRIG_TOOL_BLOCKED = "%s/tool_blocked" % PLUGIN_NAME
+_TRIG_CONFIRMATION = "%s/confirmation_required" % PLUGIN_NAME
+_TRIG_TOOL_RESULT = "%s/tool_result" % PLUGIN_NAME
+_TRIG_STREAM_ERROR = "%s/stream_error" % PLUGIN_NAME
+_TRIG_STREAM_COMPLETE = "%s/stream_complete" % PLUGIN_NAME
+_TRIG_MESSAGE_START = "%s/stream_message_start" % PLUGIN_NAME
+
+
+def _parse_env(name, default, cast):
+    """Parse a numeric setting from an environment variable.
+
+    Args:
+        name: the environment variable name
+        default: the value to use if the variable is unset or invalid
+        cast: the type to parse the value as, e.g. ``int``
+
+    Returns:
+        the parsed value
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning(
+            "Invalid value %r for %s; using the default of %s",
+            value,
+            name,
+            default,
+        )
+        return default
+
+
+MAX_KEEPALIVE_CONNECTIONS = _parse_env(
+    "ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS", 20, int
+)
+MAX_CONNECTIONS = _parse_env("ANTHROPIC_MAX_CONNECTIONS", 100, int)
+KEEPALIVE_EXPIRY = _parse_env("ANTHROPIC_KEEPALIVE_EXPIRY", 30.0, float)
+
+
+@dataclasses.dataclass
+class PendingOp:
+    """A tool call awaiting user confirmation, with the state needed to
+    resume the conversation once it is approved.
+    """
 
-_pending_operations = {}
+    __slots__ = (
+        "messages",
+        "tool_id",
+        "tool_name",
+        "tool_input",
+        "message_id",
+        "system_prompt",
+        "tools",
+        "model",
+        "max_tokens",
+        "mcp_manager",
+    )
+
+    messages: list
+    tool_id: str
+    tool_name: str
+    tool_input: dict
+    message_id: str
+    system_prompt: str
+    tools: list
+    model: str
+    max_tokens: int
+    mcp_manager: object
+
+
+class _PendingStore:
+    """A bounded, thread-safe store of operations awaiting confirmation.
+
+    Each pending operation holds the full conversation, so abandoned entries
+    are evicted once they are older than ``ttl`` seconds or when more than
+    ``maxsize`` operations are pending, oldest first. Expired entries are
+    swept lazily on each access.
+
+    The message ID of each evicted operation is remembered in a small
+    bounded map, so that a late confirmation can still close the message
+    that is waiting on it.
+
+    Args:
+        maxsize (64): the maximum number of pending operations
+        ttl (600): the number of seconds after which an unconfirmed
+            operation is discarded
+        max_evicted (256): the maximum number of evicted operations whose
+            message IDs are remembered
+    """
+
+    def __init__(self, maxsize=64, ttl=600, max_evicted=256):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_evicted = max_evicted
+        self._items = collections.OrderedDict()
+        self._evicted = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            self._sweep()
+
+    def __len__(self):
+        with self._lock:
+            self._sweep()
+            return len(self._items)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            self._sweep()
+            item = self._items.pop(key, None)
+
+        return item[1] if item is not None else default
+
+    def pop_evicted(self, key):
+        """Return the message ID of an operation that was evicted before it
+        was confirmed or cancelled.
+
+        Args:
+            key: the pending operation ID
+
+        Returns:
+            the message ID, or ``None`` if the operation was not evicted
+        """
+        with self._lock:
+            self._sweep()
+            return self._evicted.pop(key, None)
+
+    def _sweep(self):
+        cutoff = time.monotonic() - self.ttl
+        while self._items:
+            created_at, _ = next(iter(self._items.values()))
+            if len(self._items) <= self.maxsize and created_at > cutoff:
+                break
+
+            key, (_, value) = self._items.popitem(last=False)
+            self._evicted[key] = value.message_id
+            while len(self._evicted) > self.max_evicted:
+                self._evicted.popitem(last=False)
+
+
+_pending_operations = _PendingStore()
+
+_loop = None
+_loop_lock = threading.Lock()
+
+_client_cache = {}
+_client_cache_lock = threading.Lock()
+
+_tool_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="claude-agent-tool"
+)
+
+_skills_downloads = set()
+_skills_downloads_lock = threading.Lock()
+
+_skills_loaders = {}
+_skills_loaders_lock = threading.Lock()
+
+_mcp_managers = {}
+_mcp_connecting = {}
+_mcp_managers_lock = threading.Lock()
+
+_MAX_HISTORY_TURNS = 20
+_SAVED_HISTORY_TOKEN_BUDGET = 40000
+_VALID_ROLES = frozenset(("user", "assistant"))
+
+_MAX_CONTEXT_FIELDS = 20
+_FO_CONTEXT_CACHE_SIZE = 32
+_FO_CONTEXT_TTL = 5
+_fo_context_cache = collections.OrderedDict()
+_fo_context_cache_lock = threading.Lock()
+
+_load_inflight = {}
+_load_inflight_lock = threading.Lock()
+
+_LAST_SAVED_TTL = 60
+_last_saved_hash = {}
+_last_saved_hash_lock = threading.Lock()
+
+# Text deltas are coalesced into one stream_chunk trigger per window
+_STREAM_FLUSH_CHARS = 512
+_STREAM_FLUSH_INTERVAL = 0.016
+
+# Side-effect free MCP tools, whose results may be cached and whose inputs
+# are subject to lighter guardrail checks
+_READ_ONLY_TOOL_NAMES = frozenset(
+    {
+        "list_datasets",
+        "dataset_summary",
+        "get_field_schema",
+        "list_views",
+    }
+)
 
 
 
@@ -68,6 +316,12 @@ class GuardrailLayer:
 
     CONFIRM_TOOL_NAMES = frozenset({"close_app", "disable_plugin"})
 
+    # Read-only tools whose inputs are not scanned when all of their values
+    # are short scalars
+    SAFE_TOOL_NAMES = _READ_ONLY_TOOL_NAMES
+
+    SAFE_INPUT_MAX_LENGTH = 256
+
     CONFIRM_OPERATOR_KEYWORDS = [
         "delete",
         "remove",
@@ -93,19 +347,21 @@ class GuardrailLayer:
         if tool_name in self.BLOCKED_TOOL_NAMES:
             return "block"
 
-        input_str = json.dumps(tool_input).lower()
-        for pattern in self.BLOCKED_INPUT_SUBSTRINGS:
-            if pattern in input_str:
-                return "block"
+        if tool_name in self.SAFE_TOOL_NAMES and self._is_simple_input(
+            tool_input
+        ):
+            return "allow"
+
+        if self._find_blocked_pattern(tool_input):
+            return "block"
 
         if tool_name in self.CONFIRM_TOOL_NAMES:
             return "confirm"
 
         if tool_name == "execute_operator":
             op_name = str(tool_input.get("operator_name", "")).lower()
-            for kw in self.CONFIRM_OPERATOR_KEYWORDS:
-                if kw in op_name:
-                    return "confirm"
+            if _find_substring(self.CONFIRM_OPERATOR_KEYWORDS, op_name):
+                return "confirm"
 
         return "allow"
 
@@ -141,13 +397,33 @@ class GuardrailLayer:
         if tool_name in self.BLOCKED_TOOL_NAMES:
             return "Tool '%s' is blocked by safety policy." % tool_name
 
-        input_str = json.dumps(tool_input).lower()
-        for pattern in self.BLOCKED_INPUT_SUBSTRINGS:
-            if pattern in input_str:
-                return "Input contains blocked pattern: '%s'." % pattern
+        pattern = self._find_blocked_pattern(tool_input)
+        if pattern:
+            return "Input contains blocked pattern: '%s'." % pattern
 
         return "Operation blocked by guardrails."
 
+    def _is_simple_input(self, tool_input):
+        for value in tool_input.values():
+            if isinstance(value, (dict, list, tuple)):
+                return False
+
+            if (
+                isinstance(value, str)
+                and len(value) > self.SAFE_INPUT_MAX_LENGTH
+            ):
+                return False
+
+        return True
+
+    def _find_blocked_pattern(self, tool_input):
+        for text in _iter_strings(tool_input):
+            pattern = _find_substring(self.BLOCKED_INPUT_SUBSTRINGS, text)
+            if pattern:
+                return pattern
+
+        return None
+
     def get_confirmation_message(self, tool_name, tool_input):
         """Return a human-readable description for the confirmation dialog.
 
@@ -178,43 +454,226 @@ class GuardrailLayer:
         )
 
 
+# The guardrail policy lives entirely in class attributes, so one instance
+# is shared by all operators
+_guardrail = GuardrailLayer()
+
 
 
-def _run_in_new_thread(coro):
-    """Run an async coroutine in a dedicated thread with its own event loop.
 
-    This avoids conflicts with any existing event loops in the calling
-    thread (e.g. those created by FiftyOne's async infrastructure).
+def _iter_strings(value):
+    """Yield the lowercased keys and leaf values of a nested structure.
+
+    Args:
+        value: a JSON-like value (dict, list, or scalar)
+
+    Yields:
+        lowercased strings
+    """
+    if isinstance(value, dict):
+        for k, v in value.items():
+            yield str(k).lower()
+            yield from _iter_strings(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _iter_strings(v)
+    elif value is not None:
+        yield str(value).lower()
+
+
+def _find_substring(substrings, text):
+    """Return the first of the given substrings that occurs in the text.
+
+    The substrings are compiled into a single cached regex so the text is
+    scanned once, rather than once per substring.
+
+    Args:
+        substrings: an iterable of literal substrings
+        text: the string to search
+
+    Returns:
+        the matched substring, or ``None``
+    """
+    pattern = _compile_substrings(tuple(substrings))
+    if pattern is None:
+        return None
+
+    match = pattern.search(text)
+    return match.group(0) if match else None
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_substrings(substrings):
+    if not substrings:
+        return None
+
+    return re.compile("|".join(map(re.escape, substrings)))
+
+
+def _get_event_loop():
+    """Return the plugin's background event loop, starting it if needed.
+
+    All sync-to-async calls in this module run on this single loop, which
+    is owned by a daemon thread. This avoids conflicts with any existing
+    event loops in the calling thread (e.g. those created by FiftyOne's
+    async infrastructure) without creating a thread and loop per call.
+    ``uvloop`` is used when it is installed.
+
+    Returns:
+        an :class:`asyncio.AbstractEventLoop`
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            try:
+                import uvloop
+
+                loop = uvloop.new_event_loop()
+            except ImportError:
+                loop = asyncio.new_event_loop()
+
+            threading.Thread(
+                target=loop.run_forever, name="claude-agent-loop", daemon=True
+            ).start()
+            _loop = loop
+
+    return _loop
+
+
+def _run_coroutine(coro, timeout=60):
+    """Run an async coroutine on the plugin's background event loop.
 
     Args:
         coro: the coroutine to run
+        timeout (60): the maximum number of seconds to wait for the result
 
     Returns:
         the coroutine result
     """
-    import asyncio
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        future = pool.submit(asyncio.run, coro)
-        return future.result(timeout=60)
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result(
+        timeout=timeout
+    )
 
 
 class MCPClientManager:
     """Manages a connection to an MCP server subprocess via stdio JSON-RPC.
 
-    Each call to :meth:`list_tools` or :meth:`call_tool` starts a fresh
-    subprocess connection. This is less efficient than a persistent
-    connection but is simpler and avoids async context-manager complexity.
+    The server subprocess is started and the MCP session initialized once,
+    on first use or via :meth:`connect`, and then reused by every
+    :meth:`list_tools` and :meth:`call_tool` call. The session lives on the
+    plugin's background event loop, so the synchronous operator code can
+    submit requests to it from any thread.
+
+    If the persistent session cannot be established, each call falls back
+    to starting a fresh subprocess connection.
+
+    Successful results of read-only tools listed in ``cacheable_tools`` are
+    memoized for :attr:`RESULT_CACHE_TTL` seconds in a small LRU cache keyed
+    by tool name and arguments. The cache is cleared whenever any other tool
+    is called, since it may have modified the data that cached results
+    describe, and the TTL bounds how stale results can get when data is
+    modified outside of MCP.
 
     Args:
         command: the command used to launch the server (e.g. ``"python"``)
         args: list of args passed to the server command
+        cacheable_tools (None): an optional iterable of side-effect free
+            tool names whose results can be cached. By default,
+            :attr:`DEFAULT_CACHEABLE_TOOLS` is used
     """
 
-    def __init__(self, command, args):
+    DEFAULT_CACHEABLE_TOOLS = _READ_ONLY_TOOL_NAMES
+
+    RESULT_CACHE_SIZE = 128
+    RESULT_CACHE_TTL = 30
+
+    def __init__(self, command, args, cacheable_tools=None):
         self.command = command
         self.args = args
+        self.cacheable_tools = (
+            frozenset(cacheable_tools)
+            if cacheable_tools is not None
+            else self.DEFAULT_CACHEABLE_TOOLS
+        )
         self._tools_cache = None
+        self._result_cache = collections.OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._result_cache_generation = 0
+        self._session = None
+        self._session_future = None
+        self._closed = None
+        self._lock = threading.Lock()
+
+    def connect(self, timeout=60):
+        """Start the server subprocess and initialize the MCP session.
+
+        Does nothing if the session is already open.
+
+        Args:
+            timeout (60): the maximum number of seconds to wait for the
+                session to be initialized
+        """
+        with self._lock:
+            if self._session is not None and not self._session_future.done():
+                return
+
+            ready = concurrent.futures.Future()
+            self._session_future = asyncio.run_coroutine_threadsafe(
+                self._run_session(ready), _get_event_loop()
+            )
+            ready.result(timeout=timeout)
+
+    def close(self, timeout=5):
+        """Close the MCP session and stop the server subprocess.
+
+        Args:
+            timeout (5): the maximum number of seconds to wait for the
+                session to shut down
+        """
+        with self._lock:
+            if self._session_future is None:
+                return
+
+            try:
+                _run_coroutine(self.aclose(), timeout=timeout)
+                self._session_future.result(timeout=timeout)
+            except Exception as e:
+                logger.debug("Error closing MCP session: %s", e)
+
+    async def aclose(self):
+        """Signal the session task to exit its context managers."""
+        if self._closed is not None:
+            self._closed.set()
+
+    async def _run_session(self, ready):
+        # The stdio and session context managers must be entered and exited
+        # from the same task, so this task holds them open until closed
+        try:
+            from mcp.client.session import ClientSession
+            from mcp.client.stdio import stdio_client, StdioServerParameters
+
+            params = StdioServerParameters(
+                command=self.command, args=self.args
+            )
+            self._closed = asyncio.Event()
+            async with stdio_client(params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self._session = session
+                    ready.set_result(None)
+                    await self._closed.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("MCP session closed: %s", e)
+        finally:
+            self._session = None
+
+    def _run(self, coro_fn, timeout=60):
+        self.connect()
+        return _run_coroutine(coro_fn(self._session), timeout=timeout)
 
     def list_tools(self):
         """Return available MCP tools in Anthropic tool format.
@@ -229,7 +688,16 @@ class MCPClientManager:
             return self._tools_cache
 
         try:
-            mcp_tools = _run_in_new_thread(self._async_list_tools())
+            try:
+                mcp_tools = self._run(_session_list_tools)
+            except Exception as e:
+                logger.warning(
+                    "Persistent MCP session unavailable (%s); "
+                    "falling back to a one-off connection",
+                    e,
+                )
+                mcp_tools = _run_coroutine(self._async_list_tools())
+
             self._tools_cache = [_mcp_to_anthropic_tool(t) for t in mcp_tools]
             logger.info("Loaded %d MCP tools", len(self._tools_cache))
             return self._tools_cache
@@ -247,11 +715,68 @@ class MCPClientManager:
         Returns:
             the tool result string
         """
+        if name in self.cacheable_tools:
+            key = (name, _dumps(arguments, sort_keys=True))
+            with self._result_cache_lock:
+                entry = self._result_cache.get(key, None)
+                if entry is not None:
+                    if time.monotonic() - entry[0] < self.RESULT_CACHE_TTL:
+                        self._result_cache.move_to_end(key)
+                        return entry[1]
+
+                    del self._result_cache[key]
+
+                generation = self._result_cache_generation
+        else:
+            key = None
+            self._invalidate_results()
+
         try:
-            return _run_in_new_thread(self._async_call_tool(name, arguments))
+            result, is_error = self._call_tool(name, arguments)
         except Exception as e:
             logger.warning("Tool call error (%s): %s", name, e)
             return "Error calling %s: %s" % (name, str(e))
+        finally:
+            # Reads that ran concurrently with this call may have seen
+            # either the old or the new data
+            if key is None:
+                self._invalidate_results()
+
+        if key is None or is_error:
+            return result
+
+        with self._result_cache_lock:
+            # Don't cache a read that raced with a write
+            if generation == self._result_cache_generation:
+                self._result_cache[key] = (time.monotonic(), result)
+                while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        return result
+
+    def _invalidate_results(self):
+        with self._result_cache_lock:
+            self._result_cache.clear()
+            self._result_cache_generation += 1
+
+    def _call_tool(self, name, arguments):
+        # Only fall back before the request is sent. Once it has been sent,
+        # the tool may already have run, so errors and timeouts are raised
+        # rather than retried
+        try:
+            self.connect()
+            session = self._session
+            if session is None:
+                raise RuntimeError("MCP session closed")
+        except Exception as e:
+            logger.warning(
+                "Persistent MCP session unavailable (%s); "
+                "falling back to a one-off connection",
+                e,
+            )
+            return _run_coroutine(self._async_call_tool(name, arguments))
+
+        return _run_coroutine(_session_call_tool(session, name, arguments))
 
     async def _async_list_tools(self):
         try:
@@ -266,15 +791,14 @@ class MCPClientManager:
         async with stdio_client(params) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
-                result = await session.list_tools()
-                return list(result.tools)
+                return await _session_list_tools(session)
 
     async def _async_call_tool(self, name, arguments):
         try:
             from mcp.client.session import ClientSession
             from mcp.client.stdio import stdio_client, StdioServerParameters
         except ImportError:
-            return "MCP package not available."
+            return "MCP package not available.", True
 
         params = StdioServerParameters(
             command=self.command, args=self.args
@@ -282,10 +806,21 @@ class MCPClientManager:
         async with stdio_client(params) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
-                result = await session.call_tool(name, arguments)
-                return "\n".join(
-                    c.text for c in result.content if hasattr(c, "text")
-                ) or "(no output)"
+                return await _session_call_tool(session, name, arguments)
+
+
+async def _session_list_tools(session):
+    result = await session.list_tools()
+    return list(result.tools)
+
+
+async def _session_call_tool(session, name, arguments):
+    result = await session.call_tool(name, arguments)
+    text = (
+        "\n".join(c.text for c in result.content if hasattr(c, "text"))
+        or "(no output)"
+    )
+    return text, bool(getattr(result, "isError", False))
 
 
 def _mcp_to_anthropic_tool(mcp_tool):
@@ -316,10 +851,12 @@ def _mcp_to_anthropic_tool(mcp_tool):
 
 
 def _ensure_skills_dir(skills_dir):
-    """Ensure the skills directory exists, cloning the repo if needed.
+    """Ensure the skills directory exists, downloading the repo if needed.
 
-    If the directory does not exist and git is available, clones
-    ``https://github.com/voxel51/fiftyone-skills`` into ``skills_dir``.
+    If the directory does not exist, downloads a snapshot of
+    ``https://github.com/voxel51/fiftyone-skills`` into ``skills_dir`` in a
+    background thread. Callers do not wait for the download; they continue
+    with whatever skills are currently on disk.
 
     Args:
         skills_dir: :class:`pathlib.Path` to the skills directory
@@ -327,69 +864,159 @@ def _ensure_skills_dir(skills_dir):
     if skills_dir.exists():
         return
 
+    with _skills_downloads_lock:
+        if skills_dir in _skills_downloads:
+            return
+
+        _skills_downloads.add(skills_dir)
+
+    threading.Thread(
+        target=_download_skills, args=(skills_dir,), daemon=True
+    ).start()
+
+
+def _download_skills(skills_dir):
     logger.info(
-        "Skills directory not found at %s. Cloning %s …",
+        "Skills directory not found at %s. Downloading %s …",
         skills_dir,
-        SKILLS_REPO_URL,
+        SKILLS_TARBALL_URL,
     )
     try:
         skills_dir.parent.mkdir(parents=True, exist_ok=True)
-        subprocess.run(
-            ["git", "clone", "--depth", "1", SKILLS_REPO_URL, str(skills_dir)],
-            check=True,
-            capture_output=True,
-            timeout=60,
-        )
-        logger.info("Cloned fiftyone-skills to %s", skills_dir)
+        tmp_dir = tempfile.mkdtemp(prefix=".skills-", dir=skills_dir.parent)
+        try:
+            with urllib.request.urlopen(SKILLS_TARBALL_URL, timeout=30) as r:
+                with tarfile.open(fileobj=r, mode="r|gz") as tar:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(tmp_dir, filter="data")
+                    else:
+                        tar.extractall(tmp_dir)
+
+            # The archive contains a single top-level directory, which is
+            # moved into place atomically
+            (root_dir,) = Path(tmp_dir).iterdir()
+            os.replace(root_dir, skills_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        logger.info("Downloaded fiftyone-skills to %s", skills_dir)
     except Exception as e:
-        logger.warning("Failed to clone fiftyone-skills: %s", e)
+        logger.warning("Failed to download fiftyone-skills: %s", e)
+        with _skills_downloads_lock:
+            _skills_downloads.discard(skills_dir)
 
 
 class SkillsLoader:
     """Loads skill markdown files from the fiftyone-skills directory.
 
+    Skills are discovered by scanning the directory for ``SKILL.md`` files,
+    but a skill's content is only read from disk when it is needed, and is
+    cached until the file's modification time changes. The directory is
+    only rescanned when its own modification time changes.
+
     Args:
         skills_dir: path to the directory containing skill subdirectories.
             Each subdirectory must contain a ``SKILL.md`` file.
     """
 
+    PROMPT_CACHE_SIZE = 16
+
     def __init__(self, skills_dir=None):
         self.skills_dir = Path(skills_dir or DEFAULT_SKILLS_DIR)
+        self._index = None
+        self._index_mtime = None
+        self._content_cache = {}
+        self._prompt_cache = collections.OrderedDict()
+        self._prompt_cache_lock = threading.Lock()
 
     def load_all(self):
         """Load all available skills from disk.
 
-        If the skills directory does not exist, attempts to clone the
-        official fiftyone-skills repository automatically.
+        If the skills directory does not exist, starts downloading the
+        official fiftyone-skills repository in the background and returns
+        the skills available so far.
 
         Returns:
             dict mapping skill name to markdown content
         """
+        skills = {}
+        for skill_name in self._build_index():
+            content = self._load_one(skill_name)
+            if content is not None:
+                skills[skill_name] = content
+
+        return skills
+
+    def names(self):
+        """Return the names of the available skills without reading them.
+
+        Returns:
+            a sorted list of skill names
+        """
+        return list(self._build_index())
+
+    def _build_index(self):
         _ensure_skills_dir(self.skills_dir)
 
-        skills = {}
-        if not self.skills_dir.exists():
-            return skills
+        # The directory may not exist yet while it is still downloading, in
+        # which case the index is empty until it appears
+        try:
+            mtime = self.skills_dir.stat().st_mtime
+        except OSError:
+            self._index = {}
+            self._index_mtime = None
+            return self._index
+
+        # Adding or removing a skill changes the directory's mtime, so the
+        # index only needs to be rebuilt when that changes
+        if self._index is not None and self._index_mtime == mtime:
+            return self._index
+
+        # DirEntry.is_dir() is usually answered from the directory listing
+        # itself, so regular files are skipped without an extra stat
+        with os.scandir(self.skills_dir) as it:
+            skill_dirs = sorted(
+                (entry for entry in it if entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
 
-        for skill_dir in sorted(self.skills_dir.iterdir()):
-            if not skill_dir.is_dir():
-                continue
+        index = {}
+        for entry in skill_dirs:
+            skill_file = os.path.join(entry.path, "SKILL.md")
+            if os.path.isfile(skill_file):
+                index[entry.name] = Path(skill_file)
 
-            skill_file = skill_dir / "SKILL.md"
-            if skill_file.exists():
-                try:
-                    content = skill_file.read_text(encoding="utf-8")
-                    skills[skill_dir.name] = content
-                except Exception as e:
-                    logger.warning(
-                        "Failed to load skill %s: %s", skill_dir.name, e
-                    )
+        self._index = index
+        self._index_mtime = mtime
+        return index
 
-        return skills
+    def _load_one(self, skill_name):
+        skill_file = self._build_index().get(skill_name, None)
+        if skill_file is None:
+            return None
+
+        try:
+            mtime = skill_file.stat().st_mtime
+            cached = self._content_cache.get(skill_name, None)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            content = skill_file.read_text(encoding="utf-8")
+        except Exception as e:
+            logger.warning("Failed to load skill %s: %s", skill_name, e)
+            return None
+
+        self._content_cache[skill_name] = (mtime, content)
+        return content
 
     def build_system_prompt(self, active_skills, fo_context):
         """Build the full system prompt for Claude.
 
+        The base instructions and active skills rarely change between
+        messages, so that part of the prompt is cached and placed first,
+        followed by the FiftyOne dataset context. This keeps the prompt
+        prefix byte-identical across turns.
+
         Args:
             active_skills: list of enabled skill names
             fo_context: FiftyOne dataset context string
@@ -397,7 +1024,28 @@ class SkillsLoader:
         Returns:
             the system prompt string
         """
-        base = (
+        base = self._build_base_prompt(active_skills or [])
+
+        if fo_context:
+            base += "\n## Current FiftyOne Context\n%s\n" % fo_context
+
+        return base
+
+    def _build_base_prompt(self, active_skills):
+        skills = []
+        for skill_name in active_skills:
+            content = self._load_one(skill_name)
+            if content is not None:
+                skills.append((skill_name, content))
+
+        key = tuple(skills)
+        with self._prompt_cache_lock:
+            base = self._prompt_cache.get(key, None)
+            if base is not None:
+                self._prompt_cache.move_to_end(key)
+                return base
+
+        parts = [
             "You are a production-grade AI agent embedded in the FiftyOne "
             "computer vision platform. You have access to FiftyOne tools via "
             "MCP and can help users explore datasets, run models, manage "
@@ -410,31 +1058,114 @@ class SkillsLoader:
             "- Present results in a clear, structured format using markdown\n"
             "- For bulk modifications, summarize what will change and confirm "
             "with the user\n"
-        )
+        ]
 
-        if fo_context:
-            base += "\n## Current FiftyOne Context\n%s\n" % fo_context
+        if skills:
+            parts.append("\n## Active Skills\n")
+            parts.append(
+                "You have the following specialized skills available:\n"
+            )
+            for skill_name, content in skills:
+                parts.append("\n## Skill: %s\n" % skill_name)
+                parts.append(content)
+                parts.append("\n")
 
-        if active_skills:
-            all_skills = self.load_all()
-            skill_sections = []
-            for skill_name in active_skills:
-                if skill_name in all_skills:
-                    skill_sections.append(
-                        "\n## Skill: %s\n%s\n"
-                        % (skill_name, all_skills[skill_name])
-                    )
+        base = "".join(parts)
 
-            if skill_sections:
-                base += "\n## Active Skills\n"
-                base += (
-                    "You have the following specialized skills available:\n"
-                )
-                base += "".join(skill_sections)
+        with self._prompt_cache_lock:
+            self._prompt_cache[key] = base
+            while len(self._prompt_cache) > self.PROMPT_CACHE_SIZE:
+                self._prompt_cache.popitem(last=False)
 
         return base
 
 
+def _get_skills_loader(skills_dir):
+    """Get the shared :class:`SkillsLoader` for a skills directory.
+
+    Loaders cache skill contents and rendered prompts, so a single instance
+    is shared by all operators for each directory.
+
+    Args:
+        skills_dir: the skills directory path string
+
+    Returns:
+        a :class:`SkillsLoader`
+    """
+    with _skills_loaders_lock:
+        skills_loader = _skills_loaders.get(skills_dir, None)
+        if skills_loader is None:
+            skills_loader = SkillsLoader(skills_dir=skills_dir)
+            _skills_loaders[skills_dir] = skills_loader
+
+    return skills_loader
+
+
+
+
+def _get_client(api_key):
+    """Return a cached Anthropic client for the given API key.
+
+    Reusing the client keeps its underlying HTTP connection pool alive, so
+    subsequent requests skip the TCP and TLS handshakes. The pool limits
+    can be tuned via the ``ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS``,
+    ``ANTHROPIC_MAX_CONNECTIONS``, and ``ANTHROPIC_KEEPALIVE_EXPIRY``
+    environment variables.
+
+    Args:
+        api_key: the Anthropic API key
+
+    Returns:
+        an ``anthropic.Anthropic`` client instance
+    """
+    with _client_cache_lock:
+        client = _client_cache.get(api_key)
+        if client is None:
+            http_client = anthropic.DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                )
+            )
+            client = anthropic.Anthropic(
+                api_key=api_key, http_client=http_client
+            )
+            _client_cache[api_key] = client
+
+    return client
+
+
+def _warmup_client(api_key):
+    """Open a pooled connection to the Anthropic API in the background.
+
+    Issues a cheap models listing request so that the first message sent
+    from the panel does not pay the TCP and TLS handshake. All errors are
+    ignored.
+
+    Args:
+        api_key: the Anthropic API key
+    """
+
+    def _warmup():
+        try:
+            _get_client(api_key).models.list(limit=1)
+        except Exception as e:
+            logger.debug("Anthropic connection warm-up failed: %s", e)
+
+    threading.Thread(target=_warmup, daemon=True).start()
+
+
+@atexit.register
+def _close_clients():
+    with _client_cache_lock:
+        for client in _client_cache.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+
+        _client_cache.clear()
 
 
 def _get_api_key(ctx):
@@ -477,6 +1208,15 @@ def _get_skills_dir(ctx):
 def _build_fo_context(ctx):
     """Build a FiftyOne dataset context string for the system prompt.
 
+    The field summary is cached per dataset, using the dataset's media type
+    and last modification time as a version token, so repeated messages
+    against an unchanged dataset skip the schema query. If the modification
+    time is unavailable, cached summaries expire after ``_FO_CONTEXT_TTL``
+    seconds.
+
+    The sample count is always computed afresh, since adding or deleting
+    samples does not update the dataset's modification time.
+
     Args:
         ctx: the operator execution context
 
@@ -488,27 +1228,179 @@ def _build_fo_context(ctx):
 
     try:
         ds = ctx.dataset
+        last_modified_at = getattr(ds, "last_modified_at", None)
+        if last_modified_at is None:
+            # No modification timestamp to validate against, so fall back
+            # to a short TTL
+            last_modified_at = int(time.monotonic() // _FO_CONTEXT_TTL)
+
         context = (
             "Dataset: '%s'\nSamples: %d\nMedia type: %s"
             % (ds.name, len(ds), ds.media_type)
         )
-        fields = list(ds.get_field_schema().keys())
-        if fields:
-            context += "\nFields: %s" % ", ".join(fields[:20])
-        return context
+
+        version = (ds.media_type, last_modified_at)
+        with _fo_context_cache_lock:
+            entry = _fo_context_cache.get(ds.name, None)
+            if entry is not None and entry[0] == version:
+                _fo_context_cache.move_to_end(ds.name)
+                return context + entry[1]
+
+        fields = ""
+        schema = ds.get_field_schema()
+        if schema:
+            top = list(itertools.islice(schema, _MAX_CONTEXT_FIELDS))
+            fields = "\nFields (%d total): %s" % (len(schema), ", ".join(top))
+            num_extra = len(schema) - len(top)
+            if num_extra > 0:
+                fields += ", ... (+%d more)" % num_extra
+
+        with _fo_context_cache_lock:
+            _fo_context_cache[ds.name] = (version, fields)
+            _fo_context_cache.move_to_end(ds.name)
+            while len(_fo_context_cache) > _FO_CONTEXT_CACHE_SIZE:
+                _fo_context_cache.popitem(last=False)
+
+        return context + fields
     except Exception:
         return "Dataset context unavailable."
 
 
+def _trim_history(messages, max_turns=_MAX_HISTORY_TURNS):
+    """Keep only the most recent turns of a conversation.
+
+    The window always starts on a user message so that the conversation
+    sent to Claude keeps a valid role alternation.
+
+    Args:
+        messages: list of ``{"role", "content"}`` message dicts
+        max_turns (_MAX_HISTORY_TURNS): the maximum number of user/assistant
+            turn pairs to keep
+
+    Returns:
+        the trimmed list of messages
+    """
+    if len(messages) <= 2 * max_turns:
+        return messages
+
+    messages = messages[-2 * max_turns :]
+    start = 0
+    while start < len(messages) and messages[start].get("role") != "user":
+        start += 1
+
+    return messages[start:]
+
+
+def _truncate_history_by_tokens(history, budget=_SAVED_HISTORY_TOKEN_BUDGET):
+    """Keep the most recent messages that fit within a token budget.
+
+    Tokens are approximated as one per four characters of content. The most
+    recent message is always kept, even if it alone exceeds the budget.
+
+    Args:
+        history: list of ``{"role", "content"}`` message dicts
+        budget (_SAVED_HISTORY_TOKEN_BUDGET): the approximate maximum number
+            of tokens to keep
+
+    Returns:
+        the truncated list of messages
+    """
+    used = 0
+    start = len(history)
+    while start > 0:
+        content = history[start - 1].get("content") or ""
+        if not isinstance(content, str):
+            content = _dumps(content)
+
+        used += len(content) // 4
+        if used > budget and start < len(history):
+            break
+
+        start -= 1
+
+    return history[start:]
+
+
+def _store_save_changed(ctx, store, values):
+    """Write the values that changed since they were last saved.
+
+    The panel saves its whole config after every turn, so a hash of the
+    last value this process wrote to each field is kept and unchanged
+    values are not rewritten. The remaining values are written in a single
+    batch.
+
+    Hashes are keyed by the ID of the dataset that the store is scoped to,
+    so a recreated dataset starts afresh, and expire after
+    ``_LAST_SAVED_TTL`` seconds, so that writes made by other workers or a
+    store cleanup are not masked for long.
+
+    Args:
+        ctx: the operator execution context
+        store: the plugin store
+        values: a dict mapping store keys to JSON-serializable values
+
+    Returns:
+        the list of keys that were written
+    """
+    dataset = ctx.dataset
+    dataset_id = dataset._doc.id if dataset is not None else None
+    now = time.monotonic()
+    digests = {
+        key: hash(_dumps(value, sort_keys=True))
+        for key, value in values.items()
+    }
+
+    with _last_saved_hash_lock:
+        for key, digest in list(digests.items()):
+            entry = _last_saved_hash.get((dataset_id, key), None)
+            if (
+                entry is not None
+                and entry[0] == digest
+                and now - entry[1] < _LAST_SAVED_TTL
+            ):
+                del digests[key]
+
+    _store_set_many(store, {key: values[key] for key in digests})
+
+    with _last_saved_hash_lock:
+        for key, digest in digests.items():
+            _last_saved_hash[(dataset_id, key)] = (digest, now)
+
+    return list(digests)
+
+
+def _store_set_many(store, values):
+    """Write several values to a plugin store.
+
+    Uses the store's ``set_many()`` method when it provides one, so that all
+    values are written in one round-trip, and otherwise falls back to
+    setting each key in turn.
+
+    Args:
+        store: the plugin store
+        values: a dict mapping store keys to values
+    """
+    if not values:
+        return
+
+    set_many = getattr(store, "set_many", None)
+    if set_many is not None:
+        set_many(values)
+        return
+
+    for key, value in values.items():
+        store.set(key, value)
+
+
 def _get_mcp_manager(mcp_config):
-    """Create an MCPClientManager from a config dict.
+    """Get the pooled MCPClientManager for a config dict.
 
     Defaults to the ``fiftyone-mcp`` command installed by the
     ``fiftyone-mcp-server`` package (``pip install fiftyone-mcp-server``).
 
     Args:
-        mcp_config: dict with optional ``command``, ``args``, and
-            ``enabled`` keys
+        mcp_config: dict with optional ``command``, ``args``,
+            ``enabled``, and ``cacheable_tools`` keys
 
     Returns:
         an :class:`MCPClientManager`, or ``None`` if disabled
@@ -522,37 +1414,107 @@ def _get_mcp_manager(mcp_config):
 
     command = mcp_config.get("command", "fiftyone-mcp")
     args = mcp_config.get("args", [])
+    cacheable_tools = mcp_config.get("cacheable_tools", None)
+
+    # Managers hold a persistent server session, so they are pooled for the
+    # lifetime of the process. Concurrent first calls for the same server
+    # wait on a single connect rather than each spawning a subprocess
+    key = (command, tuple(args))
+    with _mcp_managers_lock:
+        mcp_manager = _mcp_managers.get(key, None)
+        if mcp_manager is not None:
+            if cacheable_tools is not None:
+                mcp_manager.cacheable_tools = frozenset(cacheable_tools)
+
+            return mcp_manager
+
+        future = _mcp_connecting.get(key, None)
+        is_owner = future is None
+        if is_owner:
+            future = concurrent.futures.Future()
+            _mcp_connecting[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    # Waiters block on the future, so it must be resolved, and the key
+    # released, however this fails
+    try:
+        mcp_manager = MCPClientManager(
+            command=command, args=args, cacheable_tools=cacheable_tools
+        )
+        try:
+            mcp_manager.connect()
+        except Exception as e:
+            logger.warning(
+                "Failed to connect to MCP server '%s': %s", command, e
+            )
+
+        with _mcp_managers_lock:
+            _mcp_managers[key] = mcp_manager
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(mcp_manager)
+    finally:
+        with _mcp_managers_lock:
+            _mcp_connecting.pop(key, None)
+
+    return mcp_manager
 
-    return MCPClientManager(command=command, args=args)
 
+@atexit.register
+def shutdown_all():
+    """Close all pooled MCP server sessions."""
+    with _mcp_managers_lock:
+        mcp_managers = list(_mcp_managers.values())
+        _mcp_managers.clear()
 
-def _serialize_content_blocks(content_blocks):
-    """Convert Anthropic SDK content blocks to serializable dicts.
+    for mcp_manager in mcp_managers:
+        mcp_manager.close()
+
+
+def _chunk_trigger(ctx, chunks, message_id):
+    """Join the buffered text deltas into one ``stream_chunk`` trigger.
+
+    The buffer is cleared in place.
 
     Args:
-        content_blocks: list of Anthropic content block objects
+        ctx: the operator execution context
+        chunks: the list of buffered text deltas
+        message_id: the ID of the message being streamed
 
     Returns:
-        list of plain dicts suitable for JSON serialization
+        the trigger
     """
-    result = []
-    for block in content_blocks:
-        if not hasattr(block, "type"):
-            continue
-
-        if block.type == "text":
-            result.append({"type": "text", "text": block.text})
-        elif block.type == "tool_use":
-            result.append(
-                {
-                    "type": "tool_use",
-                    "id": block.id,
-                    "name": block.name,
-                    "input": block.input,
-                }
-            )
+    delta = "".join(chunks)
+    chunks.clear()
+    return ctx.trigger(
+        _TRIG_STREAM_CHUNK, {"delta": delta, "message_id": message_id}
+    )
+
+
+def _tool_result_message(tool_id, content):
+    """Build the user message that returns a single tool result to Claude.
+
+    Args:
+        tool_id: the ID of the ``tool_use`` block being answered
+        content: the tool result string
 
-    return result
+    Returns:
+        a message dict
+    """
+    return {
+        "role": "user",
+        "content": [
+            {
+                "type": "tool_result",
+                "tool_use_id": tool_id,
+                "content": content,
+            }
+        ],
+    }
 
 
 def _run_streaming_loop(
@@ -594,14 +1556,32 @@ def _run_streaming_loop(
     max_retries = 3
     retry_delays = [1, 2, 4]
 
+    # Mark the system prompt (and therefore the tool definitions before it)
+    # as cacheable so follow-up requests only pay for new conversation turns
+    system = [
+        {
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
     for _ in range(max_tool_loops):
-        final_message = None
+        content_blocks = None
+        stop_reason = None
         for attempt in range(max_retries):
+            # Assistant content is assembled from the stream events as they
+            # arrive, keyed by content block index
+            blocks = {}
+            json_bufs = {}
+            chunks = []
+            chunks_len = 0
+            last_flush = time.monotonic()
             try:
                 with client.messages.stream(
                     model=model,
                     max_tokens=max_tokens,
-                    system=system_prompt,
+                    system=system,
                     messages=messages,
                     tools=tools if tools else [],
                 ) as stream:
@@ -610,9 +1590,27 @@ def _run_streaming_loop(
 
                         if event_type == "content_block_start":
                             cb = getattr(event, "content_block", None)
-                            if cb and getattr(cb, "type", None) == "tool_use":
+                            cb_type = getattr(cb, "type", None)
+                            if cb_type == "text":
+                                blocks[event.index] = {
+                                    "type": "text",
+                                    "text": [cb.text] if cb.text else [],
+                                }
+                            elif cb_type == "tool_use":
+                                blocks[event.index] = {
+                                    "type": "tool_use",
+                                    "id": cb.id,
+                                    "name": cb.name,
+                                    "input": {},
+                                }
+                                json_bufs[event.index] = []
+                                if chunks:
+                                    yield _chunk_trigger(
+                                        ctx, chunks, message_id
+                                    )
+                                    chunks_len = 0
                                 yield ctx.trigger(
-                                    "%s/tool_call_start" % PLUGIN_NAME,
+                                    _TRIG_TOOL_CALL_START,
                                     {
                                         "tool_id": cb.id,
                                         "tool_name": cb.name,
@@ -623,19 +1621,56 @@ def _run_streaming_loop(
                         elif event_type == "content_block_delta":
                             delta = getattr(event, "delta", None)
                             delta_type = getattr(delta, "type", None)
+                            block = blocks.get(event.index, None)
                             if delta and delta_type == "text_delta":
-                                yield ctx.trigger(
-                                    "%s/stream_chunk" % PLUGIN_NAME,
-                                    {
-                                        "delta": delta.text,
-                                        "message_id": message_id,
-                                    },
-                                )
+                                if block is not None:
+                                    block["text"].append(delta.text)
+
+                                chunks.append(delta.text)
+                                chunks_len += len(delta.text)
+                                now = time.monotonic()
+                                elapsed = now - last_flush
+                                if (
+                                    chunks_len >= _STREAM_FLUSH_CHARS
+                                    or elapsed >= _STREAM_FLUSH_INTERVAL
+                                ):
+                                    yield _chunk_trigger(
+                                        ctx, chunks, message_id
+                                    )
+                                    chunks_len = 0
+                                    last_flush = now
+                            elif delta and delta_type == "input_json_delta":
+                                if event.index in json_bufs:
+                                    json_bufs[event.index].append(
+                                        delta.partial_json
+                                    )
+
+                        elif event_type == "content_block_stop":
+                            if chunks:
+                                yield _chunk_trigger(ctx, chunks, message_id)
+                                chunks_len = 0
+                            block = blocks.get(event.index, None)
+                            if block is not None and block["type"] == "text":
+                                block["text"] = "".join(block["text"])
+                            elif event.index in json_bufs:
+                                partial_json = "".join(json_bufs[event.index])
+                                if partial_json:
+                                    block["input"] = _loads(partial_json)
+
+                        elif event_type == "message_delta":
+                            delta = getattr(event, "delta", None)
+                            stop_reason = getattr(delta, "stop_reason", None)
 
-                    final_message = stream.get_final_message()
+                    if chunks:
+                        yield _chunk_trigger(ctx, chunks, message_id)
+
+                    content_blocks = [blocks[i] for i in sorted(blocks)]
                     break
 
             except Exception as e:
+                if chunks:
+                    yield _chunk_trigger(ctx, chunks, message_id)
+
                 status = getattr(e, "status_code", None)
                 is_overloaded = status == 529 or "overloaded" in str(e).lower()
                 is_last_attempt = attempt == max_retries - 1
@@ -653,7 +1688,7 @@ def _run_streaming_loop(
                         "\n\n_API busy, retrying in %ds…_" % delay
                     )
                     yield ctx.trigger(
-                        "%s/stream_chunk" % PLUGIN_NAME,
+                        _TRIG_STREAM_CHUNK,
                         {
                             "delta": retry_msg,
                             "message_id": message_id,
@@ -670,37 +1705,37 @@ def _run_streaming_loop(
                     else str(e)
                 )
                 yield ctx.trigger(
-                    "%s/stream_error" % PLUGIN_NAME,
+                    _TRIG_STREAM_ERROR,
                     {"error": error_msg, "message_id": message_id},
                 )
                 return
 
-        if final_message is None:
+        if content_blocks is None:
             return
 
-        stop_reason = getattr(final_message, "stop_reason", "end_turn")
         if stop_reason != "tool_use":
             break
 
-        content_dicts = _serialize_content_blocks(final_message.content)
-        messages.append({"role": "assistant", "content": content_dicts})
+        messages.append({"role": "assistant", "content": content_blocks})
 
-        tool_results = []
-        pause_for_confirmation = False
+        tool_ids = []
+        tool_results = {}
+        tool_futures = {}
+        confirmation = None
 
-        for block in final_message.content:
-            if getattr(block, "type", None) != "tool_use":
+        for block in content_blocks:
+            if block["type"] != "tool_use":
                 continue
 
-            tool_name = block.name
-            tool_input = block.input or {}
-            tool_id = block.id
+            tool_name = block["name"]
+            tool_input = block["input"] or {}
+            tool_id = block["id"]
             decision = guardrail.check(tool_name, tool_input)
 
             if decision == "block":
                 reason = guardrail.get_block_reason(tool_name, tool_input)
                 yield ctx.trigger(
-                    "%s/tool_blocked" % PLUGIN_NAME,
+                    _TRIG_TOOL_BLOCKED,
                     {
                         "tool_id": tool_id,
                         "tool_name": tool_name,
@@ -708,14 +1743,13 @@ def _run_streaming_loop(
                         "message_id": message_id,
                     },
                 )
-                tool_results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": "Blocked: %s" % reason,
-                        "is_error": True,
-                    }
-                )
+                tool_ids.append(tool_id)
+                tool_results[tool_id] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": "Blocked: %s" % reason,
+                    "is_error": True,
+                }
 
             elif decision == "confirm":
                 risk = guardrail.get_risk_level(tool_name, tool_input)
@@ -723,91 +1757,89 @@ def _run_streaming_loop(
                     tool_name, tool_input
                 )
                 pending_id = str(uuid.uuid4())
-                _pending_operations[pending_id] = {
-                    "messages": messages,
+                _pending_operations[pending_id] = PendingOp(
+                    messages=messages,
+                    tool_id=tool_id,
+                    tool_name=tool_name,
+                    tool_input=tool_input,
+                    message_id=message_id,
+                    system_prompt=system_prompt,
+                    tools=tools,
+                    model=model,
+                    max_tokens=max_tokens,
+                    mcp_manager=mcp_manager,
+                )
+                confirmation = {
+                    "pending_id": pending_id,
                     "tool_id": tool_id,
                     "tool_name": tool_name,
                     "tool_input": tool_input,
+                    "risk": risk,
+                    "human_description": human_desc,
                     "message_id": message_id,
-                    "system_prompt": system_prompt,
-                    "tools": tools,
-                    "model": model,
-                    "max_tokens": max_tokens,
-                    "mcp_manager": mcp_manager,
                 }
+                break  # Stop processing further tools in this batch
+
+            else:  # allow
+                tool_ids.append(tool_id)
+                if mcp_manager:
+                    # Allowed tools are independent, so run them concurrently
+                    future = _tool_executor.submit(
+                        mcp_manager.call_tool, tool_name, tool_input
+                    )
+                    tool_futures[future] = (tool_id, tool_name)
+                else:
+                    tool_results[tool_id] = {
+                        "type": "tool_result",
+                        "tool_use_id": tool_id,
+                        "content": (
+                            "MCP server not connected. Configure an MCP "
+                            "server in Settings."
+                        ),
+                        "is_error": True,
+                    }
+
+        for future in concurrent.futures.as_completed(tool_futures):
+            tool_id, tool_name = tool_futures[future]
+            try:
+                tool_result = future.result()
                 yield ctx.trigger(
-                    "%s/confirmation_required" % PLUGIN_NAME,
+                    _TRIG_TOOL_RESULT,
                     {
-                        "pending_id": pending_id,
                         "tool_id": tool_id,
                         "tool_name": tool_name,
-                        "tool_input": tool_input,
-                        "risk": risk,
-                        "human_description": human_desc,
+                        "result": tool_result[:2000],
                         "message_id": message_id,
                     },
                 )
-                pause_for_confirmation = True
-                break  # Stop processing further tools in this batch
-
-            else:  # allow
-                if mcp_manager:
-                    try:
-                        tool_result = mcp_manager.call_tool(
-                            tool_name, tool_input
-                        )
-                        preview = (
-                            tool_result[:2000]
-                            if len(tool_result) > 2000
-                            else tool_result
-                        )
-                        yield ctx.trigger(
-                            "%s/tool_result" % PLUGIN_NAME,
-                            {
-                                "tool_id": tool_id,
-                                "tool_name": tool_name,
-                                "result": preview,
-                                "message_id": message_id,
-                            },
-                        )
-                        tool_results.append(
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tool_id,
-                                "content": tool_result,
-                            }
-                        )
-                    except Exception as e:
-                        logger.warning("Tool %s error: %s", tool_name, e)
-                        tool_results.append(
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tool_id,
-                                "content": "Error: %s" % str(e),
-                                "is_error": True,
-                            }
-                        )
-                else:
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": tool_id,
-                            "content": (
-                                "MCP server not connected. Configure an MCP "
-                                "server in Settings."
-                            ),
-                            "is_error": True,
-                        }
-                    )
+                tool_results[tool_id] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": tool_result,
+                }
+            except Exception as e:
+                logger.warning("Tool %s error: %s", tool_name, e)
+                tool_results[tool_id] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": "Error: %s" % str(e),
+                    "is_error": True,
+                }
 
-        if pause_for_confirmation:
+        if confirmation is not None:
+            yield ctx.trigger(_TRIG_CONFIRMATION, confirmation)
             return  # Resumed later by ConfirmOperation
 
         if tool_results:
-            messages.append({"role": "user", "content": tool_results})
+            messages.append(
+                {
+                    "role": "user",
+                    "content": [tool_results[i] for i in tool_ids],
+                }
+            )
 
     yield ctx.trigger(
-        "%s/stream_complete" % PLUGIN_NAME,
+        _TRIG_STREAM_COMPLETE,
         {"message_id": message_id},
     )
 
@@ -858,56 +1890,68 @@ class SendMessage(foo.Operator):
         if not api_key:
             message_id = str(uuid.uuid4())
             yield ctx.trigger(
-                "%s/stream_message_start" % PLUGIN_NAME,
+                _TRIG_MESSAGE_START,
                 {"message_id": message_id},
             )
             yield ctx.trigger(
-                "%s/stream_chunk" % PLUGIN_NAME,
+                _TRIG_STREAM_ERROR,
                 {
-                    "delta": (
-                        "Error: No API key configured. "
+                    "error": (
+                        "No API key configured. "
                         "Set ANTHROPIC_API_KEY in your environment."
                     ),
                     "message_id": message_id,
                 },
             )
-            yield ctx.trigger(
-                "%s/stream_complete" % PLUGIN_NAME,
-                {"message_id": message_id},
-            )
             return
 
-        fo_context = _build_fo_context(ctx)
-        skills_loader = SkillsLoader(skills_dir=_get_skills_dir(ctx))
-        system_prompt = skills_loader.build_system_prompt(
-            active_skills, fo_context
-        )
-
-        mcp_manager = _get_mcp_manager(mcp_config)
-        tools = mcp_manager.list_tools() if mcp_manager else []
-
-        messages = []
-        for msg in history:
-            role = msg.get("role")
-            content = msg.get("content")
-            if role in ("user", "assistant") and content is not None:
-                messages.append({"role": role, "content": content})
-
-        messages.append({"role": "user", "content": message})
-
+        # Open the assistant bubble before the slow setup below (dataset
+        # context, skills, MCP tool discovery) so the user sees feedback
+        # immediately
         message_id = str(uuid.uuid4())
         yield ctx.trigger(
-            "%s/stream_message_start" % PLUGIN_NAME,
+            _TRIG_MESSAGE_START,
             {"message_id": message_id, "role": "assistant"},
         )
 
-        client = anthropic.Anthropic(api_key=api_key)
-        guardrail = GuardrailLayer()
+        # The bubble is already streaming, so any setup failure must be
+        # reported to it, otherwise the panel stays locked
+        try:
+            fo_context = _build_fo_context(ctx)
+            skills_loader = _get_skills_loader(_get_skills_dir(ctx))
+            system_prompt = skills_loader.build_system_prompt(
+                active_skills, fo_context
+            )
+
+            mcp_manager = _get_mcp_manager(mcp_config)
+            tools = mcp_manager.list_tools() if mcp_manager else []
+
+            # The panel already sends ``{"role", "content"}`` dicts, so valid
+            # entries are passed through as-is rather than rebuilt. Empty
+            # turns (e.g. an assistant reply that failed before producing any
+            # text) are dropped since the API rejects empty content
+            messages = [
+                msg
+                for msg in history
+                if msg.get("role") in _VALID_ROLES and msg.get("content")
+            ]
+            messages = _trim_history(messages)
+
+            messages.append({"role": "user", "content": message})
+
+            client = _get_client(api_key)
+        except Exception as e:
+            logger.error("SendMessage setup error: %s", e)
+            yield ctx.trigger(
+                _TRIG_STREAM_ERROR,
+                {"error": str(e), "message_id": message_id},
+            )
+            return
 
         yield from _run_streaming_loop(
             ctx=ctx,
             client=client,
-            guardrail=guardrail,
+            guardrail=_guardrail,
             mcp_manager=mcp_manager,
             messages=messages,
             system_prompt=system_prompt,
@@ -948,18 +1992,30 @@ class ConfirmOperation(foo.Operator):
             logger.warning(
                 "No pending operation found for id: %s", pending_id
             )
+
+            # The message is still streaming while it waits for this
+            # confirmation, so it must be closed or the panel stays locked
+            message_id = _pending_operations.pop_evicted(pending_id)
+            if message_id is not None:
+                yield ctx.trigger(
+                    _TRIG_STREAM_ERROR,
+                    {
+                        "error": (
+                            "This operation expired before it was "
+                            "confirmed. Please send your request again."
+                        ),
+                        "message_id": message_id,
+                    },
+                )
+
             return
 
-        mcp_manager = pending.get("mcp_manager")
-        tool_name = pending["tool_name"]
-        tool_input = pending["tool_input"]
-        tool_id = pending["tool_id"]
-        message_id = pending["message_id"]
-        messages = pending["messages"]
-        system_prompt = pending["system_prompt"]
-        tools = pending["tools"]
-        model = pending["model"]
-        max_tokens = pending["max_tokens"]
+        mcp_manager = pending.mcp_manager
+        tool_name = pending.tool_name
+        tool_input = pending.tool_input
+        tool_id = pending.tool_id
+        message_id = pending.message_id
+        messages = pending.messages
 
         if mcp_manager:
             try:
@@ -969,54 +2025,39 @@ class ConfirmOperation(foo.Operator):
         else:
             tool_result = "MCP server not connected."
 
-        preview = (
-            tool_result[:2000] if len(tool_result) > 2000 else tool_result
-        )
         yield ctx.trigger(
-            "%s/tool_result" % PLUGIN_NAME,
+            _TRIG_TOOL_RESULT,
             {
                 "tool_id": tool_id,
                 "tool_name": tool_name,
-                "result": preview,
+                "result": tool_result[:2000],
                 "message_id": message_id,
                 "confirmed": True,
             },
         )
 
-        messages.append(
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": tool_result,
-                    }
-                ],
-            }
-        )
+        messages.append(_tool_result_message(tool_id, tool_result))
 
         api_key = _get_api_key(ctx)
         if not api_key:
             yield ctx.trigger(
-                "%s/stream_complete" % PLUGIN_NAME,
+                _TRIG_STREAM_COMPLETE,
                 {"message_id": message_id},
             )
             return
 
-        client = anthropic.Anthropic(api_key=api_key)
-        guardrail = GuardrailLayer()
+        client = _get_client(api_key)
 
         yield from _run_streaming_loop(
             ctx=ctx,
             client=client,
-            guardrail=guardrail,
+            guardrail=_guardrail,
             mcp_manager=mcp_manager,
             messages=messages,
-            system_prompt=system_prompt,
-            tools=tools,
-            model=model,
-            max_tokens=max_tokens,
+            system_prompt=pending.system_prompt,
+            tools=pending.tools,
+            model=pending.model,
+            max_tokens=pending.max_tokens,
             message_id=message_id,
         )
 
@@ -1047,7 +2088,7 @@ class CancelOperation(foo.Operator):
         if not pending:
             return {"cancelled": False, "error": "No pending operation found."}
 
-        return {"cancelled": True, "message_id": pending.get("message_id", "")}
+        return {"cancelled": True, "message_id": pending.message_id}
 
 
 class LoadConfig(foo.Operator):
@@ -1067,27 +2108,50 @@ class LoadConfig(foo.Operator):
         )
 
     def execute(self, ctx):
+        api_key = _get_api_key(ctx)
+        if api_key:
+            _warmup_client(api_key)
+
+        # The panel may request its config several times at once (e.g. from
+        # multiple tabs), so concurrent loads of the same config share one
+        # read of the store and skills directory
+        skills_dir = _get_skills_dir(ctx)
+        key = (ctx.dataset_name, skills_dir)
+        with _load_inflight_lock:
+            future = _load_inflight.get(key, None)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                _load_inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = self._load(ctx, skills_dir)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with _load_inflight_lock:
+                _load_inflight.pop(key, None)
+
+        return result
+
+    def _load(self, ctx, skills_dir):
         try:
             store = ctx.store("claude_agent")
             history = store.get("conversation_history") or []
             mcp_servers = store.get("mcp_servers") or [
-                {
-                    "command": "fiftyone-mcp",
-                    "args": [],
-                    "enabled": True,
-                    "label": "fiftyone-mcp-server",
-                }
+                dict(server) for server in _DEFAULT_MCP_SERVERS
             ]
             active_skills = store.get("active_skills") or []
-            settings = store.get("settings") or {
-                "model": DEFAULT_MODEL,
-                "max_tokens": MAX_TOKENS,
-                "permission_mode": "auto",
-                "persist_history": True,
-            }
+            settings = store.get("settings") or dict(_DEFAULT_SETTINGS)
 
-            skills_loader = SkillsLoader(skills_dir=_get_skills_dir(ctx))
-            available_skills = list(skills_loader.load_all().keys())
+            skills_loader = _get_skills_loader(skills_dir)
+            available_skills = skills_loader.names()
 
             return {
                 "history": history,
@@ -1096,18 +2160,18 @@ class LoadConfig(foo.Operator):
                 "settings": settings,
                 "available_skills": available_skills,
             }
-        except Exception as e:
+        except (
+            pymongo.errors.PyMongoError,
+            OSError,
+            TypeError,
+            ValueError,
+        ) as e:
             logger.warning("LoadConfig error: %s", e)
             return {
                 "history": [],
                 "mcp_servers": [],
                 "active_skills": [],
-                "settings": {
-                    "model": DEFAULT_MODEL,
-                    "max_tokens": MAX_TOKENS,
-                    "permission_mode": "auto",
-                    "persist_history": True,
-                },
+                "settings": dict(_DEFAULT_SETTINGS),
                 "available_skills": [],
             }
 
@@ -1136,24 +2200,39 @@ class SaveConfig(foo.Operator):
         return types.Property(inputs)
 
     def execute(self, ctx):
+        mcp_servers = ctx.params.get("mcp_servers")
+        active_skills = ctx.params.get("active_skills")
+        settings = ctx.params.get("settings")
+        history = ctx.params.get("history")
+
+        if all(
+            v is None for v in (mcp_servers, active_skills, settings, history)
+        ):
+            return {"saved": True}
+
         try:
             store = ctx.store("claude_agent")
-            mcp_servers = ctx.params.get("mcp_servers")
-            active_skills = ctx.params.get("active_skills")
-            settings = ctx.params.get("settings")
-            history = ctx.params.get("history")
-
+            values = {}
             if mcp_servers is not None:
-                store.set("mcp_servers", mcp_servers)
+                values["mcp_servers"] = mcp_servers
             if active_skills is not None:
-                store.set("active_skills", active_skills)
+                values["active_skills"] = active_skills
             if settings is not None:
-                store.set("settings", settings)
+                values["settings"] = settings
             if history is not None:
-                store.set("conversation_history", history[-100:])
+                values["conversation_history"] = _truncate_history_by_tokens(
+                    history
+                )
+
+            _store_save_changed(ctx, store, values)
 
             return {"saved": True}
-        except Exception as e:
+        except (
+            pymongo.errors.PyMongoError,
+            OSError,
+            TypeError,
+            ValueError,
+        ) as e:
             logger.warning("SaveConfig error: %s", e)
             return {"saved": False, "error": str(e)}
 
@@ -1172,9 +2251,14 @@ class ClearHistory(foo.Operator):
     def execute(self, ctx):
         try:
             store = ctx.store("claude_agent")
-            store.set("conversation_history", [])
+            _store_save_changed(ctx, store, {"conversation_history": []})
             return {"cleared": True}
-        except Exception as e:
+        except (
+            pymongo.errors.PyMongoError,
+            OSError,
+            TypeError,
+            ValueError,
+        ) as e:
             logger.warning("ClearHistory error: %s", e)
             return {"cleared": False, "error": str(e)}
 
@@ -65,7 +65,7 @@ const theme2 = createTheme({ palette: {
 } });`);return El(h,"light",C,r),El(h,"dark",T,r),h.contrastText||(h.contrastText=c(h.main)),h},p={dark:Ii,light:Cl};return p[t]||console.error(`MUI: The palette mode \`${t}\` is not supported.`),st(ae({common:ae({},$n),mode:t,primary:d({color:o,name:"primary"}),secondary:d({color:a,name:"secondary",mainShade:"A400",lightShade:"A200",darkShade:"A700"}),error:d({color:l,name:"error"}),warning:d({color:f,name:"warning"}),info:d({color:s,name:"info"}),success:d({color:u,name:"success"}),grey:oh,contrastThreshold:n,getContrastText:c,augmentColor:d,tonalOffset:r},p[t]),i)}const hh=["fontFamily","fontSize","fontWeightLight","fontWeightRegular","fontWeightMedium","fontWeightBold","htmlFontSize","allVariants","pxToRem"];function mh(e){return Math.round(e*1e5)/1e5}const Tl={textTransform:"uppercase"},Rl='"Roboto", "Helvetica", "Arial", sans-serif';function gh(e,t){const n=typeof t=="function"?t(e):t,{fontFamily:r=Rl,fontSize:i=14,fontWeightLight:o=300,fontWeightRegular:a=400,fontWeightMedium:l=500,fontWeightBold:s=700,htmlFontSize:u=16,allVariants:f,pxToRem:c}=n,d=St(n,hh);typeof i!="number"&&console.error("MUI: `fontSize` is required to be a number."),typeof u!="number"&&console.error("MUI: `htmlFontSize` is required to be a number.");const p=i/14,m=c||(b=>`${b/u*p}rem`),h=(b,C,T,M,D)=>ae({fontFamily:r,fontWeight:b,fontSize:m(C),lineHeight:T},r===Rl?{letterSpacing:`${mh(M/C)}em`}:{},D,f),k={h1:h(o,96,1.167,-1.5),h2:h(o,60,1.2,-.5),h3:h(a,48,1.167,0),h4:h(a,34,1.235,.25),h5:h(a,24,1.334,0),h6:h(l,20,1.6,.15),subtitle1:h(a,16,1.75,.15),subtitle2:h(l,14,1.57,.1),body1:h(a,16,1.5,.15),body2:h(a,14,1.43,.15),button:h(l,14,1.75,.4,Tl),caption:h(a,12,1.66,.4),overline:h(a,12,2.66,1,Tl),inherit:{fontFamily:"inherit",fontWeight:"inherit",fontSize:"inherit",lineHeight:"inherit",letterSpacing:"inherit"}};return st(ae({htmlFontSize:u,pxToRem:m,fontFamily:r,fontSize:i,fontWeightLight:o,fontWeightRegular:a,fontWeightMedium:l,fontWeightBold:s},k),d,{clone:!1})}const yh=.2,xh=.14,bh=.12;function ye(...e){return[`${e[0]}px ${e[1]}px ${e[2]}px ${e[3]}px rgba(0,0,0,${yh})`,`${e[4]}px ${e[5]}px ${e[6]}px ${e[7]}px rgba(0,0,0,${xh})`,`${e[8]}px ${e[9]}px ${e[10]}px ${e[11]}px rgba(0,0,0,${bh})`].join(",")}const vh=["none",ye(0,2,1,-1,0,1,1,0,0,1,3,0),ye(0,3,1,-2,0,2,2,0,0,1,5,0),ye(0,3,3,-2,0,3,4,0,0,1,8,0),ye(0,2,4,-1,0,4,5,0,0,1,10,0),ye(0,3,5,-1,0,5,8,0,0,1,14,0),ye(0,3,5,-1,0,6,10,0,0,1,18,0),ye(0,4,5,-2,0,7,10,1,0,2,16,1),ye(0,5,5,-3,0,8,10,1,0,3,14,2),ye(0,5,6,-3,0,9,12,1,0,3,16,2),ye(0,6,6,-3,0,10,14,1,0,4,18,3),ye(0,6,7,-4,0,11,15,1,0,4,20,3),ye(0,7,8,-4,0,12,17,2,0,5,22,4),ye(0,7,8,-4,0,13,19,2,0,5,24,4),ye(0,7,9,-4,0,14,21,2,0,5,26,4),ye(0,8,9,-5,0,15,22,2,0,6,28,5),ye(0,8,10,-5,0,16,24,2,0,6,30,5),ye(0,8,11,-5,0,17,26,2,0,6,32,5),ye(0,9,11,-5,0,18,28,2,0,7,34,6),ye(0,9,12,-6,0,19,29,2,0,7,36,6),ye(0,10,13,-6,0,20,31,3,0,8,38,7),ye(0,10,13,-6,0,21,33,3,0,8,40,7),ye(0,10,14,-6,0,22,35,3,0,8,42,7),ye(0,11,14,-7,0,23,36,3,0,9,44,8),ye(0,11,15,-7,0,24,38,3,0,9,46,8)],kh=["duration","easing","delay"],wh={easeInOut:"cubic-bezier(0.4, 0, 0.2, 1)",easeOut:"cubic-bezier(0.0, 0, 0.2, 1)",easeIn:"cubic-bezier(0.4, 0, 1, 1)",sharp:"cubic-bezier(0.4, 0, 0.6, 1)"},Sh={shortest:150,shorter:200,short:250,standard:300,complex:375,enteringScreen:225,leavingScreen:195};function Pl(e){return`${Math.round(e)}ms`}function _h(e){if(!e)return 0;const t=e/36;return Math.round((4+15*t**.25+t/5)*10)}function Ch(e){const t=ae({},wh,e.easing),n=ae({},Sh,e.duration);return ae({getAutoHeightDuration:_h,create:(i=["all"],o={})=>{const{duration:a=n.standard,easing:l=t.easeInOut,delay:s=0}=o,u=St(o,kh);{const f=d=>typeof d=="string",c=d=>!isNaN(parseFloat(d));!f(i)&&!Array.isArray(i)&&console.error('MUI: Argument "props" must be a string or Array.'),!c(a)&&!f(a)&&console.error(`MUI: Argument "duration" must be a number or a string but found ${a}.`),f(l)||console.error('MUI: Argument "easing" must be a string.'),!c(s)&&!f(s)&&console.error('MUI: Argument "delay" must be a number or a string.'),typeof o!="object"&&console.error(["MUI: Secong argument of transition.create must be an object.","Arguments should be either `create('prop1', options)` or `create(['prop1', 'prop2'], options)`"].join(`
 `)),Object.keys(u).length!==0&&console.error(`MUI: Unrecognized argument(s) [${Object.keys(u).join(",")}].`)}return(Array.isArray(i)?i:[i]).map(f=>`${f} ${typeof a=="string"?a:Pl(a)} ${l} ${typeof s=="string"?s:Pl(s)}`).join(",")}},e,{easing:t,duration:n})}const Eh={mobileStepper:1e3,fab:1050,speedDial:1050,appBar:1100,drawer:1200,modal:1300,snackbar:1400,tooltip:1500},Th=["breakpoints","mixins","spacing","palette","transitions","typography","shape"];function Rh(e={},...t){const{mixins:n={},palette:r={},transitions:i={},typography:o={}}=e,a=St(e,Th);if(e.vars&&e.generateCssVars===void 0)throw new Error("MUI: `vars` is a private field used for CSS variables support.\nPlease use another name.");const l=dh(r),s=hl(e);let u=st(s,{mixins:Wd(s.breakpoints,n),palette:l,shadows:vh.slice(),typography:gh(l,o),transitions:Ch(i),zIndex:ae({},Eh)});u=st(u,a),u=t.reduce((f,c)=>st(f,c),u);{const f=["active","checked","completed","disabled","error","expanded","focused","focusVisible","required","selected"],c=(d,p)=>{let m;for(m in d){const h=d[m];if(f.indexOf(m)!==-1&&Object.keys(h).length>0){{const k=ai("",m);console.error([`MUI: The \`${p}\` component increases the CSS specificity of the \`${m}\` internal state.`,"You can not override it like this: ",JSON.stringify(d,null,2),"",`Instead, you need to use the '&.${k}' syntax:`,JSON.stringify({root:{[`&.${k}`]:h}},null,2),"","https://mui.com/r/state-classes-guide"].join(`
 `))}d[m]={}}}};Object.keys(u.components).forEach(d=>{const p=u.components[d].styleOverrides;p&&d.indexOf("Mui")===0&&c(p,d)})}return u.unstable_sxConfig=ae({},jn,a==null?void 0:a.unstable_sxConfig),u.unstable_sx=function(c){return kr({sx:c,theme:this})},u}const Ph=Rh(),Ih="$$material";function Ah(e){return e!=="ownerState"&&e!=="theme"&&e!=="sx"&&e!=="as"}const Oh=Pd({themeId:Ih,defaultTheme:Ph,rootShouldForwardProp:e=>Ah(e)&&e!=="classes"});function jh(e){return ai("MuiSvgIcon",e)}df("MuiSvgIcon",["root","colorPrimary","colorSecondary","colorAction","colorError","colorDisabled","fontSizeInherit","fontSizeSmall","fontSizeMedium","fontSizeLarge"]);const $h=["children","className","color","component","fontSize","htmlColor","inheritViewBox","titleAccess","viewBox"],Il=window.React,Mh=e=>{const{color:t,fontSize:n,classes:r}=e,i={root:["root",t!=="inherit"&&`color${wt(t)}`,`fontSize${wt(n)}`]};return ff(i,jh,r)},zh=Oh("svg",{name:"MuiSvgIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.color!=="inherit"&&t[`color${wt(n.color)}`],t[`fontSize${wt(n.fontSize)}`]]}})(({theme:e,ownerState:t})=>{var n,r,i,o,a,l,s,u,f,c,d,p,m;return{userSelect:"none",width:"1em",height:"1em",display:"inline-block",fill:t.hasSvgAsChild?void 0:"currentColor",flexShrink:0,transition:(n=e.transitions)==null||(r=n.create)==null?void 0:r.call(n,"fill",{duration:(i=e.transitions)==null||(i=i.duration)==null?void 0:i.shorter}),fontSize:{inherit:"inherit",small:((o=e.typography)==null||(a=o.pxToRem)==null?void 0:a.call(o,20))||"1.25rem",medium:((l=e.typography)==null||(s=l.pxToRem)==null?void 0:s.call(l,24))||"1.5rem",large:((u=e.typography)==null||(f=u.pxToRem)==null?void 0:f.call(u,35))||"2.1875rem"}[t.fontSize],color:(c=(d=(e.vars||e).palette)==null||(d=d[t.color])==null?void 0:d.main)!=null?c:{action:(p=(e.vars||e).palette)==null||(p=p.action)==null?void 0:p.active,disabled:(m=(e.vars||e).palette)==null||(m=m.action)==null?void 0:m.disabled,inherit:void 0}[t.color]}}),Tr=Il.forwardRef(function(t,n){const r=kf({props:t,name:"MuiSvgIcon"}),{children:i,className:o,color:a="inherit",component:l="svg",fontSize:s="medium",htmlColor:u,inheritViewBox:f=!1,titleAccess:c,viewBox:d="0 0 24 24"}=r,p=St(r,$h),m=Il.isValidElement(i)&&i.type==="svg",h=ae({},r,{color:a,component:l,fontSize:s,instanceFontSize:t.fontSize,inheritViewBox:f,viewBox:d,hasSvgAsChild:m}),k={};f||(k.viewBox=d);const b=Mh(h);return v.jsxs(zh,ae({as:l,className:gf(b.root,o),focusable:"false",color:u,"aria-hidden":c?void 0:!0,role:c?"img":void 0,ref:n},k,p,m&&i.props,{ownerState:h,children:[m?i.props.children:i,c?v.jsx("title",{children:c}):null]}))});Tr.propTypes={children:X.node,classes:X.object,className:X.string,color:X.oneOfType([X.oneOf(["inherit","action","disabled","primary","secondary","error","info","success","warning"]),X.string]),component:X.elementType,fontSize:X.oneOfType([X.oneOf(["inherit","large","medium","small"]),X.string]),htmlColor:X.string,inheritViewBox:X.bool,shapeRendering:X.string,sx:X.oneOfType([X.arrayOf(X.oneOfType([X.func,X.object,X.bool])),X.func,X.object]),titleAccess:X.string,viewBox:X.string},Tr.muiName="SvgIcon";const Al=window.React;function Dh(e,t){function n(r,i){return v.jsx(Tr,ae({"data-testid":`${t}Icon`,ref:i},r,{children:e}))}return n.displayName=`${t}Icon`,n.muiName=Tr.muiName,Al.memo(Al.forwardRef(n))}const Fh=gt(Object.freeze(Object.defineProperty({__proto__:null,capitalize:wt,createChainedFunction:Uc,createSvgIcon:Dh,debounce:Hc,deprecatedPropType:Wc,isMuiElement:Vc,ownerDocument:ha,ownerWindow:Yc,requirePropFactory:Gc,setRef:ma,unstable_ClassNameGenerator:{configure:e=>{console.warn(["MUI: `ClassNameGenerator` import from `@mui/material/utils` is outdated and might cause unexpected issues.","","You should use `import { unstable_ClassNameGenerator } from '@mui/material/className'` instead","","The detail of the issue: https://github.com/mui/material-ui/issues/30011#issuecomment-1024993401","","The updated documentation: https://mui.com/guides/classname-generator/"].join(`
-`)),Sa.configure(e)}},unstable_useEnhancedEffect:ya,unstable_useId:Xc,unsupportedProp:Jc,useControlled:Qc,useEventCallback:Zc,useForkRef:tf,useIsFocusVisible:cf},Symbol.toStringTag,{value:"Module"})));var Ol;function Re(){return Ol||(Ol=1,function(e){"use client";Object.defineProperty(e,"__esModule",{value:!0}),Object.defineProperty(e,"default",{enumerable:!0,get:function(){return t.createSvgIcon}});var t=Fh}(Xr)),Xr}var Lh=Se;Object.defineProperty(Kr,"__esModule",{value:!0});var zn=Kr.default=void 0,Bh=Lh(Re()),Nh=Te();zn=Kr.default=(0,Bh.default)((0,Nh.jsx)("path",{d:"M20 9V7c0-1.1-.9-2-2-2h-3c0-1.66-1.34-3-3-3S9 3.34 9 5H6c-1.1 0-2 .9-2 2v2c-1.66 0-3 1.34-3 3s1.34 3 3 3v4c0 1.1.9 2 2 2h12c1.1 0 2-.9 2-2v-4c1.66 0 3-1.34 3-3s-1.34-3-3-3M7.5 11.5c0-.83.67-1.5 1.5-1.5s1.5.67 1.5 1.5S9.83 13 9 13s-1.5-.67-1.5-1.5M16 17H8v-2h8zm-1-4c-.83 0-1.5-.67-1.5-1.5S14.17 10 15 10s1.5.67 1.5 1.5S15.83 13 15 13"}),"SmartToy");var Ai={},Uh=Se;Object.defineProperty(Ai,"__esModule",{value:!0});var jl=Ai.default=void 0,Hh=Uh(Re()),Wh=Te();jl=Ai.default=(0,Hh.default)((0,Wh.jsx)("path",{d:"M20 2H4c-1.1 0-1.99.9-1.99 2L2 22l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2M6 9h12v2H6zm8 5H6v-2h8zm4-6H6V6h12z"}),"Chat");var Oi={},qh=Se;Object.defineProperty(Oi,"__esModule",{value:!0});var an=Oi.default=void 0,Vh=qh(Re()),Yh=Te();an=Oi.default=(0,Vh.default)((0,Yh.jsx)("path",{d:"m19 9 1.25-2.75L23 5l-2.75-1.25L19 1l-1.25 2.75L15 5l2.75 1.25zm-7.5.5L9 4 6.5 9.5 1 12l5.5 2.5L9 20l2.5-5.5L17 12zM19 15l-1.25 2.75L15 19l2.75 1.25L19 23l1.25-2.75L23 19l-2.75-1.25z"}),"AutoAwesome");var ji={},Gh=Se;Object.defineProperty(ji,"__esModule",{value:!0});var $l=ji.default=void 0,Kh=Gh(Re()),Xh=Te();$l=ji.default=(0,Kh.default)((0,Xh.jsx)("path",{d:"M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58c.18-.14.23-.41.12-.61l-1.92-3.32c-.12-.22-.37-.29-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54c-.04-.24-.24-.41-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58c-.18.14-.23.41-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6"}),"Settings");const Dn=window.recoil.atom,We=Dn({key:"claudeAgent__messages",default:[]}),ln=Dn({key:"claudeAgent__isStreaming",default:!1}),$i=Dn({key:"claudeAgent__streamingMessageId",default:null}),Ml=Dn({key:"claudeAgent__pendingConfirmation",default:null}),Jh=Dn({key:"claudeAgent__inputValue",default:""}),Qh={model:"claude-sonnet-4-20250514",maxTokens:8192,permissionMode:"auto",persistHistory:!0},Zh={label:"fiftyone-mcp-server",command:"fiftyone-mcp",args:[],enabled:!0},Mi=window.recoil.atom,zi=Mi({key:"claudeAgent__config",default:{mcpServers:[Zh],activeSkills:[],availableSkills:[],settings:Qh}}),em=Mi({key:"claudeAgent__configLoaded",default:!1}),tm=Mi({key:"claudeAgent__activeTab",default:"chat"});var Di={},nm=Se;Object.defineProperty(Di,"__esModule",{value:!0});var zl=Di.default=void 0,rm=nm(Re()),im=Te();zl=Di.default=(0,rm.default)((0,im.jsx)("path",{d:"M12 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4m0 2c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4"}),"Person");function tw(){}function nw(){}function om(e,t){const n={};return(e[e.length-1]===""?[...e,""]:e).join((n.padRight?" ":"")+","+(n.padLeft===!1?"":" ")).trim()}const am=/^[$_\p{ID_Start}][$_\u{200C}\u{200D}\p{ID_Continue}]*$/u,lm=/^[$_\p{ID_Start}][-$_\u{200C}\u{200D}\p{ID_Continue}]*$/u,sm={};function Dl(e,t){return(sm.jsx?lm:am).test(e)}const um=/[ \t\n\f\r]/g;function cm(e){return typeof e=="object"?e.type==="text"?Fl(e.value):!1:Fl(e)}function Fl(e){return e.replace(um,"")===""}class Fn{constructor(t,n,r){this.normal=n,this.property=t,r&&(this.space=r)}}Fn.prototype.normal={},Fn.prototype.property={},Fn.prototype.space=void 0;function Ll(e,t){const n={},r={};for(const i of e)Object.assign(n,i.property),Object.assign(r,i.normal);return new Fn(n,r,t)}function Fi(e){return e.toLowerCase()}class Le{constructor(t,n){this.attribute=n,this.property=t}}Le.prototype.attribute="",Le.prototype.booleanish=!1,Le.prototype.boolean=!1,Le.prototype.commaOrSpaceSeparated=!1,Le.prototype.commaSeparated=!1,Le.prototype.defined=!1,Le.prototype.mustUseProperty=!1,Le.prototype.number=!1,Le.prototype.overloadedBoolean=!1,Le.prototype.property="",Le.prototype.spaceSeparated=!1,Le.prototype.space=void 0;let fm=0;const J=Mt(),Ce=Mt(),Li=Mt(),I=Mt(),me=Mt(),sn=Mt(),qe=Mt();function Mt(){return 2**++fm}const Bi=Object.freeze(Object.defineProperty({__proto__:null,boolean:J,booleanish:Ce,commaOrSpaceSeparated:qe,commaSeparated:sn,number:I,overloadedBoolean:Li,spaceSeparated:me},Symbol.toStringTag,{value:"Module"})),Ni=Object.keys(Bi);class Ui extends Le{constructor(t,n,r,i){let o=-1;if(super(t,n),Bl(this,"space",i),typeof r=="number")for(;++o<Ni.length;){const a=Ni[o];Bl(this,Ni[o],(r&Bi[a])===Bi[a])}}}Ui.prototype.defined=!0;function Bl(e,t,n){n&&(e[t]=n)}function un(e){const t={},n={};for(const[r,i]of Object.entries(e.properties)){const o=new Ui(r,e.transform(e.attributes||{},r),i,e.space);e.mustUseProperty&&e.mustUseProperty.includes(r)&&(o.mustUseProperty=!0),t[r]=o,n[Fi(r)]=r,n[Fi(o.attribute)]=r}return new Fn(t,n,e.space)}const Nl=un({properties:{ariaActiveDescendant:null,ariaAtomic:Ce,ariaAutoComplete:null,ariaBusy:Ce,ariaChecked:Ce,ariaColCount:I,ariaColIndex:I,ariaColSpan:I,ariaControls:me,ariaCurrent:null,ariaDescribedBy:me,ariaDetails:null,ariaDisabled:Ce,ariaDropEffect:me,ariaErrorMessage:null,ariaExpanded:Ce,ariaFlowTo:me,ariaGrabbed:Ce,ariaHasPopup:null,ariaHidden:Ce,ariaInvalid:null,ariaKeyShortcuts:null,ariaLabel:null,ariaLabelledBy:me,ariaLevel:I,ariaLive:null,ariaModal:Ce,ariaMultiLine:Ce,ariaMultiSelectable:Ce,ariaOrientation:null,ariaOwns:me,ariaPlaceholder:null,ariaPosInSet:I,ariaPressed:Ce,ariaReadOnly:Ce,ariaRelevant:null,ariaRequired:Ce,ariaRoleDescription:me,ariaRowCount:I,ariaRowIndex:I,ariaRowSpan:I,ariaSelected:Ce,ariaSetSize:I,ariaSort:null,ariaValueMax:I,ariaValueMin:I,ariaValueNow:I,ariaValueText:null,role:null},transform(e,t){return t==="role"?t:"aria-"+t.slice(4).toLowerCase()}});function Ul(e,t){return t in e?e[t]:t}function Hl(e,t){return Ul(e,t.toLowerCase())}const pm=un({attributes:{acceptcharset:"accept-charset",classname:"class",htmlfor:"for",httpequiv:"http-equiv"},mustUseProperty:["checked","multiple","muted","selected"],properties:{abbr:null,accept:sn,acceptCharset:me,accessKey:me,action:null,allow:null,allowFullScreen:J,allowPaymentRequest:J,allowUserMedia:J,alt:null,as:null,async:J,autoCapitalize:null,autoComplete:me,autoFocus:J,autoPlay:J,blocking:me,capture:null,charSet:null,checked:J,cite:null,className:me,cols:I,colSpan:null,content:null,contentEditable:Ce,controls:J,controlsList:me,coords:I|sn,crossOrigin:null,data:null,dateTime:null,decoding:null,default:J,defer:J,dir:null,dirName:null,disabled:J,download:Li,draggable:Ce,encType:null,enterKeyHint:null,fetchPriority:null,form:null,formAction:null,formEncType:null,formMethod:null,formNoValidate:J,formTarget:null,headers:me,height:I,hidden:Li,high:I,href:null,hrefLang:null,htmlFor:me,httpEquiv:me,id:null,imageSizes:null,imageSrcSet:null,inert:J,inputMode:null,integrity:null,is:null,isMap:J,itemId:null,itemProp:me,itemRef:me,itemScope:J,itemType:me,kind:null,label:null,lang:null,language:null,list:null,loading:null,loop:J,low:I,manifest:null,max:null,maxLength:I,media:null,method:null,min:null,minLength:I,multiple:J,muted:J,name:null,nonce:null,noModule:J,noValidate:J,onAbort:null,onAfterPrint:null,onAuxClick:null,onBeforeMatch:null,onBeforePrint:null,onBeforeToggle:null,onBeforeUnload:null,onBlur:null,onCancel:null,onCanPlay:null,onCanPlayThrough:null,onChange:null,onClick:null,onClose:null,onContextLost:null,onContextMenu:null,onContextRestored:null,onCopy:null,onCueChange:null,onCut:null,onDblClick:null,onDrag:null,onDragEnd:null,onDragEnter:null,onDragExit:null,onDragLeave:null,onDragOver:null,onDragStart:null,onDrop:null,onDurationChange:null,onEmptied:null,onEnded:null,onError:null,onFocus:null,onFormData:null,onHashChange:null,onInput:null,onInvalid:null,onKeyDown:null,onKeyPress:null,onKeyUp:null,onLanguageChange:null,onLoad:null,onLoadedData:null,onLoadedMetadata:null,onLoadEnd:null,onLoadStart:null,onMessage:null,onMessageError:null,onMouseDown:null,onMouseEnter:null,onMouseLeave:null,onMouseMove:null,onMouseOut:null,onMouseOver:null,onMouseUp:null,onOffline:null,onOnline:null,onPageHide:null,onPageShow:null,onPaste:null,onPause:null,onPlay:null,onPlaying:null,onPopState:null,onProgress:null,onRateChange:null,onRejectionHandled:null,onReset:null,onResize:null,onScroll:null,onScrollEnd:null,onSecurityPolicyViolation:null,onSeeked:null,onSeeking:null,onSelect:null,onSlotChange:null,onStalled:null,onStorage:null,onSubmit:null,onSuspend:null,onTimeUpdate:null,onToggle:null,onUnhandledRejection:null,onUnload:null,onVolumeChange:null,onWaiting:null,onWheel:null,open:J,optimum:I,pattern:null,ping:me,placeholder:null,playsInline:J,popover:null,popoverTarget:null,popoverTargetAction:null,poster:null,preload:null,readOnly:J,referrerPolicy:null,rel:me,required:J,reversed:J,rows:I,rowSpan:I,sandbox:me,scope:null,scoped:J,seamless:J,selected:J,shadowRootClonable:J,shadowRootDelegatesFocus:J,shadowRootMode:null,shape:null,size:I,sizes:null,slot:null,span:I,spellCheck:Ce,src:null,srcDoc:null,srcLang:null,srcSet:null,start:I,step:null,style:null,tabIndex:I,target:null,title:null,translate:null,type:null,typeMustMatch:J,useMap:null,value:Ce,width:I,wrap:null,writingSuggestions:null,align:null,aLink:null,archive:me,axis:null,background:null,bgColor:null,border:I,borderColor:null,bottomMargin:I,cellPadding:null,cellSpacing:null,char:null,charOff:null,classId:null,clear:null,code:null,codeBase:null,codeType:null,color:null,compact:J,declare:J,event:null,face:null,frame:null,frameBorder:null,hSpace:I,leftMargin:I,link:null,longDesc:null,lowSrc:null,marginHeight:I,marginWidth:I,noResize:J,noHref:J,noShade:J,noWrap:J,object:null,profile:null,prompt:null,rev:null,rightMargin:I,rules:null,scheme:null,scrolling:Ce,standby:null,summary:null,text:null,topMargin:I,valueType:null,version:null,vAlign:null,vLink:null,vSpace:I,allowTransparency:null,autoCorrect:null,autoSave:null,disablePictureInPicture:J,disableRemotePlayback:J,prefix:null,property:null,results:I,security:null,unselectable:null},space:"html",transform:Hl}),dm=un({attributes:{accentHeight:"accent-height",alignmentBaseline:"alignment-baseline",arabicForm:"arabic-form",baselineShift:"baseline-shift",capHeight:"cap-height",className:"class",clipPath:"clip-path",clipRule:"clip-rule",colorInterpolation:"color-interpolation",colorInterpolationFilters:"color-interpolation-filters",colorProfile:"color-profile",colorRendering:"color-rendering",crossOrigin:"crossorigin",dataType:"datatype",dominantBaseline:"dominant-baseline",enableBackground:"enable-background",fillOpacity:"fill-opacity",fillRule:"fill-rule",floodColor:"flood-color",floodOpacity:"flood-opacity",fontFamily:"font-family",fontSize:"font-size",fontSizeAdjust:"font-size-adjust",fontStretch:"font-stretch",fontStyle:"font-style",fontVariant:"font-variant",fontWeight:"font-weight",glyphName:"glyph-name",glyphOrientationHorizontal:"glyph-orientation-horizontal",glyphOrientationVertical:"glyph-orientation-vertical",hrefLang:"hreflang",horizAdvX:"horiz-adv-x",horizOriginX:"horiz-origin-x",horizOriginY:"horiz-origin-y",imageRendering:"image-rendering",letterSpacing:"letter-spacing",lightingColor:"lighting-color",markerEnd:"marker-end",markerMid:"marker-mid",markerStart:"marker-start",navDown:"nav-down",navDownLeft:"nav-down-left",navDownRight:"nav-down-right",navLeft:"nav-left",navNext:"nav-next",navPrev:"nav-prev",navRight:"nav-right",navUp:"nav-up",navUpLeft:"nav-up-left",navUpRight:"nav-up-right",onAbort:"onabort",onActivate:"onactivate",onAfterPrint:"onafterprint",onBeforePrint:"onbeforeprint",onBegin:"onbegin",onCancel:"oncancel",onCanPlay:"oncanplay",onCanPlayThrough:"oncanplaythrough",onChange:"onchange",onClick:"onclick",onClose:"onclose",onCopy:"oncopy",onCueChange:"oncuechange",onCut:"oncut",onDblClick:"ondblclick",onDrag:"ondrag",onDragEnd:"ondragend",onDragEnter:"ondragenter",onDragExit:"ondragexit",onDragLeave:"ondragleave",onDragOver:"ondragover",onDragStart:"ondragstart",onDrop:"ondrop",onDurationChange:"ondurationchange",onEmptied:"onemptied",onEnd:"onend",onEnded:"onended",onError:"onerror",onFocus:"onfocus",onFocusIn:"onfocusin",onFocusOut:"onfocusout",onHashChange:"onhashchange",onInput:"oninput",onInvalid:"oninvalid",onKeyDown:"onkeydown",onKeyPress:"onkeypress",onKeyUp:"onkeyup",onLoad:"onload",onLoadedData:"onloadeddata",onLoadedMetadata:"onloadedmetadata",onLoadStart:"onloadstart",onMessage:"onmessage",onMouseDown:"onmousedown",onMouseEnter:"onmouseenter",onMouseLeave:"onmouseleave",onMouseMove:"onmousemove",onMouseOut:"onmouseout",onMouseOver:"onmouseover",onMouseUp:"onmouseup",onMouseWheel:"onmousewheel",onOffline:"onoffline",onOnline:"ononline",onPageHide:"onpagehide",onPageShow:"onpageshow",onPaste:"onpaste",onPause:"onpause",onPlay:"onplay",onPlaying:"onplaying",onPopState:"onpopstate",onProgress:"onprogress",onRateChange:"onratechange",onRepeat:"onrepeat",onReset:"onreset",onResize:"onresize",onScroll:"onscroll",onSeeked:"onseeked",onSeeking:"onseeking",onSelect:"onselect",onShow:"onshow",onStalled:"onstalled",onStorage:"onstorage",onSubmit:"onsubmit",onSuspend:"onsuspend",onTimeUpdate:"ontimeupdate",onToggle:"ontoggle",onUnload:"onunload",onVolumeChange:"onvolumechange",onWaiting:"onwaiting",onZoom:"onzoom",overlinePosition:"overline-position",overlineThickness:"overline-thickness",paintOrder:"paint-order",panose1:"panose-1",pointerEvents:"pointer-events",referrerPolicy:"referrerpolicy",renderingIntent:"rendering-intent",shapeRendering:"shape-rendering",stopColor:"stop-color",stopOpacity:"stop-opacity",strikethroughPosition:"strikethrough-position",strikethroughThickness:"strikethrough-thickness",strokeDashArray:"stroke-dasharray",strokeDashOffset:"stroke-dashoffset",strokeLineCap:"stroke-linecap",strokeLineJoin:"stroke-linejoin",strokeMiterLimit:"stroke-miterlimit",strokeOpacity:"stroke-opacity",strokeWidth:"stroke-width",tabIndex:"tabindex",textAnchor:"text-anchor",textDecoration:"text-decoration",textRendering:"text-rendering",transformOrigin:"transform-origin",typeOf:"typeof",underlinePosition:"underline-position",underlineThickness:"underline-thickness",unicodeBidi:"unicode-bidi",unicodeRange:"unicode-range",unitsPerEm:"units-per-em",vAlphabetic:"v-alphabetic",vHanging:"v-hanging",vIdeographic:"v-ideographic",vMathematical:"v-mathematical",vectorEffect:"vector-effect",vertAdvY:"vert-adv-y",vertOriginX:"vert-origin-x",vertOriginY:"vert-origin-y",wordSpacing:"word-spacing",writingMode:"writing-mode",xHeight:"x-height",playbackOrder:"playbackorder",timelineBegin:"timelinebegin"},properties:{about:qe,accentHeight:I,accumulate:null,additive:null,alignmentBaseline:null,alphabetic:I,amplitude:I,arabicForm:null,ascent:I,attributeName:null,attributeType:null,azimuth:I,bandwidth:null,baselineShift:null,baseFrequency:null,baseProfile:null,bbox:null,begin:null,bias:I,by:null,calcMode:null,capHeight:I,className:me,clip:null,clipPath:null,clipPathUnits:null,clipRule:null,color:null,colorInterpolation:null,colorInterpolationFilters:null,colorProfile:null,colorRendering:null,content:null,contentScriptType:null,contentStyleType:null,crossOrigin:null,cursor:null,cx:null,cy:null,d:null,dataType:null,defaultAction:null,descent:I,diffuseConstant:I,direction:null,display:null,dur:null,divisor:I,dominantBaseline:null,download:J,dx:null,dy:null,edgeMode:null,editable:null,elevation:I,enableBackground:null,end:null,event:null,exponent:I,externalResourcesRequired:null,fill:null,fillOpacity:I,fillRule:null,filter:null,filterRes:null,filterUnits:null,floodColor:null,floodOpacity:null,focusable:null,focusHighlight:null,fontFamily:null,fontSize:null,fontSizeAdjust:null,fontStretch:null,fontStyle:null,fontVariant:null,fontWeight:null,format:null,fr:null,from:null,fx:null,fy:null,g1:sn,g2:sn,glyphName:sn,glyphOrientationHorizontal:null,glyphOrientationVertical:null,glyphRef:null,gradientTransform:null,gradientUnits:null,handler:null,hanging:I,hatchContentUnits:null,hatchUnits:null,height:null,href:null,hrefLang:null,horizAdvX:I,horizOriginX:I,horizOriginY:I,id:null,ideographic:I,imageRendering:null,initialVisibility:null,in:null,in2:null,intercept:I,k:I,k1:I,k2:I,k3:I,k4:I,kernelMatrix:qe,kernelUnitLength:null,keyPoints:null,keySplines:null,keyTimes:null,kerning:null,lang:null,lengthAdjust:null,letterSpacing:null,lightingColor:null,limitingConeAngle:I,local:null,markerEnd:null,markerMid:null,markerStart:null,markerHeight:null,markerUnits:null,markerWidth:null,mask:null,maskContentUnits:null,maskUnits:null,mathematical:null,max:null,media:null,mediaCharacterEncoding:null,mediaContentEncodings:null,mediaSize:I,mediaTime:null,method:null,min:null,mode:null,name:null,navDown:null,navDownLeft:null,navDownRight:null,navLeft:null,navNext:null,navPrev:null,navRight:null,navUp:null,navUpLeft:null,navUpRight:null,numOctaves:null,observer:null,offset:null,onAbort:null,onActivate:null,onAfterPrint:null,onBeforePrint:null,onBegin:null,onCancel:null,onCanPlay:null,onCanPlayThrough:null,onChange:null,onClick:null,onClose:null,onCopy:null,onCueChange:null,onCut:null,onDblClick:null,onDrag:null,onDragEnd:null,onDragEnter:null,onDragExit:null,onDragLeave:null,onDragOver:null,onDragStart:null,onDrop:null,onDurationChange:null,onEmptied:null,onEnd:null,onEnded:null,onError:null,onFocus:null,onFocusIn:null,onFocusOut:null,onHashChange:null,onInput:null,onInvalid:null,onKeyDown:null,onKeyPress:null,onKeyUp:null,onLoad:null,onLoadedData:null,onLoadedMetadata:null,onLoadStart:null,onMessage:null,onMouseDown:null,onMouseEnter:null,onMouseLeave:null,onMouseMove:null,onMouseOut:null,onMouseOver:null,onMouseUp:null,onMouseWheel:null,onOffline:null,onOnline:null,onPageHide:null,onPageShow:null,onPaste:null,onPause:null,onPlay:null,onPlaying:null,onPopState:null,onProgress:null,onRateChange:null,onRepeat:null,onReset:null,onResize:null,onScroll:null,onSeeked:null,onSeeking:null,onSelect:null,onShow:null,onStalled:null,onStorage:null,onSubmit:null,onSuspend:null,onTimeUpdate:null,onToggle:null,onUnload:null,onVolumeChange:null,onWaiting:null,onZoom:null,opacity:null,operator:null,order:null,orient:null,orientation:null,origin:null,overflow:null,overlay:null,overlinePosition:I,overlineThickness:I,paintOrder:null,panose1:null,path:null,pathLength:I,patternContentUnits:null,patternTransform:null,patternUnits:null,phase:null,ping:me,pitch:null,playbackOrder:null,pointerEvents:null,points:null,pointsAtX:I,pointsAtY:I,pointsAtZ:I,preserveAlpha:null,preserveAspectRatio:null,primitiveUnits:null,propagate:null,property:qe,r:null,radius:null,referrerPolicy:null,refX:null,refY:null,rel:qe,rev:qe,renderingIntent:null,repeatCount:null,repeatDur:null,requiredExtensions:qe,requiredFeatures:qe,requiredFonts:qe,requiredFormats:qe,resource:null,restart:null,result:null,rotate:null,rx:null,ry:null,scale:null,seed:null,shapeRendering:null,side:null,slope:null,snapshotTime:null,specularConstant:I,specularExponent:I,spreadMethod:null,spacing:null,startOffset:null,stdDeviation:null,stemh:null,stemv:null,stitchTiles:null,stopColor:null,stopOpacity:null,strikethroughPosition:I,strikethroughThickness:I,string:null,stroke:null,strokeDashArray:qe,strokeDashOffset:null,strokeLineCap:null,strokeLineJoin:null,strokeMiterLimit:I,strokeOpacity:I,strokeWidth:null,style:null,surfaceScale:I,syncBehavior:null,syncBehaviorDefault:null,syncMaster:null,syncTolerance:null,syncToleranceDefault:null,systemLanguage:qe,tabIndex:I,tableValues:null,target:null,targetX:I,targetY:I,textAnchor:null,textDecoration:null,textRendering:null,textLength:null,timelineBegin:null,title:null,transformBehavior:null,type:null,typeOf:qe,to:null,transform:null,transformOrigin:null,u1:null,u2:null,underlinePosition:I,underlineThickness:I,unicode:null,unicodeBidi:null,unicodeRange:null,unitsPerEm:I,values:null,vAlphabetic:I,vMathematical:I,vectorEffect:null,vHanging:I,vIdeographic:I,version:null,vertAdvY:I,vertOriginX:I,vertOriginY:I,viewBox:null,viewTarget:null,visibility:null,width:null,widths:null,wordSpacing:null,writingMode:null,x:null,x1:null,x2:null,xChannelSelector:null,xHeight:I,y:null,y1:null,y2:null,yChannelSelector:null,z:null,zoomAndPan:null},space:"svg",transform:Ul}),Wl=un({properties:{xLinkActuate:null,xLinkArcRole:null,xLinkHref:null,xLinkRole:null,xLinkShow:null,xLinkTitle:null,xLinkType:null},space:"xlink",transform(e,t){return"xlink:"+t.slice(5).toLowerCase()}}),ql=un({attributes:{xmlnsxlink:"xmlns:xlink"},properties:{xmlnsXLink:null,xmlns:null},space:"xmlns",transform:Hl}),Vl=un({properties:{xmlBase:null,xmlLang:null,xmlSpace:null},space:"xml",transform(e,t){return"xml:"+t.slice(3).toLowerCase()}}),hm={classId:"classID",dataType:"datatype",itemId:"itemID",strokeDashArray:"strokeDasharray",strokeDashOffset:"strokeDashoffset",strokeLineCap:"strokeLinecap",strokeLineJoin:"strokeLinejoin",strokeMiterLimit:"strokeMiterlimit",typeOf:"typeof",xLinkActuate:"xlinkActuate",xLinkArcRole:"xlinkArcrole",xLinkHref:"xlinkHref",xLinkRole:"xlinkRole",xLinkShow:"xlinkShow",xLinkTitle:"xlinkTitle",xLinkType:"xlinkType",xmlnsXLink:"xmlnsXlink"},mm=/[A-Z]/g,Yl=/-[a-z]/g,gm=/^data[-\w.:]+$/i;function ym(e,t){const n=Fi(t);let r=t,i=Le;if(n in e.normal)return e.property[e.normal[n]];if(n.length>4&&n.slice(0,4)==="data"&&gm.test(t)){if(t.charAt(4)==="-"){const o=t.slice(5).replace(Yl,bm);r="data"+o.charAt(0).toUpperCase()+o.slice(1)}else{const o=t.slice(4);if(!Yl.test(o)){let a=o.replace(mm,xm);a.charAt(0)!=="-"&&(a="-"+a),t="data"+a}}i=Ui}return new i(r,t)}function xm(e){return"-"+e.toLowerCase()}function bm(e){return e.charAt(1).toUpperCase()}const vm=Ll([Nl,pm,Wl,ql,Vl],"html"),Hi=Ll([Nl,dm,Wl,ql,Vl],"svg");function km(e){return e.join(" ").trim()}var Wi={},Gl=/\/\*[^*]*\*+([^/*][^*]*\*+)*\//g,wm=/\n/g,Sm=/^\s*/,_m=/^(\*?[-#/*\\\w]+(\[[0-9a-z_-]+\])?)\s*/,Cm=/^:\s*/,Em=/^((?:'(?:\\'|.)*?'|"(?:\\"|.)*?"|\([^)]*?\)|[^};])+)/,Tm=/^[;\s]*/,Rm=/^\s+|\s+$/g,Pm=`
+`)),Sa.configure(e)}},unstable_useEnhancedEffect:ya,unstable_useId:Xc,unsupportedProp:Jc,useControlled:Qc,useEventCallback:Zc,useForkRef:tf,useIsFocusVisible:cf},Symbol.toStringTag,{value:"Module"})));var Ol;function Re(){return Ol||(Ol=1,function(e){"use client";Object.defineProperty(e,"__esModule",{value:!0}),Object.defineProperty(e,"default",{enumerable:!0,get:function(){return t.createSvgIcon}});var t=Fh}(Xr)),Xr}var Lh=Se;Object.defineProperty(Kr,"__esModule",{value:!0});var zn=Kr.default=void 0,Bh=Lh(Re()),Nh=Te();zn=Kr.default=(0,Bh.default)((0,Nh.jsx)("path",{d:"M20 9V7c0-1.1-.9-2-2-2h-3c0-1.66-1.34-3-3-3S9 3.34 9 5H6c-1.1 0-2 .9-2 2v2c-1.66 0-3 1.34-3 3s1.34 3 3 3v4c0 1.1.9 2 2 2h12c1.1 0 2-.9 2-2v-4c1.66 0 3-1.34 3-3s-1.34-3-3-3M7.5 11.5c0-.83.67-1.5 1.5-1.5s1.5.67 1.5 1.5S9.83 13 9 13s-1.5-.67-1.5-1.5M16 17H8v-2h8zm-1-4c-.83 0-1.5-.67-1.5-1.5S14.17 10 15 10s1.5.67 1.5 1.5S15.83 13 15 13"}),"SmartToy");var Ai={},Uh=Se;Object.defineProperty(Ai,"__esModule",{value:!0});var jl=Ai.default=void 0,Hh=Uh(Re()),Wh=Te();jl=Ai.default=(0,Hh.default)((0,Wh.jsx)("path",{d:"M20 2H4c-1.1 0-1.99.9-1.99 2L2 22l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2M6 9h12v2H6zm8 5H6v-2h8zm4-6H6V6h12z"}),"Chat");var Oi={},qh=Se;Object.defineProperty(Oi,"__esModule",{value:!0});var an=Oi.default=void 0,Vh=qh(Re()),Yh=Te();an=Oi.default=(0,Vh.default)((0,Yh.jsx)("path",{d:"m19 9 1.25-2.75L23 5l-2.75-1.25L19 1l-1.25 2.75L15 5l2.75 1.25zm-7.5.5L9 4 6.5 9.5 1 12l5.5 2.5L9 20l2.5-5.5L17 12zM19 15l-1.25 2.75L15 19l2.75 1.25L19 23l1.25-2.75L23 19l-2.75-1.25z"}),"AutoAwesome");var ji={},Gh=Se;Object.defineProperty(ji,"__esModule",{value:!0});var $l=ji.default=void 0,Kh=Gh(Re()),Xh=Te();$l=ji.default=(0,Kh.default)((0,Xh.jsx)("path",{d:"M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58c.18-.14.23-.41.12-.61l-1.92-3.32c-.12-.22-.37-.29-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54c-.04-.24-.24-.41-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58c-.18.14-.23.41-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6"}),"Settings");const Dn=window.recoil.atom,Jk=window.recoil.selector,We=Dn({key:"claudeAgent__messages",default:[]}),Kk=Jk({key:"claudeAgent__hasMessages",get:({get:e})=>e(We).length>0}),ln=Dn({key:"claudeAgent__isStreaming",default:!1}),$i=Dn({key:"claudeAgent__streamingMessageId",default:null}),Ml=Dn({key:"claudeAgent__pendingConfirmation",default:null}),Jh=Dn({key:"claudeAgent__inputValue",default:""}),Qh={model:"claude-sonnet-4-20250514",maxTokens:8192,permissionMode:"auto",persistHistory:!0},Zh={label:"fiftyone-mcp-server",command:"fiftyone-mcp",args:[],enabled:!0},Mi=window.recoil.atom,zi=Mi({key:"claudeAgent__config",default:{mcpServers:[Zh],activeSkills:[],availableSkills:[],settings:Qh}}),em=Mi({key:"claudeAgent__configLoaded",default:!1}),tm=Mi({key:"claudeAgent__activeTab",default:"chat"});var Di={},nm=Se;Object.defineProperty(Di,"__esModule",{value:!0});var zl=Di.default=void 0,rm=nm(Re()),im=Te();zl=Di.default=(0,rm.default)((0,im.jsx)("path",{d:"M12 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4m0 2c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4"}),"Person");function tw(){}function nw(){}function om(e,t){const n={};return(e[e.length-1]===""?[...e,""]:e).join((n.padRight?" ":"")+","+(n.padLeft===!1?"":" ")).trim()}const am=/^[$_\p{ID_Start}][$_\u{200C}\u{200D}\p{ID_Continue}]*$/u,lm=/^[$_\p{ID_Start}][-$_\u{200C}\u{200D}\p{ID_Continue}]*$/u,sm={};function Dl(e,t){return(sm.jsx?lm:am).test(e)}const um=/[ \t\n\f\r]/g;function cm(e){return typeof e=="object"?e.type==="text"?Fl(e.value):!1:Fl(e)}function Fl(e){return e.replace(um,"")===""}class Fn{constructor(t,n,r){this.normal=n,this.property=t,r&&(this.space=r)}}Fn.prototype.normal={},Fn.prototype.property={},Fn.prototype.space=void 0;function Ll(e,t){const n={},r={};for(const i of e)Object.assign(n,i.property),Object.assign(r,i.normal);return new Fn(n,r,t)}function Fi(e){return e.toLowerCase()}class Le{constructor(t,n){this.attribute=n,this.property=t}}Le.prototype.attribute="",Le.prototype.booleanish=!1,Le.prototype.boolean=!1,Le.prototype.commaOrSpaceSeparated=!1,Le.prototype.commaSeparated=!1,Le.prototype.defined=!1,Le.prototype.mustUseProperty=!1,Le.prototype.number=!1,Le.prototype.overloadedBoolean=!1,Le.prototype.property="",Le.prototype.spaceSeparated=!1,Le.prototype.space=void 0;let fm=0;const J=Mt(),Ce=Mt(),Li=Mt(),I=Mt(),me=Mt(),sn=Mt(),qe=Mt();function Mt(){return 2**++fm}const Bi=Object.freeze(Object.defineProperty({__proto__:null,boolean:J,booleanish:Ce,commaOrSpaceSeparated:qe,commaSeparated:sn,number:I,overloadedBoolean:Li,spaceSeparated:me},Symbol.toStringTag,{value:"Module"})),Ni=Object.keys(Bi);class Ui extends Le{constructor(t,n,r,i){let o=-1;if(super(t,n),Bl(this,"space",i),typeof r=="number")for(;++o<Ni.length;){const a=Ni[o];Bl(this,Ni[o],(r&Bi[a])===Bi[a])}}}Ui.prototype.defined=!0;function Bl(e,t,n){n&&(e[t]=n)}function un(e){const t={},n={};for(const[r,i]of Object.entries(e.properties)){const o=new Ui(r,e.transform(e.attributes||{},r),i,e.space);e.mustUseProperty&&e.mustUseProperty.includes(r)&&(o.mustUseProperty=!0),t[r]=o,n[Fi(r)]=r,n[Fi(o.attribute)]=r}return new Fn(t,n,e.space)}const Nl=un({properties:{ariaActiveDescendant:null,ariaAtomic:Ce,ariaAutoComplete:null,ariaBusy:Ce,ariaChecked:Ce,ariaColCount:I,ariaColIndex:I,ariaColSpan:I,ariaControls:me,ariaCurrent:null,ariaDescribedBy:me,ariaDetails:null,ariaDisabled:Ce,ariaDropEffect:me,ariaErrorMessage:null,ariaExpanded:Ce,ariaFlowTo:me,ariaGrabbed:Ce,ariaHasPopup:null,ariaHidden:Ce,ariaInvalid:null,ariaKeyShortcuts:null,ariaLabel:null,ariaLabelledBy:me,ariaLevel:I,ariaLive:null,ariaModal:Ce,ariaMultiLine:Ce,ariaMultiSelectable:Ce,ariaOrientation:null,ariaOwns:me,ariaPlaceholder:null,ariaPosInSet:I,ariaPressed:Ce,ariaReadOnly:Ce,ariaRelevant:null,ariaRequired:Ce,ariaRoleDescription:me,ariaRowCount:I,ariaRowIndex:I,ariaRowSpan:I,ariaSelected:Ce,ariaSetSize:I,ariaSort:null,ariaValueMax:I,ariaValueMin:I,ariaValueNow:I,ariaValueText:null,role:null},transform(e,t){return t==="role"?t:"aria-"+t.slice(4).toLowerCase()}});function Ul(e,t){return t in e?e[t]:t}function Hl(e,t){return Ul(e,t.toLowerCase())}const pm=un({attributes:{acceptcharset:"accept-charset",classname:"class",htmlfor:"for",httpequiv:"http-equiv"},mustUseProperty:["checked","multiple","muted","selected"],properties:{abbr:null,accept:sn,acceptCharset:me,accessKey:me,action:null,allow:null,allowFullScreen:J,allowPaymentRequest:J,allowUserMedia:J,alt:null,as:null,async:J,autoCapitalize:null,autoComplete:me,autoFocus:J,autoPlay:J,blocking:me,capture:null,charSet:null,checked:J,cite:null,className:me,cols:I,colSpan:null,content:null,contentEditable:Ce,controls:J,controlsList:me,coords:I|sn,crossOrigin:null,data:null,dateTime:null,decoding:null,default:J,defer:J,dir:null,dirName:null,disabled:J,download:Li,draggable:Ce,encType:null,enterKeyHint:null,fetchPriority:null,form:null,formAction:null,formEncType:null,formMethod:null,formNoValidate:J,formTarget:null,headers:me,height:I,hidden:Li,high:I,href:null,hrefLang:null,htmlFor:me,httpEquiv:me,id:null,imageSizes:null,imageSrcSet:null,inert:J,inputMode:null,integrity:null,is:null,isMap:J,itemId:null,itemProp:me,itemRef:me,itemScope:J,itemType:me,kind:null,label:null,lang:null,language:null,list:null,loading:null,loop:J,low:I,manifest:null,max:null,maxLength:I,media:null,method:null,min:null,minLength:I,multiple:J,muted:J,name:null,nonce:null,noModule:J,noValidate:J,onAbort:null,onAfterPrint:null,onAuxClick:null,onBeforeMatch:null,onBeforePrint:null,onBeforeToggle:null,onBeforeUnload:null,onBlur:null,onCancel:null,onCanPlay:null,onCanPlayThrough:null,onChange:null,onClick:null,onClose:null,onContextLost:null,onContextMenu:null,onContextRestored:null,onCopy:null,onCueChange:null,onCut:null,onDblClick:null,onDrag:null,onDragEnd:null,onDragEnter:null,onDragExit:null,onDragLeave:null,onDragOver:null,onDragStart:null,onDrop:null,onDurationChange:null,onEmptied:null,onEnded:null,onError:null,onFocus:null,onFormData:null,onHashChange:null,onInput:null,onInvalid:null,onKeyDown:null,onKeyPress:null,onKeyUp:null,onLanguageChange:null,onLoad:null,onLoadedData:null,onLoadedMetadata:null,onLoadEnd:null,onLoadStart:null,onMessage:null,onMessageError:null,onMouseDown:null,onMouseEnter:null,onMouseLeave:null,onMouseMove:null,onMouseOut:null,onMouseOver:null,onMouseUp:null,onOffline:null,onOnline:null,onPageHide:null,onPageShow:null,onPaste:null,onPause:null,onPlay:null,onPlaying:null,onPopState:null,onProgress:null,onRateChange:null,onRejectionHandled:null,onReset:null,onResize:null,onScroll:null,onScrollEnd:null,onSecurityPolicyViolation:null,onSeeked:null,onSeeking:null,onSelect:null,onSlotChange:null,onStalled:null,onStorage:null,onSubmit:null,onSuspend:null,onTimeUpdate:null,onToggle:null,onUnhandledRejection:null,onUnload:null,onVolumeChange:null,onWaiting:null,onWheel:null,open:J,optimum:I,pattern:null,ping:me,placeholder:null,playsInline:J,popover:null,popoverTarget:null,popoverTargetAction:null,poster:null,preload:null,readOnly:J,referrerPolicy:null,rel:me,required:J,reversed:J,rows:I,rowSpan:I,sandbox:me,scope:null,scoped:J,seamless:J,selected:J,shadowRootClonable:J,shadowRootDelegatesFocus:J,shadowRootMode:null,shape:null,size:I,sizes:null,slot:null,span:I,spellCheck:Ce,src:null,srcDoc:null,srcLang:null,srcSet:null,start:I,step:null,style:null,tabIndex:I,target:null,title:null,translate:null,type:null,typeMustMatch:J,useMap:null,value:Ce,width:I,wrap:null,writingSuggestions:null,align:null,aLink:null,archive:me,axis:null,background:null,bgColor:null,border:I,borderColor:null,bottomMargin:I,cellPadding:null,cellSpacing:null,char:null,charOff:null,classId:null,clear:null,code:null,codeBase:null,codeType:null,color:null,compact:J,declare:J,event:null,face:null,frame:null,frameBorder:null,hSpace:I,leftMargin:I,link:null,longDesc:null,lowSrc:null,marginHeight:I,marginWidth:I,noResize:J,noHref:J,noShade:J,noWrap:J,object:null,profile:null,prompt:null,rev:null,rightMargin:I,rules:null,scheme:null,scrolling:Ce,standby:null,summary:null,text:null,topMargin:I,valueType:null,version:null,vAlign:null,vLink:null,vSpace:I,allowTransparency:null,autoCorrect:null,autoSave:null,disablePictureInPicture:J,disableRemotePlayback:J,prefix:null,property:null,results:I,security:null,unselectable:null},space:"html",transform:Hl}),dm=un({attributes:{accentHeight:"accent-height",alignmentBaseline:"alignment-baseline",arabicForm:"arabic-form",baselineShift:"baseline-shift",capHeight:"cap-height",className:"class",clipPath:"clip-path",clipRule:"clip-rule",colorInterpolation:"color-interpolation",colorInterpolationFilters:"color-interpolation-filters",colorProfile:"color-profile",colorRendering:"color-rendering",crossOrigin:"crossorigin",dataType:"datatype",dominantBaseline:"dominant-baseline",enableBackground:"enable-background",fillOpacity:"fill-opacity",fillRule:"fill-rule",floodColor:"flood-color",floodOpacity:"flood-opacity",fontFamily:"font-family",fontSize:"font-size",fontSizeAdjust:"font-size-adjust",fontStretch:"font-stretch",fontStyle:"font-style",fontVariant:"font-variant",fontWeight:"font-weight",glyphName:"glyph-name",glyphOrientationHorizontal:"glyph-orientation-horizontal",glyphOrientationVertical:"glyph-orientation-vertical",hrefLang:"hreflang",horizAdvX:"horiz-adv-x",horizOriginX:"horiz-origin-x",horizOriginY:"horiz-origin-y",imageRendering:"image-rendering",letterSpacing:"letter-spacing",lightingColor:"lighting-color",markerEnd:"marker-end",markerMid:"marker-mid",markerStart:"marker-start",navDown:"nav-down",navDownLeft:"nav-down-left",navDownRight:"nav-down-right",navLeft:"nav-left",navNext:"nav-next",navPrev:"nav-prev",navRight:"nav-right",navUp:"nav-up",navUpLeft:"nav-up-left",navUpRight:"nav-up-right",onAbort:"onabort",onActivate:"onactivate",onAfterPrint:"onafterprint",onBeforePrint:"onbeforeprint",onBegin:"onbegin",onCancel:"oncancel",onCanPlay:"oncanplay",onCanPlayThrough:"oncanplaythrough",onChange:"onchange",onClick:"onclick",onClose:"onclose",onCopy:"oncopy",onCueChange:"oncuechange",onCut:"oncut",onDblClick:"ondblclick",onDrag:"ondrag",onDragEnd:"ondragend",onDragEnter:"ondragenter",onDragExit:"ondragexit",onDragLeave:"ondragleave",onDragOver:"ondragover",onDragStart:"ondragstart",onDrop:"ondrop",onDurationChange:"ondurationchange",onEmptied:"onemptied",onEnd:"onend",onEnded:"onended",onError:"onerror",onFocus:"onfocus",onFocusIn:"onfocusin",onFocusOut:"onfocusout",onHashChange:"onhashchange",onInput:"oninput",onInvalid:"oninvalid",onKeyDown:"onkeydown",onKeyPress:"onkeypress",onKeyUp:"onkeyup",onLoad:"onload",onLoadedData:"onloadeddata",onLoadedMetadata:"onloadedmetadata",onLoadStart:"onloadstart",onMessage:"onmessage",onMouseDown:"onmousedown",onMouseEnter:"onmouseenter",onMouseLeave:"onmouseleave",onMouseMove:"onmousemove",onMouseOut:"onmouseout",onMouseOver:"onmouseover",onMouseUp:"onmouseup",onMouseWheel:"onmousewheel",onOffline:"onoffline",onOnline:"ononline",onPageHide:"onpagehide",onPageShow:"onpageshow",onPaste:"onpaste",onPause:"onpause",onPlay:"onplay",onPlaying:"onplaying",onPopState:"onpopstate",onProgress:"onprogress",onRateChange:"onratechange",onRepeat:"onrepeat",onReset:"onreset",onResize:"onresize",onScroll:"onscroll",onSeeked:"onseeked",onSeeking:"onseeking",onSelect:"onselect",onShow:"onshow",onStalled:"onstalled",onStorage:"onstorage",onSubmit:"onsubmit",onSuspend:"onsuspend",onTimeUpdate:"ontimeupdate",onToggle:"ontoggle",onUnload:"onunload",onVolumeChange:"onvolumechange",onWaiting:"onwaiting",onZoom:"onzoom",overlinePosition:"overline-position",overlineThickness:"overline-thickness",paintOrder:"paint-order",panose1:"panose-1",pointerEvents:"pointer-events",referrerPolicy:"referrerpolicy",renderingIntent:"rendering-intent",shapeRendering:"shape-rendering",stopColor:"stop-color",stopOpacity:"stop-opacity",strikethroughPosition:"strikethrough-position",strikethroughThickness:"strikethrough-thickness",strokeDashArray:"stroke-dasharray",strokeDashOffset:"stroke-dashoffset",strokeLineCap:"stroke-linecap",strokeLineJoin:"stroke-linejoin",strokeMiterLimit:"stroke-miterlimit",strokeOpacity:"stroke-opacity",strokeWidth:"stroke-width",tabIndex:"tabindex",textAnchor:"text-anchor",textDecoration:"text-decoration",textRendering:"text-rendering",transformOrigin:"transform-origin",typeOf:"typeof",underlinePosition:"underline-position",underlineThickness:"underline-thickness",unicodeBidi:"unicode-bidi",unicodeRange:"unicode-range",unitsPerEm:"units-per-em",vAlphabetic:"v-alphabetic",vHanging:"v-hanging",vIdeographic:"v-ideographic",vMathematical:"v-mathematical",vectorEffect:"vector-effect",vertAdvY:"vert-adv-y",vertOriginX:"vert-origin-x",vertOriginY:"vert-origin-y",wordSpacing:"word-spacing",writingMode:"writing-mode",xHeight:"x-height",playbackOrder:"playbackorder",timelineBegin:"timelinebegin"},properties:{about:qe,accentHeight:I,accumulate:null,additive:null,alignmentBaseline:null,alphabetic:I,amplitude:I,arabicForm:null,ascent:I,attributeName:null,attributeType:null,azimuth:I,bandwidth:null,baselineShift:null,baseFrequency:null,baseProfile:null,bbox:null,begin:null,bias:I,by:null,calcMode:null,capHeight:I,className:me,clip:null,clipPath:null,clipPathUnits:null,clipRule:null,color:null,colorInterpolation:null,colorInterpolationFilters:null,colorProfile:null,colorRendering:null,content:null,contentScriptType:null,contentStyleType:null,crossOrigin:null,cursor:null,cx:null,cy:null,d:null,dataType:null,defaultAction:null,descent:I,diffuseConstant:I,direction:null,display:null,dur:null,divisor:I,dominantBaseline:null,download:J,dx:null,dy:null,edgeMode:null,editable:null,elevation:I,enableBackground:null,end:null,event:null,exponent:I,externalResourcesRequired:null,fill:null,fillOpacity:I,fillRule:null,filter:null,filterRes:null,filterUnits:null,floodColor:null,floodOpacity:null,focusable:null,focusHighlight:null,fontFamily:null,fontSize:null,fontSizeAdjust:null,fontStretch:null,fontStyle:null,fontVariant:null,fontWeight:null,format:null,fr:null,from:null,fx:null,fy:null,g1:sn,g2:sn,glyphName:sn,glyphOrientationHorizontal:null,glyphOrientationVertical:null,glyphRef:null,gradientTransform:null,gradientUnits:null,handler:null,hanging:I,hatchContentUnits:null,hatchUnits:null,height:null,href:null,hrefLang:null,horizAdvX:I,horizOriginX:I,horizOriginY:I,id:null,ideographic:I,imageRendering:null,initialVisibility:null,in:null,in2:null,intercept:I,k:I,k1:I,k2:I,k3:I,k4:I,kernelMatrix:qe,kernelUnitLength:null,keyPoints:null,keySplines:null,keyTimes:null,kerning:null,lang:null,lengthAdjust:null,letterSpacing:null,lightingColor:null,limitingConeAngle:I,local:null,markerEnd:null,markerMid:null,markerStart:null,markerHeight:null,markerUnits:null,markerWidth:null,mask:null,maskContentUnits:null,maskUnits:null,mathematical:null,max:null,media:null,mediaCharacterEncoding:null,mediaContentEncodings:null,mediaSize:I,mediaTime:null,method:null,min:null,mode:null,name:null,navDown:null,navDownLeft:null,navDownRight:null,navLeft:null,navNext:null,navPrev:null,navRight:null,navUp:null,navUpLeft:null,navUpRight:null,numOctaves:null,observer:null,offset:null,onAbort:null,onActivate:null,onAfterPrint:null,onBeforePrint:null,onBegin:null,onCancel:null,onCanPlay:null,onCanPlayThrough:null,onChange:null,onClick:null,onClose:null,onCopy:null,onCueChange:null,onCut:null,onDblClick:null,onDrag:null,onDragEnd:null,onDragEnter:null,onDragExit:null,onDragLeave:null,onDragOver:null,onDragStart:null,onDrop:null,onDurationChange:null,onEmptied:null,onEnd:null,onEnded:null,onError:null,onFocus:null,onFocusIn:null,onFocusOut:null,onHashChange:null,onInput:null,onInvalid:null,onKeyDown:null,onKeyPress:null,onKeyUp:null,onLoad:null,onLoadedData:null,onLoadedMetadata:null,onLoadStart:null,onMessage:null,onMouseDown:null,onMouseEnter:null,onMouseLeave:null,onMouseMove:null,onMouseOut:null,onMouseOver:null,onMouseUp:null,onMouseWheel:null,onOffline:null,onOnline:null,onPageHide:null,onPageShow:null,onPaste:null,onPause:null,onPlay:null,onPlaying:null,onPopState:null,onProgress:null,onRateChange:null,onRepeat:null,onReset:null,onResize:null,onScroll:null,onSeeked:null,onSeeking:null,onSelect:null,onShow:null,onStalled:null,onStorage:null,onSubmit:null,onSuspend:null,onTimeUpdate:null,onToggle:null,onUnload:null,onVolumeChange:null,onWaiting:null,onZoom:null,opacity:null,operator:null,order:null,orient:null,orientation:null,origin:null,overflow:null,overlay:null,overlinePosition:I,overlineThickness:I,paintOrder:null,panose1:null,path:null,pathLength:I,patternContentUnits:null,patternTransform:null,patternUnits:null,phase:null,ping:me,pitch:null,playbackOrder:null,pointerEvents:null,points:null,pointsAtX:I,pointsAtY:I,pointsAtZ:I,preserveAlpha:null,preserveAspectRatio:null,primitiveUnits:null,propagate:null,property:qe,r:null,radius:null,referrerPolicy:null,refX:null,refY:null,rel:qe,rev:qe,renderingIntent:null,repeatCount:null,repeatDur:null,requiredExtensions:qe,requiredFeatures:qe,requiredFonts:qe,requiredFormats:qe,resource:null,restart:null,result:null,rotate:null,rx:null,ry:null,scale:null,seed:null,shapeRendering:null,side:null,slope:null,snapshotTime:null,specularConstant:I,specularExponent:I,spreadMethod:null,spacing:null,startOffset:null,stdDeviation:null,stemh:null,stemv:null,stitchTiles:null,stopColor:null,stopOpacity:null,strikethroughPosition:I,strikethroughThickness:I,string:null,stroke:null,strokeDashArray:qe,strokeDashOffset:null,strokeLineCap:null,strokeLineJoin:null,strokeMiterLimit:I,strokeOpacity:I,strokeWidth:null,style:null,surfaceScale:I,syncBehavior:null,syncBehaviorDefault:null,syncMaster:null,syncTolerance:null,syncToleranceDefault:null,systemLanguage:qe,tabIndex:I,tableValues:null,target:null,targetX:I,targetY:I,textAnchor:null,textDecoration:null,textRendering:null,textLength:null,timelineBegin:null,title:null,transformBehavior:null,type:null,typeOf:qe,to:null,transform:null,transformOrigin:null,u1:null,u2:null,underlinePosition:I,underlineThickness:I,unicode:null,unicodeBidi:null,unicodeRange:null,unitsPerEm:I,values:null,vAlphabetic:I,vMathematical:I,vectorEffect:null,vHanging:I,vIdeographic:I,version:null,vertAdvY:I,vertOriginX:I,vertOriginY:I,viewBox:null,viewTarget:null,visibility:null,width:null,widths:null,wordSpacing:null,writingMode:null,x:null,x1:null,x2:null,xChannelSelector:null,xHeight:I,y:null,y1:null,y2:null,yChannelSelector:null,z:null,zoomAndPan:null},space:"svg",transform:Ul}),Wl=un({properties:{xLinkActuate:null,xLinkArcRole:null,xLinkHref:null,xLinkRole:null,xLinkShow:null,xLinkTitle:null,xLinkType:null},space:"xlink",transform(e,t){return"xlink:"+t.slice(5).toLowerCase()}}),ql=un({attributes:{xmlnsxlink:"xmlns:xlink"},properties:{xmlnsXLink:null,xmlns:null},space:"xmlns",transform:Hl}),Vl=un({properties:{xmlBase:null,xmlLang:null,xmlSpace:null},space:"xml",transform(e,t){return"xml:"+t.slice(3).toLowerCase()}}),hm={classId:"classID",dataType:"datatype",itemId:"itemID",strokeDashArray:"strokeDasharray",strokeDashOffset:"strokeDashoffset",strokeLineCap:"strokeLinecap",strokeLineJoin:"strokeLinejoin",strokeMiterLimit:"strokeMiterlimit",typeOf:"typeof",xLinkActuate:"xlinkActuate",xLinkArcRole:"xlinkArcrole",xLinkHref:"xlinkHref",xLinkRole:"xlinkRole",xLinkShow:"xlinkShow",xLinkTitle:"xlinkTitle",xLinkType:"xlinkType",xmlnsXLink:"xmlnsXlink"},mm=/[A-Z]/g,Yl=/-[a-z]/g,gm=/^data[-\w.:]+$/i;function ym(e,t){const n=Fi(t);let r=t,i=Le;if(n in e.normal)return e.property[e.normal[n]];if(n.length>4&&n.slice(0,4)==="data"&&gm.test(t)){if(t.charAt(4)==="-"){const o=t.slice(5).replace(Yl,bm);r="data"+o.charAt(0).toUpperCase()+o.slice(1)}else{const o=t.slice(4);if(!Yl.test(o)){let a=o.replace(mm,xm);a.charAt(0)!=="-"&&(a="-"+a),t="data"+a}}i=Ui}return new i(r,t)}function xm(e){return"-"+e.toLowerCase()}function bm(e){return e.charAt(1).toUpperCase()}const vm=Ll([Nl,pm,Wl,ql,Vl],"html"),Hi=Ll([Nl,dm,Wl,ql,Vl],"svg");function km(e){return e.join(" ").trim()}var Wi={},Gl=/\/\*[^*]*\*+([^/*][^*]*\*+)*\//g,wm=/\n/g,Sm=/^\s*/,_m=/^(\*?[-#/*\\\w]+(\[[0-9a-z_-]+\])?)\s*/,Cm=/^:\s*/,Em=/^((?:'(?:\\'|.)*?'|"(?:\\"|.)*?"|\([^)]*?\)|[^};])+)/,Tm=/^[;\s]*/,Rm=/^\s+|\s+$/g,Pm=`
 `,Kl="/",Xl="*",zt="",Im="comment",Am="declaration";function Om(e,t){if(typeof e!="string")throw new TypeError("First argument must be a string");if(!e)return[];t=t||{};var n=1,r=1;function i(m){var h=m.match(wm);h&&(n+=h.length);var k=m.lastIndexOf(Pm);r=~k?m.length-k:r+m.length}function o(){var m={line:n,column:r};return function(h){return h.position=new a(m),u(),h}}function a(m){this.start=m,this.end={line:n,column:r},this.source=t.source}a.prototype.content=e;function l(m){var h=new Error(t.source+":"+n+":"+r+": "+m);if(h.reason=m,h.filename=t.source,h.line=n,h.column=r,h.source=e,!t.silent)throw h}function s(m){var h=m.exec(e);if(h){var k=h[0];return i(k),e=e.slice(k.length),h}}function u(){s(Sm)}function f(m){var h;for(m=m||[];h=c();)h!==!1&&m.push(h);return m}function c(){var m=o();if(!(Kl!=e.charAt(0)||Xl!=e.charAt(1))){for(var h=2;zt!=e.charAt(h)&&(Xl!=e.charAt(h)||Kl!=e.charAt(h+1));)++h;if(h+=2,zt===e.charAt(h-1))return l("End of comment missing");var k=e.slice(2,h-2);return r+=2,i(k),e=e.slice(h),r+=2,m({type:Im,comment:k})}}function d(){var m=o(),h=s(_m);if(h){if(c(),!s(Cm))return l("property missing ':'");var k=s(Em),b=m({type:Am,property:Jl(h[0].replace(Gl,zt)),value:k?Jl(k[0].replace(Gl,zt)):zt});return s(Tm),b}}function p(){var m=[];f(m);for(var h;h=d();)h!==!1&&(m.push(h),f(m));return m}return u(),p()}function Jl(e){return e?e.replace(Rm,zt):zt}var jm=Om,$m=jt&&jt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(Wi,"__esModule",{value:!0}),Wi.default=zm;const Mm=$m(jm);function zm(e,t){let n=null;if(!e||typeof e!="string")return n;const r=(0,Mm.default)(e),i=typeof t=="function";return r.forEach(o=>{if(o.type!=="declaration")return;const{property:a,value:l}=o;i?t(a,l,o):l&&(n=n||{},n[a]=l)}),n}var Rr={};Object.defineProperty(Rr,"__esModule",{value:!0}),Rr.camelCase=void 0;var Dm=/^--[a-zA-Z0-9_-]+$/,Fm=/-([a-z])/g,Lm=/^[^-]+$/,Bm=/^-(webkit|moz|ms|o|khtml)-/,Nm=/^-(ms)-/,Um=function(e){return!e||Lm.test(e)||Dm.test(e)},Hm=function(e,t){return t.toUpperCase()},Ql=function(e,t){return"".concat(t,"-")},Wm=function(e,t){return t===void 0&&(t={}),Um(e)?e:(e=e.toLowerCase(),t.reactCompat?e=e.replace(Nm,Ql):e=e.replace(Bm,Ql),e.replace(Fm,Hm))};Rr.camelCase=Wm;var qm=jt&&jt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}},Vm=qm(Wi),Ym=Rr;function qi(e,t){var n={};return!e||typeof e!="string"||(0,Vm.default)(e,function(r,i){r&&i&&(n[(0,Ym.camelCase)(r,t)]=i)}),n}qi.default=qi;var Gm=qi;const Km=Gr(Gm),Zl=es("end"),Vi=es("start");function es(e){return t;function t(n){const r=n&&n.position&&n.position[e]||{};if(typeof r.line=="number"&&r.line>0&&typeof r.column=="number"&&r.column>0)return{line:r.line,column:r.column,offset:typeof r.offset=="number"&&r.offset>-1?r.offset:void 0}}}function Xm(e){const t=Vi(e),n=Zl(e);if(t&&n)return{start:t,end:n}}function Ln(e){return!e||typeof e!="object"?"":"position"in e||"type"in e?ts(e.position):"start"in e||"end"in e?ts(e):"line"in e||"column"in e?Yi(e):""}function Yi(e){return ns(e&&e.line)+":"+ns(e&&e.column)}function ts(e){return Yi(e&&e.start)+"-"+Yi(e&&e.end)}function ns(e){return e&&typeof e=="number"?e:1}class Ae extends Error{constructor(t,n,r){super(),typeof n=="string"&&(r=n,n=void 0);let i="",o={},a=!1;if(n&&("line"in n&&"column"in n?o={place:n}:"start"in n&&"end"in n?o={place:n}:"type"in n?o={ancestors:[n],place:n.position}:o={...n}),typeof t=="string"?i=t:!o.cause&&t&&(a=!0,i=t.message,o.cause=t),!o.ruleId&&!o.source&&typeof r=="string"){const s=r.indexOf(":");s===-1?o.ruleId=r:(o.source=r.slice(0,s),o.ruleId=r.slice(s+1))}if(!o.place&&o.ancestors&&o.ancestors){const s=o.ancestors[o.ancestors.length-1];s&&(o.place=s.position)}const l=o.place&&"start"in o.place?o.place.start:o.place;this.ancestors=o.ancestors||void 0,this.cause=o.cause||void 0,this.column=l?l.column:void 0,this.fatal=void 0,this.file="",this.message=i,this.line=l?l.line:void 0,this.name=Ln(o.place)||"1:1",this.place=o.place||void 0,this.reason=this.message,this.ruleId=o.ruleId||void 0,this.source=o.source||void 0,this.stack=a&&o.cause&&typeof o.cause.stack=="string"?o.cause.stack:"",this.actual=void 0,this.expected=void 0,this.note=void 0,this.url=void 0}}Ae.prototype.file="",Ae.prototype.name="",Ae.prototype.reason="",Ae.prototype.message="",Ae.prototype.stack="",Ae.prototype.column=void 0,Ae.prototype.line=void 0,Ae.prototype.ancestors=void 0,Ae.prototype.cause=void 0,Ae.prototype.fatal=void 0,Ae.prototype.place=void 0,Ae.prototype.ruleId=void 0,Ae.prototype.source=void 0;const Gi={}.hasOwnProperty,Jm=new Map,Qm=/[A-Z]/g,Zm=new Set(["table","tbody","thead","tfoot","tr"]),eg=new Set(["td","th"]),rs="https://github.com/syntax-tree/hast-util-to-jsx-runtime";function tg(e,t){if(!t||t.Fragment===void 0)throw new TypeError("Expected `Fragment` in options");const n=t.filePath||void 0;let r;if(t.development){if(typeof t.jsxDEV!="function")throw new TypeError("Expected `jsxDEV` in options when `development: true`");r=ug(n,t.jsxDEV)}else{if(typeof t.jsx!="function")throw new TypeError("Expected `jsx` in production options");if(typeof t.jsxs!="function")throw new TypeError("Expected `jsxs` in production options");r=sg(n,t.jsx,t.jsxs)}const i={Fragment:t.Fragment,ancestors:[],components:t.components||{},create:r,elementAttributeNameCase:t.elementAttributeNameCase||"react",evaluater:t.createEvaluater?t.createEvaluater():void 0,filePath:n,ignoreInvalidStyle:t.ignoreInvalidStyle||!1,passKeys:t.passKeys!==!1,passNode:t.passNode||!1,schema:t.space==="svg"?Hi:vm,stylePropertyNameCase:t.stylePropertyNameCase||"dom",tableCellAlignToStyle:t.tableCellAlignToStyle!==!1},o=is(i,e,void 0);return o&&typeof o!="string"?o:i.create(e,i.Fragment,{children:o||void 0},void 0)}function is(e,t,n){if(t.type==="element")return ng(e,t,n);if(t.type==="mdxFlowExpression"||t.type==="mdxTextExpression")return rg(e,t);if(t.type==="mdxJsxFlowElement"||t.type==="mdxJsxTextElement")return og(e,t,n);if(t.type==="mdxjsEsm")return ig(e,t);if(t.type==="root")return ag(e,t,n);if(t.type==="text")return lg(e,t)}function ng(e,t,n){const r=e.schema;let i=r;t.tagName.toLowerCase()==="svg"&&r.space==="html"&&(i=Hi,e.schema=i),e.ancestors.push(t);const o=as(e,t.tagName,!1),a=cg(e,t);let l=Xi(e,t);return Zm.has(t.tagName)&&(l=l.filter(function(s){return typeof s=="string"?!cm(s):!0})),os(e,a,o,t),Ki(a,l),e.ancestors.pop(),e.schema=r,e.create(t,o,a,n)}function rg(e,t){if(t.data&&t.data.estree&&e.evaluater){const r=t.data.estree.body[0];return r.type,e.evaluater.evaluateExpression(r.expression)}Bn(e,t.position)}function ig(e,t){if(t.data&&t.data.estree&&e.evaluater)return e.evaluater.evaluateProgram(t.data.estree);Bn(e,t.position)}function og(e,t,n){const r=e.schema;let i=r;t.name==="svg"&&r.space==="html"&&(i=Hi,e.schema=i),e.ancestors.push(t);const o=t.name===null?e.Fragment:as(e,t.name,!0),a=fg(e,t),l=Xi(e,t);return os(e,a,o,t),Ki(a,l),e.ancestors.pop(),e.schema=r,e.create(t,o,a,n)}function ag(e,t,n){const r={};return Ki(r,Xi(e,t)),e.create(t,e.Fragment,r,n)}function lg(e,t){return t.value}function os(e,t,n,r){typeof n!="string"&&n!==e.Fragment&&e.passNode&&(t.node=r)}function Ki(e,t){if(t.length>0){const n=t.length>1?t:t[0];n&&(e.children=n)}}function sg(e,t,n){return r;function r(i,o,a,l){const u=Array.isArray(a.children)?n:t;return l?u(o,a,l):u(o,a)}}function ug(e,t){return n;function n(r,i,o,a){const l=Array.isArray(o.children),s=Vi(r);return t(i,o,a,l,{columnNumber:s?s.column-1:void 0,fileName:e,lineNumber:s?s.line:void 0},void 0)}}function cg(e,t){const n={};let r,i;for(i in t.properties)if(i!=="children"&&Gi.call(t.properties,i)){const o=pg(e,i,t.properties[i]);if(o){const[a,l]=o;e.tableCellAlignToStyle&&a==="align"&&typeof l=="string"&&eg.has(t.tagName)?r=l:n[a]=l}}if(r){const o=n.style||(n.style={});o[e.stylePropertyNameCase==="css"?"text-align":"textAlign"]=r}return n}function fg(e,t){const n={};for(const r of t.attributes)if(r.type==="mdxJsxExpressionAttribute")if(r.data&&r.data.estree&&e.evaluater){const o=r.data.estree.body[0];o.type;const a=o.expression;a.type;const l=a.properties[0];l.type,Object.assign(n,e.evaluater.evaluateExpression(l.argument))}else Bn(e,t.position);else{const i=r.name;let o;if(r.value&&typeof r.value=="object")if(r.value.data&&r.value.data.estree&&e.evaluater){const l=r.value.data.estree.body[0];l.type,o=e.evaluater.evaluateExpression(l.expression)}else Bn(e,t.position);else o=r.value===null?!0:r.value;n[i]=o}return n}function Xi(e,t){const n=[];let r=-1;const i=e.passKeys?new Map:Jm;for(;++r<t.children.length;){const o=t.children[r];let a;if(e.passKeys){const s=o.type==="element"?o.tagName:o.type==="mdxJsxFlowElement"||o.type==="mdxJsxTextElement"?o.name:void 0;if(s){const u=i.get(s)||0;a=s+"-"+u,i.set(s,u+1)}}const l=is(e,o,a);l!==void 0&&n.push(l)}return n}function pg(e,t,n){const r=ym(e.schema,t);if(!(n==null||typeof n=="number"&&Number.isNaN(n))){if(Array.isArray(n)&&(n=r.commaSeparated?om(n):km(n)),r.property==="style"){let i=typeof n=="object"?n:dg(e,String(n));return e.stylePropertyNameCase==="css"&&(i=hg(i)),["style",i]}return[e.elementAttributeNameCase==="react"&&r.space?hm[r.property]||r.property:r.attribute,n]}}function dg(e,t){try{return Km(t,{reactCompat:!0})}catch(n){if(e.ignoreInvalidStyle)return{};const r=n,i=new Ae("Cannot parse `style` attribute",{ancestors:e.ancestors,cause:r,ruleId:"style",source:"hast-util-to-jsx-runtime"});throw i.file=e.filePath||void 0,i.url=rs+"#cannot-parse-style-attribute",i}}function as(e,t,n){let r;if(!n)r={type:"Literal",value:t};else if(t.includes(".")){const i=t.split(".");let o=-1,a;for(;++o<i.length;){const l=Dl(i[o])?{type:"Identifier",name:i[o]}:{type:"Literal",value:i[o]};a=a?{type:"MemberExpression",object:a,property:l,computed:!!(o&&l.type==="Literal"),optional:!1}:l}r=a}else r=Dl(t)&&!/^[a-z]/.test(t)?{type:"Identifier",name:t}:{type:"Literal",value:t};if(r.type==="Literal"){const i=r.value;return Gi.call(e.components,i)?e.components[i]:i}if(e.evaluater)return e.evaluater.evaluateExpression(r);Bn(e)}function Bn(e,t){const n=new Ae("Cannot handle MDX estrees without `createEvaluater`",{ancestors:e.ancestors,place:t,ruleId:"mdx-estree",source:"hast-util-to-jsx-runtime"});throw n.file=e.filePath||void 0,n.url=rs+"#cannot-handle-mdx-estrees-without-createevaluater",n}function hg(e){const t={};let n;for(n in e)Gi.call(e,n)&&(t[mg(n)]=e[n]);return t}function mg(e){let t=e.replace(Qm,gg);return t.slice(0,3)==="ms-"&&(t="-"+t),t}function gg(e){return"-"+e.toLowerCase()}const Ji={action:["form"],cite:["blockquote","del","ins","q"],data:["object"],formAction:["button","input"],href:["a","area","base","link"],icon:["menuitem"],itemId:null,manifest:["html"],ping:["a","area"],poster:["video"],src:["audio","embed","iframe","img","input","script","source","track","video"]},yg={};function Qi(e,t){const n=yg,r=typeof n.includeImageAlt=="boolean"?n.includeImageAlt:!0,i=typeof n.includeHtml=="boolean"?n.includeHtml:!0;return ls(e,r,i)}function ls(e,t,n){if(xg(e)){if("value"in e)return e.type==="html"&&!n?"":e.value;if(t&&"alt"in e&&e.alt)return e.alt;if("children"in e)return ss(e.children,t,n)}return Array.isArray(e)?ss(e,t,n):""}function ss(e,t,n){const r=[];let i=-1;for(;++i<e.length;)r[i]=ls(e[i],t,n);return r.join("")}function xg(e){return!!(e&&typeof e=="object")}const us=document.createElement("i");function Zi(e){const t="&"+e+";";us.innerHTML=t;const n=us.textContent;return n.charCodeAt(n.length-1)===59&&e!=="semi"||n===t?!1:n}function Ve(e,t,n,r){const i=e.length;let o=0,a;if(t<0?t=-t>i?0:i+t:t=t>i?i:t,n=n>0?n:0,r.length<1e4)a=Array.from(r),a.unshift(t,n),e.splice(...a);else for(n&&e.splice(t,n);o<r.length;)a=r.slice(o,o+1e4),a.unshift(t,0),e.splice(...a),o+=1e4,t+=1e4}function tt(e,t){return e.length>0?(Ve(e,e.length,0,t),e):t}const cs={}.hasOwnProperty;function fs(e){const t={};let n=-1;for(;++n<e.length;)bg(t,e[n]);return t}function bg(e,t){let n;for(n in t){const i=(cs.call(e,n)?e[n]:void 0)||(e[n]={}),o=t[n];let a;if(o)for(a in o){cs.call(i,a)||(i[a]=[]);const l=o[a];vg(i[a],Array.isArray(l)?l:l?[l]:[])}}}function vg(e,t){let n=-1;const r=[];for(;++n<t.length;)(t[n].add==="after"?e:r).push(t[n]);Ve(e,0,0,r)}function ps(e,t){const n=Number.parseInt(e,t);return n<9||n===11||n>13&&n<32||n>126&&n<160||n>55295&&n<57344||n>64975&&n<65008||(n&65535)===65535||(n&65535)===65534||n>1114111?"�":String.fromCodePoint(n)}function it(e){return e.replace(/[\t\n\r ]+/g," ").replace(/^ | $/g,"").toLowerCase().toUpperCase()}const je=Ct(/[A-Za-z]/),Oe=Ct(/[\dA-Za-z]/),kg=Ct(/[#-'*+\--9=?A-Z^-~]/);function Pr(e){return e!==null&&(e<32||e===127)}const eo=Ct(/\d/),wg=Ct(/[\dA-Fa-f]/),Sg=Ct(/[!-/:-@[-`{-~]/);function U(e){return e!==null&&e<-2}function de(e){return e!==null&&(e<0||e===32)}function ee(e){return e===-2||e===-1||e===32}const Ir=Ct(new RegExp("\\p{P}|\\p{S}","u")),Dt=Ct(/\s/);function Ct(e){return t;function t(n){return n!==null&&n>-1&&e.test(String.fromCharCode(n))}}function cn(e){const t=[];let n=-1,r=0,i=0;for(;++n<e.length;){const o=e.charCodeAt(n);let a="";if(o===37&&Oe(e.charCodeAt(n+1))&&Oe(e.charCodeAt(n+2)))i=2;else if(o<128)/[!#$&-;=?-Z_a-z~]/.test(String.fromCharCode(o))||(a=String.fromCharCode(o));else if(o>55295&&o<57344){const l=e.charCodeAt(n+1);o<56320&&l>56319&&l<57344?(a=String.fromCharCode(o,l),i=1):a="�"}else a=String.fromCharCode(o);a&&(t.push(e.slice(r,n),encodeURIComponent(a)),r=n+i+1,a=""),i&&(n+=i,i=0)}return t.join("")+e.slice(r)}function ne(e,t,n,r){const i=r?r-1:Number.POSITIVE_INFINITY;let o=0;return a;function a(s){return ee(s)?(e.enter(n),l(s)):t(s)}function l(s){return ee(s)&&o++<i?(e.consume(s),l):(e.exit(n),t(s))}}const _g={tokenize:Cg};function Cg(e){const t=e.attempt(this.parser.constructs.contentInitial,r,i);let n;return t;function r(l){if(l===null){e.consume(l);return}return e.enter("lineEnding"),e.consume(l),e.exit("lineEnding"),ne(e,t,"linePrefix")}function i(l){return e.enter("paragraph"),o(l)}function o(l){const s=e.enter("chunkText",{contentType:"text",previous:n});return n&&(n.next=s),n=s,a(l)}function a(l){if(l===null){e.exit("chunkText"),e.exit("paragraph"),e.consume(l);return}return U(l)?(e.consume(l),e.exit("chunkText"),o):(e.consume(l),a)}}const Eg={tokenize:Tg},ds={tokenize:Rg};function Tg(e){const t=this,n=[];let r=0,i,o,a;return l;function l(T){if(r<n.length){const M=n[r];return t.containerState=M[1],e.attempt(M[0].continuation,s,u)(T)}return u(T)}function s(T){if(r++,t.containerState._closeFlow){t.containerState._closeFlow=void 0,i&&C();const M=t.events.length;let D=M,w;for(;D--;)if(t.events[D][0]==="exit"&&t.events[D][1].type==="chunkFlow"){w=t.events[D][1].end;break}b(r);let O=M;for(;O<t.events.length;)t.events[O][1].end={...w},O++;return Ve(t.events,D+1,0,t.events.slice(M)),t.events.length=O,u(T)}return l(T)}function u(T){if(r===n.length){if(!i)return d(T);if(i.currentConstruct&&i.currentConstruct.concrete)return m(T);t.interrupt=!!(i.currentConstruct&&!i._gfmTableDynamicInterruptHack)}return t.containerState={},e.check(ds,f,c)(T)}function f(T){return i&&C(),b(r),d(T)}function c(T){return t.parser.lazy[t.now().line]=r!==n.length,a=t.now().offset,m(T)}function d(T){return t.containerState={},e.attempt(ds,p,m)(T)}function p(T){return r++,n.push([t.currentConstruct,t.containerState]),d(T)}function m(T){if(T===null){i&&C(),b(0),e.consume(T);return}return i=i||t.parser.flow(t.now()),e.enter("chunkFlow",{_tokenizer:i,contentType:"flow",previous:o}),h(T)}function h(T){if(T===null){k(e.exit("chunkFlow"),!0),b(0),e.consume(T);return}return U(T)?(e.consume(T),k(e.exit("chunkFlow")),r=0,t.interrupt=void 0,l):(e.consume(T),h)}function k(T,M){const D=t.sliceStream(T);if(M&&D.push(null),T.previous=o,o&&(o.next=T),o=T,i.defineSkip(T.start),i.write(D),t.parser.lazy[T.start.line]){let w=i.events.length;for(;w--;)if(i.events[w][1].start.offset<a&&(!i.events[w][1].end||i.events[w][1].end.offset>a))return;const O=t.events.length;let Q=O,H,S;for(;Q--;)if(t.events[Q][0]==="exit"&&t.events[Q][1].type==="chunkFlow"){if(H){S=t.events[Q][1].end;break}H=!0}for(b(r),w=O;w<t.events.length;)t.events[w][1].end={...S},w++;Ve(t.events,Q+1,0,t.events.slice(O)),t.events.length=w}}function b(T){let M=n.length;for(;M-- >T;){const D=n[M];t.containerState=D[1],D[0].exit.call(t,e)}n.length=T}function C(){i.write([null]),o=void 0,i=void 0,t.containerState._closeFlow=void 0}}function Rg(e,t,n){return ne(e,e.attempt(this.parser.constructs.document,t,n),"linePrefix",this.parser.constructs.disable.null.includes("codeIndented")?void 0:4)}function fn(e){if(e===null||de(e)||Dt(e))return 1;if(Ir(e))return 2}function Ar(e,t,n){const r=[];let i=-1;for(;++i<e.length;){const o=e[i].resolveAll;o&&!r.includes(o)&&(t=o(t,n),r.push(o))}return t}const to={name:"attention",resolveAll:Pg,tokenize:Ig};function Pg(e,t){let n=-1,r,i,o,a,l,s,u,f;for(;++n<e.length;)if(e[n][0]==="enter"&&e[n][1].type==="attentionSequence"&&e[n][1]._close){for(r=n;r--;)if(e[r][0]==="exit"&&e[r][1].type==="attentionSequence"&&e[r][1]._open&&t.sliceSerialize(e[r][1]).charCodeAt(0)===t.sliceSerialize(e[n][1]).charCodeAt(0)){if((e[r][1]._close||e[n][1]._open)&&(e[n][1].end.offset-e[n][1].start.offset)%3&&!((e[r][1].end.offset-e[r][1].start.offset+e[n][1].end.offset-e[n][1].start.offset)%3))continue;s=e[r][1].end.offset-e[r][1].start.offset>1&&e[n][1].end.offset-e[n][1].start.offset>1?2:1;const c={...e[r][1].end},d={...e[n][1].start};hs(c,-s),hs(d,s),a={type:s>1?"strongSequence":"emphasisSequence",start:c,end:{...e[r][1].end}},l={type:s>1?"strongSequence":"emphasisSequence",start:{...e[n][1].start},end:d},o={type:s>1?"strongText":"emphasisText",start:{...e[r][1].end},end:{...e[n][1].start}},i={type:s>1?"strong":"emphasis",start:{...a.start},end:{...l.end}},e[r][1].end={...a.start},e[n][1].start={...l.end},u=[],e[r][1].end.offset-e[r][1].start.offset&&(u=tt(u,[["enter",e[r][1],t],["exit",e[r][1],t]])),u=tt(u,[["enter",i,t],["enter",a,t],["exit",a,t],["enter",o,t]]),u=tt(u,Ar(t.parser.constructs.insideSpan.null,e.slice(r+1,n),t)),u=tt(u,[["exit",o,t],["enter",l,t],["exit",l,t],["exit",i,t]]),e[n][1].end.offset-e[n][1].start.offset?(f=2,u=tt(u,[["enter",e[n][1],t],["exit",e[n][1],t]])):f=0,Ve(e,r-1,n-r+3,u),n=r+u.length-f-2;break}}for(n=-1;++n<e.length;)e[n][1].type==="attentionSequence"&&(e[n][1].type="data");return e}function Ig(e,t){const n=this.parser.constructs.attentionMarkers.null,r=this.previous,i=fn(r);let o;return a;function a(s){return o=s,e.enter("attentionSequence"),l(s)}function l(s){if(s===o)return e.consume(s),l;const u=e.exit("attentionSequence"),f=fn(s),c=!f||f===2&&i||n.includes(s),d=!i||i===2&&f||n.includes(r);return u._open=!!(o===42?c:c&&(i||!d)),u._close=!!(o===42?d:d&&(f||!c)),t(s)}}function hs(e,t){e.column+=t,e.offset+=t,e._bufferIndex+=t}const Ag={name:"autolink",tokenize:Og};function Og(e,t,n){let r=0;return i;function i(p){return e.enter("autolink"),e.enter("autolinkMarker"),e.consume(p),e.exit("autolinkMarker"),e.enter("autolinkProtocol"),o}function o(p){return je(p)?(e.consume(p),a):p===64?n(p):u(p)}function a(p){return p===43||p===45||p===46||Oe(p)?(r=1,l(p)):u(p)}function l(p){return p===58?(e.consume(p),r=0,s):(p===43||p===45||p===46||Oe(p))&&r++<32?(e.consume(p),l):(r=0,u(p))}function s(p){return p===62?(e.exit("autolinkProtocol"),e.enter("autolinkMarker"),e.consume(p),e.exit("autolinkMarker"),e.exit("autolink"),t):p===null||p===32||p===60||Pr(p)?n(p):(e.consume(p),s)}function u(p){return p===64?(e.consume(p),f):kg(p)?(e.consume(p),u):n(p)}function f(p){return Oe(p)?c(p):n(p)}function c(p){return p===46?(e.consume(p),r=0,f):p===62?(e.exit("autolinkProtocol").type="autolinkEmail",e.enter("autolinkMarker"),e.consume(p),e.exit("autolinkMarker"),e.exit("autolink"),t):d(p)}function d(p){if((p===45||Oe(p))&&r++<63){const m=p===45?d:c;return e.consume(p),m}return n(p)}}const Nn={partial:!0,tokenize:jg};function jg(e,t,n){return r;function r(o){return ee(o)?ne(e,i,"linePrefix")(o):i(o)}function i(o){return o===null||U(o)?t(o):n(o)}}const ms={continuation:{tokenize:Mg},exit:zg,name:"blockQuote",tokenize:$g};function $g(e,t,n){const r=this;return i;function i(a){if(a===62){const l=r.containerState;return l.open||(e.enter("blockQuote",{_container:!0}),l.open=!0),e.enter("blockQuotePrefix"),e.enter("blockQuoteMarker"),e.consume(a),e.exit("blockQuoteMarker"),o}return n(a)}function o(a){return ee(a)?(e.enter("blockQuotePrefixWhitespace"),e.consume(a),e.exit("blockQuotePrefixWhitespace"),e.exit("blockQuotePrefix"),t):(e.exit("blockQuotePrefix"),t(a))}}function Mg(e,t,n){const r=this;return i;function i(a){return ee(a)?ne(e,o,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(a):o(a)}function o(a){return e.attempt(ms,t,n)(a)}}function zg(e){e.exit("blockQuote")}const gs={name:"characterEscape",tokenize:Dg};function Dg(e,t,n){return r;function r(o){return e.enter("characterEscape"),e.enter("escapeMarker"),e.consume(o),e.exit("escapeMarker"),i}function i(o){return Sg(o)?(e.enter("characterEscapeValue"),e.consume(o),e.exit("characterEscapeValue"),e.exit("characterEscape"),t):n(o)}}const ys={name:"characterReference",tokenize:Fg};function Fg(e,t,n){const r=this;let i=0,o,a;return l;function l(c){return e.enter("characterReference"),e.enter("characterReferenceMarker"),e.consume(c),e.exit("characterReferenceMarker"),s}function s(c){return c===35?(e.enter("characterReferenceMarkerNumeric"),e.consume(c),e.exit("characterReferenceMarkerNumeric"),u):(e.enter("characterReferenceValue"),o=31,a=Oe,f(c))}function u(c){return c===88||c===120?(e.enter("characterReferenceMarkerHexadecimal"),e.consume(c),e.exit("characterReferenceMarkerHexadecimal"),e.enter("characterReferenceValue"),o=6,a=wg,f):(e.enter("characterReferenceValue"),o=7,a=eo,f(c))}function f(c){if(c===59&&i){const d=e.exit("characterReferenceValue");return a===Oe&&!Zi(r.sliceSerialize(d))?n(c):(e.enter("characterReferenceMarker"),e.consume(c),e.exit("characterReferenceMarker"),e.exit("characterReference"),t)}return a(c)&&i++<o?(e.consume(c),f):n(c)}}const xs={partial:!0,tokenize:Bg},bs={concrete:!0,name:"codeFenced",tokenize:Lg};function Lg(e,t,n){const r=this,i={partial:!0,tokenize:D};let o=0,a=0,l;return s;function s(w){return u(w)}function u(w){const O=r.events[r.events.length-1];return o=O&&O[1].type==="linePrefix"?O[2].sliceSerialize(O[1],!0).length:0,l=w,e.enter("codeFenced"),e.enter("codeFencedFence"),e.enter("codeFencedFenceSequence"),f(w)}function f(w){return w===l?(a++,e.consume(w),f):a<3?n(w):(e.exit("codeFencedFenceSequence"),ee(w)?ne(e,c,"whitespace")(w):c(w))}function c(w){return w===null||U(w)?(e.exit("codeFencedFence"),r.interrupt?t(w):e.check(xs,h,M)(w)):(e.enter("codeFencedFenceInfo"),e.enter("chunkString",{contentType:"string"}),d(w))}function d(w){return w===null||U(w)?(e.exit("chunkString"),e.exit("codeFencedFenceInfo"),c(w)):ee(w)?(e.exit("chunkString"),e.exit("codeFencedFenceInfo"),ne(e,p,"whitespace")(w)):w===96&&w===l?n(w):(e.consume(w),d)}function p(w){return w===null||U(w)?c(w):(e.enter("codeFencedFenceMeta"),e.enter("chunkString",{contentType:"string"}),m(w))}function m(w){return w===null||U(w)?(e.exit("chunkString"),e.exit("codeFencedFenceMeta"),c(w)):w===96&&w===l?n(w):(e.consume(w),m)}function h(w){return e.attempt(i,M,k)(w)}function k(w){return e.enter("lineEnding"),e.consume(w),e.exit("lineEnding"),b}function b(w){return o>0&&ee(w)?ne(e,C,"linePrefix",o+1)(w):C(w)}function C(w){return w===null||U(w)?e.check(xs,h,M)(w):(e.enter("codeFlowValue"),T(w))}function T(w){return w===null||U(w)?(e.exit("codeFlowValue"),C(w)):(e.consume(w),T)}function M(w){return e.exit("codeFenced"),t(w)}function D(w,O,Q){let H=0;return S;function S(j){return w.enter("lineEnding"),w.consume(j),w.exit("lineEnding"),z}function z(j){return w.enter("codeFencedFence"),ee(j)?ne(w,$,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(j):$(j)}function $(j){return j===l?(w.enter("codeFencedFenceSequence"),_(j)):Q(j)}function _(j){return j===l?(H++,w.consume(j),_):H>=a?(w.exit("codeFencedFenceSequence"),ee(j)?ne(w,R,"whitespace")(j):R(j)):Q(j)}function R(j){return j===null||U(j)?(w.exit("codeFencedFence"),O(j)):Q(j)}}}function Bg(e,t,n){const r=this;return i;function i(a){return a===null?n(a):(e.enter("lineEnding"),e.consume(a),e.exit("lineEnding"),o)}function o(a){return r.parser.lazy[r.now().line]?n(a):t(a)}}const no={name:"codeIndented",tokenize:Ug},Ng={partial:!0,tokenize:Hg};function Ug(e,t,n){const r=this;return i;function i(u){return e.enter("codeIndented"),ne(e,o,"linePrefix",5)(u)}function o(u){const f=r.events[r.events.length-1];return f&&f[1].type==="linePrefix"&&f[2].sliceSerialize(f[1],!0).length>=4?a(u):n(u)}function a(u){return u===null?s(u):U(u)?e.attempt(Ng,a,s)(u):(e.enter("codeFlowValue"),l(u))}function l(u){return u===null||U(u)?(e.exit("codeFlowValue"),a(u)):(e.consume(u),l)}function s(u){return e.exit("codeIndented"),t(u)}}function Hg(e,t,n){const r=this;return i;function i(a){return r.parser.lazy[r.now().line]?n(a):U(a)?(e.enter("lineEnding"),e.consume(a),e.exit("lineEnding"),i):ne(e,o,"linePrefix",5)(a)}function o(a){const l=r.events[r.events.length-1];return l&&l[1].type==="linePrefix"&&l[2].sliceSerialize(l[1],!0).length>=4?t(a):U(a)?i(a):n(a)}}const Wg={name:"codeText",previous:Vg,resolve:qg,tokenize:Yg};function qg(e){let t=e.length-4,n=3,r,i;if((e[n][1].type==="lineEnding"||e[n][1].type==="space")&&(e[t][1].type==="lineEnding"||e[t][1].type==="space")){for(r=n;++r<t;)if(e[r][1].type==="codeTextData"){e[n][1].type="codeTextPadding",e[t][1].type="codeTextPadding",n+=2,t-=2;break}}for(r=n-1,t++;++r<=t;)i===void 0?r!==t&&e[r][1].type!=="lineEnding"&&(i=r):(r===t||e[r][1].type==="lineEnding")&&(e[i][1].type="codeTextData",r!==i+2&&(e[i][1].end=e[r-1][1].end,e.splice(i+2,r-i-2),t-=r-i-2,r=i+2),i=void 0);return e}function Vg(e){return e!==96||this.events[this.events.length-1][1].type==="characterEscape"}function Yg(e,t,n){let r=0,i,o;return a;function a(c){return e.enter("codeText"),e.enter("codeTextSequence"),l(c)}function l(c){return c===96?(e.consume(c),r++,l):(e.exit("codeTextSequence"),s(c))}function s(c){return c===null?n(c):c===32?(e.enter("space"),e.consume(c),e.exit("space"),s):c===96?(o=e.enter("codeTextSequence"),i=0,f(c)):U(c)?(e.enter("lineEnding"),e.consume(c),e.exit("lineEnding"),s):(e.enter("codeTextData"),u(c))}function u(c){return c===null||c===32||c===96||U(c)?(e.exit("codeTextData"),s(c)):(e.consume(c),u)}function f(c){return c===96?(e.consume(c),i++,f):i===r?(e.exit("codeTextSequence"),e.exit("codeText"),t(c)):(o.type="codeTextData",u(c))}}class Gg{constructor(t){this.left=t?[...t]:[],this.right=[]}get(t){if(t<0||t>=this.left.length+this.right.length)throw new RangeError("Cannot access index `"+t+"` in a splice buffer of size `"+(this.left.length+this.right.length)+"`");return t<this.left.length?this.left[t]:this.right[this.right.length-t+this.left.length-1]}get length(){return this.left.length+this.right.length}shift(){return this.setCursor(0),this.right.pop()}slice(t,n){const r=n??Number.POSITIVE_INFINITY;return r<this.left.length?this.left.slice(t,r):t>this.left.length?this.right.slice(this.right.length-r+this.left.length,this.right.length-t+this.left.length).reverse():this.left.slice(t).concat(this.right.slice(this.right.length-r+this.left.length).reverse())}splice(t,n,r){const i=n||0;this.setCursor(Math.trunc(t));const o=this.right.splice(this.right.length-i,Number.POSITIVE_INFINITY);return r&&Un(this.left,r),o.reverse()}pop(){return this.setCursor(Number.POSITIVE_INFINITY),this.left.pop()}push(t){this.setCursor(Number.POSITIVE_INFINITY),this.left.push(t)}pushMany(t){this.setCursor(Number.POSITIVE_INFINITY),Un(this.left,t)}unshift(t){this.setCursor(0),this.right.push(t)}unshiftMany(t){this.setCursor(0),Un(this.right,t.reverse())}setCursor(t){if(!(t===this.left.length||t>this.left.length&&this.right.length===0||t<0&&this.left.length===0))if(t<this.left.length){const n=this.left.splice(t,Number.POSITIVE_INFINITY);Un(this.right,n.reverse())}else{const n=this.right.splice(this.left.length+this.right.length-t,Number.POSITIVE_INFINITY);Un(this.left,n.reverse())}}}function Un(e,t){let n=0;if(t.length<1e4)e.push(...t);else for(;n<t.length;)e.push(...t.slice(n,n+1e4)),n+=1e4}function vs(e){const t={};let n=-1,r,i,o,a,l,s,u;const f=new Gg(e);for(;++n<f.length;){for(;n in t;)n=t[n];if(r=f.get(n),n&&r[1].type==="chunkFlow"&&f.get(n-1)[1].type==="listItemPrefix"&&(s=r[1]._tokenizer.events,o=0,o<s.length&&s[o][1].type==="lineEndingBlank"&&(o+=2),o<s.length&&s[o][1].type==="content"))for(;++o<s.length&&s[o][1].type!=="content";)s[o][1].type==="chunkText"&&(s[o][1]._isInFirstContentOfListItem=!0,o++);if(r[0]==="enter")r[1].contentType&&(Object.assign(t,Kg(f,n)),n=t[n],u=!0);else if(r[1]._container){for(o=n,i=void 0;o--;)if(a=f.get(o),a[1].type==="lineEnding"||a[1].type==="lineEndingBlank")a[0]==="enter"&&(i&&(f.get(i)[1].type="lineEndingBlank"),a[1].type="lineEnding",i=o);else if(!(a[1].type==="linePrefix"||a[1].type==="listItemIndent"))break;i&&(r[1].end={...f.get(i)[1].start},l=f.slice(i,n),l.unshift(r),f.splice(i,n-i+1,l))}}return Ve(e,0,Number.POSITIVE_INFINITY,f.slice(0)),!u}function Kg(e,t){const n=e.get(t)[1],r=e.get(t)[2];let i=t-1;const o=[];let a=n._tokenizer;a||(a=r.parser[n.contentType](n.start),n._contentTypeTextTrailing&&(a._contentTypeTextTrailing=!0));const l=a.events,s=[],u={};let f,c,d=-1,p=n,m=0,h=0;const k=[h];for(;p;){for(;e.get(++i)[1]!==p;);o.push(i),p._tokenizer||(f=r.sliceStream(p),p.next||f.push(null),c&&a.defineSkip(p.start),p._isInFirstContentOfListItem&&(a._gfmTasklistFirstContentOfListItem=!0),a.write(f),p._isInFirstContentOfListItem&&(a._gfmTasklistFirstContentOfListItem=void 0)),c=p,p=p.next}for(p=n;++d<l.length;)l[d][0]==="exit"&&l[d-1][0]==="enter"&&l[d][1].type===l[d-1][1].type&&l[d][1].start.line!==l[d][1].end.line&&(h=d+1,k.push(h),p._tokenizer=void 0,p.previous=void 0,p=p.next);for(a.events=[],p?(p._tokenizer=void 0,p.previous=void 0):k.pop(),d=k.length;d--;){const b=l.slice(k[d],k[d+1]),C=o.pop();s.push([C,C+b.length-1]),e.splice(C,2,b)}for(s.reverse(),d=-1;++d<s.length;)u[m+s[d][0]]=m+s[d][1],m+=s[d][1]-s[d][0]-1;return u}const Xg={resolve:Qg,tokenize:Zg},Jg={partial:!0,tokenize:ey};function Qg(e){return vs(e),e}function Zg(e,t){let n;return r;function r(l){return e.enter("content"),n=e.enter("chunkContent",{contentType:"content"}),i(l)}function i(l){return l===null?o(l):U(l)?e.check(Jg,a,o)(l):(e.consume(l),i)}function o(l){return e.exit("chunkContent"),e.exit("content"),t(l)}function a(l){return e.consume(l),e.exit("chunkContent"),n.next=e.enter("chunkContent",{contentType:"content",previous:n}),n=n.next,i}}function ey(e,t,n){const r=this;return i;function i(a){return e.exit("chunkContent"),e.enter("lineEnding"),e.consume(a),e.exit("lineEnding"),ne(e,o,"linePrefix")}function o(a){if(a===null||U(a))return n(a);const l=r.events[r.events.length-1];return!r.parser.constructs.disable.null.includes("codeIndented")&&l&&l[1].type==="linePrefix"&&l[2].sliceSerialize(l[1],!0).length>=4?t(a):e.interrupt(r.parser.constructs.flow,n,t)(a)}}function ks(e,t,n,r,i,o,a,l,s){const u=s||Number.POSITIVE_INFINITY;let f=0;return c;function c(b){return b===60?(e.enter(r),e.enter(i),e.enter(o),e.consume(b),e.exit(o),d):b===null||b===32||b===41||Pr(b)?n(b):(e.enter(r),e.enter(a),e.enter(l),e.enter("chunkString",{contentType:"string"}),h(b))}function d(b){return b===62?(e.enter(o),e.consume(b),e.exit(o),e.exit(i),e.exit(r),t):(e.enter(l),e.enter("chunkString",{contentType:"string"}),p(b))}function p(b){return b===62?(e.exit("chunkString"),e.exit(l),d(b)):b===null||b===60||U(b)?n(b):(e.consume(b),b===92?m:p)}function m(b){return b===60||b===62||b===92?(e.consume(b),p):p(b)}function h(b){return!f&&(b===null||b===41||de(b))?(e.exit("chunkString"),e.exit(l),e.exit(a),e.exit(r),t(b)):f<u&&b===40?(e.consume(b),f++,h):b===41?(e.consume(b),f--,h):b===null||b===32||b===40||Pr(b)?n(b):(e.consume(b),b===92?k:h)}function k(b){return b===40||b===41||b===92?(e.consume(b),h):h(b)}}function ws(e,t,n,r,i,o){const a=this;let l=0,s;return u;function u(p){return e.enter(r),e.enter(i),e.consume(p),e.exit(i),e.enter(o),f}function f(p){return l>999||p===null||p===91||p===93&&!s||p===94&&!l&&"_hiddenFootnoteSupport"in a.parser.constructs?n(p):p===93?(e.exit(o),e.enter(i),e.consume(p),e.exit(i),e.exit(r),t):U(p)?(e.enter("lineEnding"),e.consume(p),e.exit("lineEnding"),f):(e.enter("chunkString",{contentType:"string"}),c(p))}function c(p){return p===null||p===91||p===93||U(p)||l++>999?(e.exit("chunkString"),f(p)):(e.consume(p),s||(s=!ee(p)),p===92?d:c)}function d(p){return p===91||p===92||p===93?(e.consume(p),l++,c):c(p)}}function Ss(e,t,n,r,i,o){let a;return l;function l(d){return d===34||d===39||d===40?(e.enter(r),e.enter(i),e.consume(d),e.exit(i),a=d===40?41:d,s):n(d)}function s(d){return d===a?(e.enter(i),e.consume(d),e.exit(i),e.exit(r),t):(e.enter(o),u(d))}function u(d){return d===a?(e.exit(o),s(a)):d===null?n(d):U(d)?(e.enter("lineEnding"),e.consume(d),e.exit("lineEnding"),ne(e,u,"linePrefix")):(e.enter("chunkString",{contentType:"string"}),f(d))}function f(d){return d===a||d===null||U(d)?(e.exit("chunkString"),u(d)):(e.consume(d),d===92?c:f)}function c(d){return d===a||d===92?(e.consume(d),f):f(d)}}function Hn(e,t){let n;return r;function r(i){return U(i)?(e.enter("lineEnding"),e.consume(i),e.exit("lineEnding"),n=!0,r):ee(i)?ne(e,r,n?"linePrefix":"lineSuffix")(i):t(i)}}const ty={name:"definition",tokenize:ry},ny={partial:!0,tokenize:iy};function ry(e,t,n){const r=this;let i;return o;function o(p){return e.enter("definition"),a(p)}function a(p){return ws.call(r,e,l,n,"definitionLabel","definitionLabelMarker","definitionLabelString")(p)}function l(p){return i=it(r.sliceSerialize(r.events[r.events.length-1][1]).slice(1,-1)),p===58?(e.enter("definitionMarker"),e.consume(p),e.exit("definitionMarker"),s):n(p)}function s(p){return de(p)?Hn(e,u)(p):u(p)}function u(p){return ks(e,f,n,"definitionDestination","definitionDestinationLiteral","definitionDestinationLiteralMarker","definitionDestinationRaw","definitionDestinationString")(p)}function f(p){return e.attempt(ny,c,c)(p)}function c(p){return ee(p)?ne(e,d,"whitespace")(p):d(p)}function d(p){return p===null||U(p)?(e.exit("definition"),r.parser.defined.push(i),t(p)):n(p)}}function iy(e,t,n){return r;function r(l){return de(l)?Hn(e,i)(l):n(l)}function i(l){return Ss(e,o,n,"definitionTitle","definitionTitleMarker","definitionTitleString")(l)}function o(l){return ee(l)?ne(e,a,"whitespace")(l):a(l)}function a(l){return l===null||U(l)?t(l):n(l)}}const oy={name:"hardBreakEscape",tokenize:ay};function ay(e,t,n){return r;function r(o){return e.enter("hardBreakEscape"),e.consume(o),i}function i(o){return U(o)?(e.exit("hardBreakEscape"),t(o)):n(o)}}const ly={name:"headingAtx",resolve:sy,tokenize:uy};function sy(e,t){let n=e.length-2,r=3,i,o;return e[r][1].type==="whitespace"&&(r+=2),n-2>r&&e[n][1].type==="whitespace"&&(n-=2),e[n][1].type==="atxHeadingSequence"&&(r===n-1||n-4>r&&e[n-2][1].type==="whitespace")&&(n-=r+1===n?2:4),n>r&&(i={type:"atxHeadingText",start:e[r][1].start,end:e[n][1].end},o={type:"chunkText",start:e[r][1].start,end:e[n][1].end,contentType:"text"},Ve(e,r,n-r+1,[["enter",i,t],["enter",o,t],["exit",o,t],["exit",i,t]])),e}function uy(e,t,n){let r=0;return i;function i(f){return e.enter("atxHeading"),o(f)}function o(f){return e.enter("atxHeadingSequence"),a(f)}function a(f){return f===35&&r++<6?(e.consume(f),a):f===null||de(f)?(e.exit("atxHeadingSequence"),l(f)):n(f)}function l(f){return f===35?(e.enter("atxHeadingSequence"),s(f)):f===null||U(f)?(e.exit("atxHeading"),t(f)):ee(f)?ne(e,l,"whitespace")(f):(e.enter("atxHeadingText"),u(f))}function s(f){return f===35?(e.consume(f),s):(e.exit("atxHeadingSequence"),l(f))}function u(f){return f===null||f===35||de(f)?(e.exit("atxHeadingText"),l(f)):(e.consume(f),u)}}const cy=["address","article","aside","base","basefont","blockquote","body","caption","center","col","colgroup","dd","details","dialog","dir","div","dl","dt","fieldset","figcaption","figure","footer","form","frame","frameset","h1","h2","h3","h4","h5","h6","head","header","hr","html","iframe","legend","li","link","main","menu","menuitem","nav","noframes","ol","optgroup","option","p","param","search","section","summary","table","tbody","td","tfoot","th","thead","title","tr","track","ul"],_s=["pre","script","style","textarea"],fy={concrete:!0,name:"htmlFlow",resolveTo:hy,tokenize:my},py={partial:!0,tokenize:yy},dy={partial:!0,tokenize:gy};function hy(e){let t=e.length;for(;t--&&!(e[t][0]==="enter"&&e[t][1].type==="htmlFlow"););return t>1&&e[t-2][1].type==="linePrefix"&&(e[t][1].start=e[t-2][1].start,e[t+1][1].start=e[t-2][1].start,e.splice(t-2,2)),e}function my(e,t,n){const r=this;let i,o,a,l,s;return u;function u(y){return f(y)}function f(y){return e.enter("htmlFlow"),e.enter("htmlFlowData"),e.consume(y),c}function c(y){return y===33?(e.consume(y),d):y===47?(e.consume(y),o=!0,h):y===63?(e.consume(y),i=3,r.interrupt?t:g):je(y)?(e.consume(y),a=String.fromCharCode(y),k):n(y)}function d(y){return y===45?(e.consume(y),i=2,p):y===91?(e.consume(y),i=5,l=0,m):je(y)?(e.consume(y),i=4,r.interrupt?t:g):n(y)}function p(y){return y===45?(e.consume(y),r.interrupt?t:g):n(y)}function m(y){const fe="CDATA[";return y===fe.charCodeAt(l++)?(e.consume(y),l===fe.length?r.interrupt?t:$:m):n(y)}function h(y){return je(y)?(e.consume(y),a=String.fromCharCode(y),k):n(y)}function k(y){if(y===null||y===47||y===62||de(y)){const fe=y===47,ge=a.toLowerCase();return!fe&&!o&&_s.includes(ge)?(i=1,r.interrupt?t(y):$(y)):cy.includes(a.toLowerCase())?(i=6,fe?(e.consume(y),b):r.interrupt?t(y):$(y)):(i=7,r.interrupt&&!r.parser.lazy[r.now().line]?n(y):o?C(y):T(y))}return y===45||Oe(y)?(e.consume(y),a+=String.fromCharCode(y),k):n(y)}function b(y){return y===62?(e.consume(y),r.interrupt?t:$):n(y)}function C(y){return ee(y)?(e.consume(y),C):S(y)}function T(y){return y===47?(e.consume(y),S):y===58||y===95||je(y)?(e.consume(y),M):ee(y)?(e.consume(y),T):S(y)}function M(y){return y===45||y===46||y===58||y===95||Oe(y)?(e.consume(y),M):D(y)}function D(y){return y===61?(e.consume(y),w):ee(y)?(e.consume(y),D):T(y)}function w(y){return y===null||y===60||y===61||y===62||y===96?n(y):y===34||y===39?(e.consume(y),s=y,O):ee(y)?(e.consume(y),w):Q(y)}function O(y){return y===s?(e.consume(y),s=null,H):y===null||U(y)?n(y):(e.consume(y),O)}function Q(y){return y===null||y===34||y===39||y===47||y===60||y===61||y===62||y===96||de(y)?D(y):(e.consume(y),Q)}function H(y){return y===47||y===62||ee(y)?T(y):n(y)}function S(y){return y===62?(e.consume(y),z):n(y)}function z(y){return y===null||U(y)?$(y):ee(y)?(e.consume(y),z):n(y)}function $(y){return y===45&&i===2?(e.consume(y),B):y===60&&i===1?(e.consume(y),L):y===62&&i===4?(e.consume(y),V):y===63&&i===3?(e.consume(y),g):y===93&&i===5?(e.consume(y),W):U(y)&&(i===6||i===7)?(e.exit("htmlFlowData"),e.check(py,K,_)(y)):y===null||U(y)?(e.exit("htmlFlowData"),_(y)):(e.consume(y),$)}function _(y){return e.check(dy,R,K)(y)}function R(y){return e.enter("lineEnding"),e.consume(y),e.exit("lineEnding"),j}function j(y){return y===null||U(y)?_(y):(e.enter("htmlFlowData"),$(y))}function B(y){return y===45?(e.consume(y),g):$(y)}function L(y){return y===47?(e.consume(y),a="",q):$(y)}function q(y){if(y===62){const fe=a.toLowerCase();return _s.includes(fe)?(e.consume(y),V):$(y)}return je(y)&&a.length<8?(e.consume(y),a+=String.fromCharCode(y),q):$(y)}function W(y){return y===93?(e.consume(y),g):$(y)}function g(y){return y===62?(e.consume(y),V):y===45&&i===2?(e.consume(y),g):$(y)}function V(y){return y===null||U(y)?(e.exit("htmlFlowData"),K(y)):(e.consume(y),V)}function K(y){return e.exit("htmlFlow"),t(y)}}function gy(e,t,n){const r=this;return i;function i(a){return U(a)?(e.enter("lineEnding"),e.consume(a),e.exit("lineEnding"),o):n(a)}function o(a){return r.parser.lazy[r.now().line]?n(a):t(a)}}function yy(e,t,n){return r;function r(i){return e.enter("lineEnding"),e.consume(i),e.exit("lineEnding"),e.attempt(Nn,t,n)}}const xy={name:"htmlText",tokenize:by};function by(e,t,n){const r=this;let i,o,a;return l;function l(g){return e.enter("htmlText"),e.enter("htmlTextData"),e.consume(g),s}function s(g){return g===33?(e.consume(g),u):g===47?(e.consume(g),D):g===63?(e.consume(g),T):je(g)?(e.consume(g),Q):n(g)}function u(g){return g===45?(e.consume(g),f):g===91?(e.consume(g),o=0,m):je(g)?(e.consume(g),C):n(g)}function f(g){return g===45?(e.consume(g),p):n(g)}function c(g){return g===null?n(g):g===45?(e.consume(g),d):U(g)?(a=c,L(g)):(e.consume(g),c)}function d(g){return g===45?(e.consume(g),p):c(g)}function p(g){return g===62?B(g):g===45?d(g):c(g)}function m(g){const V="CDATA[";return g===V.charCodeAt(o++)?(e.consume(g),o===V.length?h:m):n(g)}function h(g){return g===null?n(g):g===93?(e.consume(g),k):U(g)?(a=h,L(g)):(e.consume(g),h)}function k(g){return g===93?(e.consume(g),b):h(g)}function b(g){return g===62?B(g):g===93?(e.consume(g),b):h(g)}function C(g){return g===null||g===62?B(g):U(g)?(a=C,L(g)):(e.consume(g),C)}function T(g){return g===null?n(g):g===63?(e.consume(g),M):U(g)?(a=T,L(g)):(e.consume(g),T)}function M(g){return g===62?B(g):T(g)}function D(g){return je(g)?(e.consume(g),w):n(g)}function w(g){return g===45||Oe(g)?(e.consume(g),w):O(g)}function O(g){return U(g)?(a=O,L(g)):ee(g)?(e.consume(g),O):B(g)}function Q(g){return g===45||Oe(g)?(e.consume(g),Q):g===47||g===62||de(g)?H(g):n(g)}function H(g){return g===47?(e.consume(g),B):g===58||g===95||je(g)?(e.consume(g),S):U(g)?(a=H,L(g)):ee(g)?(e.consume(g),H):B(g)}function S(g){return g===45||g===46||g===58||g===95||Oe(g)?(e.consume(g),S):z(g)}function z(g){return g===61?(e.consume(g),$):U(g)?(a=z,L(g)):ee(g)?(e.consume(g),z):H(g)}function $(g){return g===null||g===60||g===61||g===62||g===96?n(g):g===34||g===39?(e.consume(g),i=g,_):U(g)?(a=$,L(g)):ee(g)?(e.consume(g),$):(e.consume(g),R)}function _(g){return g===i?(e.consume(g),i=void 0,j):g===null?n(g):U(g)?(a=_,L(g)):(e.consume(g),_)}function R(g){return g===null||g===34||g===39||g===60||g===61||g===96?n(g):g===47||g===62||de(g)?H(g):(e.consume(g),R)}function j(g){return g===47||g===62||de(g)?H(g):n(g)}function B(g){return g===62?(e.consume(g),e.exit("htmlTextData"),e.exit("htmlText"),t):n(g)}function L(g){return e.exit("htmlTextData"),e.enter("lineEnding"),e.consume(g),e.exit("lineEnding"),q}function q(g){return ee(g)?ne(e,W,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(g):W(g)}function W(g){return e.enter("htmlTextData"),a(g)}}const ro={name:"labelEnd",resolveAll:Sy,resolveTo:_y,tokenize:Cy},vy={tokenize:Ey},ky={tokenize:Ty},wy={tokenize:Ry};function Sy(e){let t=-1;const n=[];for(;++t<e.length;){const r=e[t][1];if(n.push(e[t]),r.type==="labelImage"||r.type==="labelLink"||r.type==="labelEnd"){const i=r.type==="labelImage"?4:2;r.type="data",t+=i}}return e.length!==n.length&&Ve(e,0,e.length,n),e}function _y(e,t){let n=e.length,r=0,i,o,a,l;for(;n--;)if(i=e[n][1],o){if(i.type==="link"||i.type==="labelLink"&&i._inactive)break;e[n][0]==="enter"&&i.type==="labelLink"&&(i._inactive=!0)}else if(a){if(e[n][0]==="enter"&&(i.type==="labelImage"||i.type==="labelLink")&&!i._balanced&&(o=n,i.type!=="labelLink")){r=2;break}}else i.type==="labelEnd"&&(a=n);const s={type:e[o][1].type==="labelLink"?"link":"image",start:{...e[o][1].start},end:{...e[e.length-1][1].end}},u={type:"label",start:{...e[o][1].start},end:{...e[a][1].end}},f={type:"labelText",start:{...e[o+r+2][1].end},end:{...e[a-2][1].start}};return l=[["enter",s,t],["enter",u,t]],l=tt(l,e.slice(o+1,o+r+3)),l=tt(l,[["enter",f,t]]),l=tt(l,Ar(t.parser.constructs.insideSpan.null,e.slice(o+r+4,a-3),t)),l=tt(l,[["exit",f,t],e[a-2],e[a-1],["exit",u,t]]),l=tt(l,e.slice(a+1)),l=tt(l,[["exit",s,t]]),Ve(e,o,e.length,l),e}function Cy(e,t,n){const r=this;let i=r.events.length,o,a;for(;i--;)if((r.events[i][1].type==="labelImage"||r.events[i][1].type==="labelLink")&&!r.events[i][1]._balanced){o=r.events[i][1];break}return l;function l(d){return o?o._inactive?c(d):(a=r.parser.defined.includes(it(r.sliceSerialize({start:o.end,end:r.now()}))),e.enter("labelEnd"),e.enter("labelMarker"),e.consume(d),e.exit("labelMarker"),e.exit("labelEnd"),s):n(d)}function s(d){return d===40?e.attempt(vy,f,a?f:c)(d):d===91?e.attempt(ky,f,a?u:c)(d):a?f(d):c(d)}function u(d){return e.attempt(wy,f,c)(d)}function f(d){return t(d)}function c(d){return o._balanced=!0,n(d)}}function Ey(e,t,n){return r;function r(c){return e.enter("resource"),e.enter("resourceMarker"),e.consume(c),e.exit("resourceMarker"),i}function i(c){return de(c)?Hn(e,o)(c):o(c)}function o(c){return c===41?f(c):ks(e,a,l,"resourceDestination","resourceDestinationLiteral","resourceDestinationLiteralMarker","resourceDestinationRaw","resourceDestinationString",32)(c)}function a(c){return de(c)?Hn(e,s)(c):f(c)}function l(c){return n(c)}function s(c){return c===34||c===39||c===40?Ss(e,u,n,"resourceTitle","resourceTitleMarker","resourceTitleString")(c):f(c)}function u(c){return de(c)?Hn(e,f)(c):f(c)}function f(c){return c===41?(e.enter("resourceMarker"),e.consume(c),e.exit("resourceMarker"),e.exit("resource"),t):n(c)}}function Ty(e,t,n){const r=this;return i;function i(l){return ws.call(r,e,o,a,"reference","referenceMarker","referenceString")(l)}function o(l){return r.parser.defined.includes(it(r.sliceSerialize(r.events[r.events.length-1][1]).slice(1,-1)))?t(l):n(l)}function a(l){return n(l)}}function Ry(e,t,n){return r;function r(o){return e.enter("reference"),e.enter("referenceMarker"),e.consume(o),e.exit("referenceMarker"),i}function i(o){return o===93?(e.enter("referenceMarker"),e.consume(o),e.exit("referenceMarker"),e.exit("reference"),t):n(o)}}const Py={name:"labelStartImage",resolveAll:ro.resolveAll,tokenize:Iy};function Iy(e,t,n){const r=this;return i;function i(l){return e.enter("labelImage"),e.enter("labelImageMarker"),e.consume(l),e.exit("labelImageMarker"),o}function o(l){return l===91?(e.enter("labelMarker"),e.consume(l),e.exit("labelMarker"),e.exit("labelImage"),a):n(l)}function a(l){return l===94&&"_hiddenFootnoteSupport"in r.parser.constructs?n(l):t(l)}}const Ay={name:"labelStartLink",resolveAll:ro.resolveAll,tokenize:Oy};function Oy(e,t,n){const r=this;return i;function i(a){return e.enter("labelLink"),e.enter("labelMarker"),e.consume(a),e.exit("labelMarker"),e.exit("labelLink"),o}function o(a){return a===94&&"_hiddenFootnoteSupport"in r.parser.constructs?n(a):t(a)}}const io={name:"lineEnding",tokenize:jy};function jy(e,t){return n;function n(r){return e.enter("lineEnding"),e.consume(r),e.exit("lineEnding"),ne(e,t,"linePrefix")}}const Or={name:"thematicBreak",tokenize:$y};function $y(e,t,n){let r=0,i;return o;function o(u){return e.enter("thematicBreak"),a(u)}function a(u){return i=u,l(u)}function l(u){return u===i?(e.enter("thematicBreakSequence"),s(u)):r>=3&&(u===null||U(u))?(e.exit("thematicBreak"),t(u)):n(u)}function s(u){return u===i?(e.consume(u),r++,s):(e.exit("thematicBreakSequence"),ee(u)?ne(e,l,"whitespace")(u):l(u))}}const Be={continuation:{tokenize:Fy},exit:By,name:"list",tokenize:Dy},My={partial:!0,tokenize:Ny},zy={partial:!0,tokenize:Ly};function Dy(e,t,n){const r=this,i=r.events[r.events.length-1];let o=i&&i[1].type==="linePrefix"?i[2].sliceSerialize(i[1],!0).length:0,a=0;return l;function l(p){const m=r.containerState.type||(p===42||p===43||p===45?"listUnordered":"listOrdered");if(m==="listUnordered"?!r.containerState.marker||p===r.containerState.marker:eo(p)){if(r.containerState.type||(r.containerState.type=m,e.enter(m,{_container:!0})),m==="listUnordered")return e.enter("listItemPrefix"),p===42||p===45?e.check(Or,n,u)(p):u(p);if(!r.interrupt||p===49)return e.enter("listItemPrefix"),e.enter("listItemValue"),s(p)}return n(p)}function s(p){return eo(p)&&++a<10?(e.consume(p),s):(!r.interrupt||a<2)&&(r.containerState.marker?p===r.containerState.marker:p===41||p===46)?(e.exit("listItemValue"),u(p)):n(p)}function u(p){return e.enter("listItemMarker"),e.consume(p),e.exit("listItemMarker"),r.containerState.marker=r.containerState.marker||p,e.check(Nn,r.interrupt?n:f,e.attempt(My,d,c))}function f(p){return r.containerState.initialBlankLine=!0,o++,d(p)}function c(p){return ee(p)?(e.enter("listItemPrefixWhitespace"),e.consume(p),e.exit("listItemPrefixWhitespace"),d):n(p)}function d(p){return r.containerState.size=o+r.sliceSerialize(e.exit("listItemPrefix"),!0).length,t(p)}}function Fy(e,t,n){const r=this;return r.containerState._closeFlow=void 0,e.check(Nn,i,o);function i(l){return r.containerState.furtherBlankLines=r.containerState.furtherBlankLines||r.containerState.initialBlankLine,ne(e,t,"listItemIndent",r.containerState.size+1)(l)}function o(l){return r.containerState.furtherBlankLines||!ee(l)?(r.containerState.furtherBlankLines=void 0,r.containerState.initialBlankLine=void 0,a(l)):(r.containerState.furtherBlankLines=void 0,r.containerState.initialBlankLine=void 0,e.attempt(zy,t,a)(l))}function a(l){return r.containerState._closeFlow=!0,r.interrupt=void 0,ne(e,e.attempt(Be,t,n),"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(l)}}function Ly(e,t,n){const r=this;return ne(e,i,"listItemIndent",r.containerState.size+1);function i(o){const a=r.events[r.events.length-1];return a&&a[1].type==="listItemIndent"&&a[2].sliceSerialize(a[1],!0).length===r.containerState.size?t(o):n(o)}}function By(e){e.exit(this.containerState.type)}function Ny(e,t,n){const r=this;return ne(e,i,"listItemPrefixWhitespace",r.parser.constructs.disable.null.includes("codeIndented")?void 0:5);function i(o){const a=r.events[r.events.length-1];return!ee(o)&&a&&a[1].type==="listItemPrefixWhitespace"?t(o):n(o)}}const Cs={name:"setextUnderline",resolveTo:Uy,tokenize:Hy};function Uy(e,t){let n=e.length,r,i,o;for(;n--;)if(e[n][0]==="enter"){if(e[n][1].type==="content"){r=n;break}e[n][1].type==="paragraph"&&(i=n)}else e[n][1].type==="content"&&e.splice(n,1),!o&&e[n][1].type==="definition"&&(o=n);const a={type:"setextHeading",start:{...e[r][1].start},end:{...e[e.length-1][1].end}};return e[i][1].type="setextHeadingText",o?(e.splice(i,0,["enter",a,t]),e.splice(o+1,0,["exit",e[r][1],t]),e[r][1].end={...e[o][1].end}):e[r][1]=a,e.push(["exit",a,t]),e}function Hy(e,t,n){const r=this;let i;return o;function o(u){let f=r.events.length,c;for(;f--;)if(r.events[f][1].type!=="lineEnding"&&r.events[f][1].type!=="linePrefix"&&r.events[f][1].type!=="content"){c=r.events[f][1].type==="paragraph";break}return!r.parser.lazy[r.now().line]&&(r.interrupt||c)?(e.enter("setextHeadingLine"),i=u,a(u)):n(u)}function a(u){return e.enter("setextHeadingLineSequence"),l(u)}function l(u){return u===i?(e.consume(u),l):(e.exit("setextHeadingLineSequence"),ee(u)?ne(e,s,"lineSuffix")(u):s(u))}function s(u){return u===null||U(u)?(e.exit("setextHeadingLine"),t(u)):n(u)}}const Wy={tokenize:qy};function qy(e){const t=this,n=e.attempt(Nn,r,e.attempt(this.parser.constructs.flowInitial,i,ne(e,e.attempt(this.parser.constructs.flow,i,e.attempt(Xg,i)),"linePrefix")));return n;function r(o){if(o===null){e.consume(o);return}return e.enter("lineEndingBlank"),e.consume(o),e.exit("lineEndingBlank"),t.currentConstruct=void 0,n}function i(o){if(o===null){e.consume(o);return}return e.enter("lineEnding"),e.consume(o),e.exit("lineEnding"),t.currentConstruct=void 0,n}}const Vy={resolveAll:Ts()},Yy=Es("string"),Gy=Es("text");function Es(e){return{resolveAll:Ts(e==="text"?Ky:void 0),tokenize:t};function t(n){const r=this,i=this.parser.constructs[e],o=n.attempt(i,a,l);return a;function a(f){return u(f)?o(f):l(f)}function l(f){if(f===null){n.consume(f);return}return n.enter("data"),n.consume(f),s}function s(f){return u(f)?(n.exit("data"),o(f)):(n.consume(f),s)}function u(f){if(f===null)return!0;const c=i[f];let d=-1;if(c)for(;++d<c.length;){const p=c[d];if(!p.previous||p.previous.call(r,r.previous))return!0}return!1}}}function Ts(e){return t;function t(n,r){let i=-1,o;for(;++i<=n.length;)o===void 0?n[i]&&n[i][1].type==="data"&&(o=i,i++):(!n[i]||n[i][1].type!=="data")&&(i!==o+2&&(n[o][1].end=n[i-1][1].end,n.splice(o+2,i-o-2),i=o+2),o=void 0);return e?e(n,r):n}}function Ky(e,t){let n=0;for(;++n<=e.length;)if((n===e.length||e[n][1].type==="lineEnding")&&e[n-1][1].type==="data"){const r=e[n-1][1],i=t.sliceStream(r);let o=i.length,a=-1,l=0,s;for(;o--;){const u=i[o];if(typeof u=="string"){for(a=u.length;u.charCodeAt(a-1)===32;)l++,a--;if(a)break;a=-1}else if(u===-2)s=!0,l++;else if(u!==-1){o++;break}}if(t._contentTypeTextTrailing&&n===e.length&&(l=0),l){const u={type:n===e.length||s||l<2?"lineSuffix":"hardBreakTrailing",start:{_bufferIndex:o?a:r.start._bufferIndex+a,_index:r.start._index+o,line:r.end.line,column:r.end.column-l,offset:r.end.offset-l},end:{...r.end}};r.end={...u.start},r.start.offset===r.end.offset?Object.assign(r,u):(e.splice(n,0,["enter",u,t],["exit",u,t]),n+=2)}n++}return e}const Xy=Object.freeze(Object.defineProperty({__proto__:null,attentionMarkers:{null:[42,95]},contentInitial:{91:ty},disable:{null:[]},document:{42:Be,43:Be,45:Be,48:Be,49:Be,50:Be,51:Be,52:Be,53:Be,54:Be,55:Be,56:Be,57:Be,62:ms},flow:{35:ly,42:Or,45:[Cs,Or],60:fy,61:Cs,95:Or,96:bs,126:bs},flowInitial:{[-2]:no,[-1]:no,32:no},insideSpan:{null:[to,Vy]},string:{38:ys,92:gs},text:{[-5]:io,[-4]:io,[-3]:io,33:Py,38:ys,42:to,60:[Ag,xy],91:Ay,92:[oy,gs],93:ro,95:to,96:Wg}},Symbol.toStringTag,{value:"Module"}));function Jy(e,t,n){let r={_bufferIndex:-1,_index:0,line:n&&n.line||1,column:n&&n.column||1,offset:n&&n.offset||0};const i={},o=[];let a=[],l=[];const s={attempt:O(D),check:O(w),consume:C,enter:T,exit:M,interrupt:O(w,{interrupt:!0})},u={code:null,containerState:{},defineSkip:h,events:[],now:m,parser:e,previous:null,sliceSerialize:d,sliceStream:p,write:c};let f=t.tokenize.call(u,s);return t.resolveAll&&o.push(t),u;function c(z){return a=tt(a,z),k(),a[a.length-1]!==null?[]:(Q(t,0),u.events=Ar(o,u.events,u),u.events)}function d(z,$){return Zy(p(z),$)}function p(z){return Qy(a,z)}function m(){const{_bufferIndex:z,_index:$,line:_,column:R,offset:j}=r;return{_bufferIndex:z,_index:$,line:_,column:R,offset:j}}function h(z){i[z.line]=z.column,S()}function k(){let z;for(;r._index<a.length;){const $=a[r._index];if(typeof $=="string")for(z=r._index,r._bufferIndex<0&&(r._bufferIndex=0);r._index===z&&r._bufferIndex<$.length;)b($.charCodeAt(r._bufferIndex));else b($)}}function b(z){f=f(z)}function C(z){U(z)?(r.line++,r.column=1,r.offset+=z===-3?2:1,S()):z!==-1&&(r.column++,r.offset++),r._bufferIndex<0?r._index++:(r._bufferIndex++,r._bufferIndex===a[r._index].length&&(r._bufferIndex=-1,r._index++)),u.previous=z}function T(z,$){const _=$||{};return _.type=z,_.start=m(),u.events.push(["enter",_,u]),l.push(_),_}function M(z){const $=l.pop();return $.end=m(),u.events.push(["exit",$,u]),$}function D(z,$){Q(z,$.from)}function w(z,$){$.restore()}function O(z,$){return _;function _(R,j,B){let L,q,W,g;return Array.isArray(R)?K(R):"tokenize"in R?K([R]):V(R);function V(le){return at;function at(Me){const nt=Me!==null&&le[Me],Ge=Me!==null&&le.null,Pt=[...Array.isArray(nt)?nt:nt?[nt]:[],...Array.isArray(Ge)?Ge:Ge?[Ge]:[]];return K(Pt)(Me)}}function K(le){return L=le,q=0,le.length===0?B:y(le[q])}function y(le){return at;function at(Me){return g=H(),W=le,le.partial||(u.currentConstruct=le),le.name&&u.parser.constructs.disable.null.includes(le.name)?ge():le.tokenize.call($?Object.assign(Object.create(u),$):u,s,fe,ge)(Me)}}function fe(le){return z(W,g),j}function ge(le){return g.restore(),++q<L.length?y(L[q]):B}}}function Q(z,$){z.resolveAll&&!o.includes(z)&&o.push(z),z.resolve&&Ve(u.events,$,u.events.length-$,z.resolve(u.events.slice($),u)),z.resolveTo&&(u.events=z.resolveTo(u.events,u))}function H(){const z=m(),$=u.previous,_=u.currentConstruct,R=u.events.length,j=Array.from(l);return{from:R,restore:B};function B(){r=z,u.previous=$,u.currentConstruct=_,u.events.length=R,l=j,S()}}function S(){r.line in i&&r.column<2&&(r.column=i[r.line],r.offset+=i[r.line]-1)}}function Qy(e,t){const n=t.start._index,r=t.start._bufferIndex,i=t.end._index,o=t.end._bufferIndex;let a;if(n===i)a=[e[n].slice(r,o)];else{if(a=e.slice(n,i),r>-1){const l=a[0];typeof l=="string"?a[0]=l.slice(r):a.shift()}o>0&&a.push(e[i].slice(0,o))}return a}function Zy(e,t){let n=-1;const r=[];let i;for(;++n<e.length;){const o=e[n];let a;if(typeof o=="string")a=o;else switch(o){case-5:{a="\r";break}case-4:{a=`
 `;break}case-3:{a=`\r
 `;break}case-2:{a=t?" ":"	";break}case-1:{if(!t&&i)continue;a=" ";break}default:a=String.fromCharCode(o)}i=o===-2,r.push(a)}return r.join("")}function ex(e){const r={constructs:fs([Xy,...(e||{}).extensions||[]]),content:i(_g),defined:[],document:i(Eg),flow:i(Wy),lazy:{},string:i(Yy),text:i(Gy)};return r;function i(o){return a;function a(l){return Jy(r,o,l)}}}function tx(e){for(;!vs(e););return e}const Rs=/[\0\t\n\r]/g;function nx(){let e=1,t="",n=!0,r;return i;function i(o,a,l){const s=[];let u,f,c,d,p;for(o=t+(typeof o=="string"?o.toString():new TextDecoder(a||void 0).decode(o)),c=0,t="",n&&(o.charCodeAt(0)===65279&&c++,n=void 0);c<o.length;){if(Rs.lastIndex=c,u=Rs.exec(o),d=u&&u.index!==void 0?u.index:o.length,p=o.charCodeAt(d),!u){t=o.slice(c);break}if(p===10&&c===d&&r)s.push(-3),r=void 0;else switch(r&&(s.push(-5),r=void 0),c<d&&(s.push(o.slice(c,d)),e+=d-c),p){case 0:{s.push(65533),e++;break}case 9:{for(f=Math.ceil(e/4)*4,s.push(-2);e++<f;)s.push(-1);break}case 10:{s.push(-4),e=1;break}default:r=!0,e=1}c=d+1}return l&&(r&&s.push(-5),t&&s.push(t),s.push(null)),s}}const rx=/\\([!-/:-@[-`{-~])|&(#(?:\d{1,7}|x[\da-f]{1,6})|[\da-z]{1,31});/gi;function ix(e){return e.replace(rx,ox)}function ox(e,t,n){if(t)return t;if(n.charCodeAt(0)===35){const i=n.charCodeAt(1),o=i===120||i===88;return ps(n.slice(o?2:1),o?16:10)}return Zi(n)||e}const Ps={}.hasOwnProperty;function ax(e,t,n){return typeof t!="string"&&(n=t,t=void 0),lx(n)(tx(ex(n).document().write(nx()(e,t,!0))))}function lx(e){const t={transforms:[],canContainEols:["emphasis","fragment","heading","paragraph","strong"],enter:{autolink:o(Nt),autolinkProtocol:H,autolinkEmail:H,atxHeading:o(mt),blockQuote:o(Ge),characterEscape:H,characterReference:H,codeFenced:o(Pt),codeFencedFenceInfo:a,codeFencedFenceMeta:a,codeIndented:o(Pt,a),codeText:o(N,a),codeTextData:H,data:H,codeFlowValue:H,definition:o(Bt),definitionDestinationString:a,definitionLabelString:a,definitionTitleString:a,emphasis:o(It),hardBreakEscape:o(At),hardBreakTrailing:o(At),htmlFlow:o(Qn,a),htmlFlowData:H,htmlText:o(Qn,a),htmlTextData:H,image:o(qr),label:a,link:o(Nt),listItem:o(Yo),listItemValue:d,listOrdered:o(Vr,c),listUnordered:o(Vr),paragraph:o(Zn),reference:y,referenceString:a,resourceDestinationString:a,resourceTitleString:a,setextHeading:o(mt),strong:o(Go),thematicBreak:o(Yr)},exit:{atxHeading:s(),atxHeadingSequence:D,autolink:s(),autolinkEmail:nt,autolinkProtocol:Me,blockQuote:s(),characterEscapeValue:S,characterReferenceMarkerHexadecimal:ge,characterReferenceMarkerNumeric:ge,characterReferenceValue:le,characterReference:at,codeFenced:s(k),codeFencedFence:h,codeFencedFenceInfo:p,codeFencedFenceMeta:m,codeFlowValue:S,codeIndented:s(b),codeText:s(j),codeTextData:S,data:S,definition:s(),definitionDestinationString:M,definitionLabelString:C,definitionTitleString:T,emphasis:s(),hardBreakEscape:s($),hardBreakTrailing:s($),htmlFlow:s(_),htmlFlowData:S,htmlText:s(R),htmlTextData:S,image:s(L),label:W,labelText:q,lineEnding:z,link:s(B),listItem:s(),listOrdered:s(),listUnordered:s(),paragraph:s(),referenceString:fe,resourceDestinationString:g,resourceTitleString:V,resource:K,setextHeading:s(Q),setextHeadingLineSequence:O,setextHeadingText:w,strong:s(),thematicBreak:s()}};Is(t,(e||{}).mdastExtensions||[]);const n={};return r;function r(E){let A={type:"root",children:[]};const G={stack:[A],tokenStack:[],config:t,enter:l,exit:u,buffer:a,resume:f,data:n},Z=[];let se=-1;for(;++se<E.length;)if(E[se][1].type==="listOrdered"||E[se][1].type==="listUnordered")if(E[se][0]==="enter")Z.push(se);else{const Ke=Z.pop();se=i(E,Ke,se)}for(se=-1;++se<E.length;){const Ke=t[E[se][0]];Ps.call(Ke,E[se][1].type)&&Ke[E[se][1].type].call(Object.assign({sliceSerialize:E[se][2].sliceSerialize},G),E[se][1])}if(G.tokenStack.length>0){const Ke=G.tokenStack[G.tokenStack.length-1];(Ke[1]||As).call(G,void 0,Ke[0])}for(A.position={start:Et(E.length>0?E[0][1].start:{line:1,column:1,offset:0}),end:Et(E.length>0?E[E.length-2][1].end:{line:1,column:1,offset:0})},se=-1;++se<t.transforms.length;)A=t.transforms[se](A)||A;return A}function i(E,A,G){let Z=A-1,se=-1,Ke=!1,vt,lt,Ut,Ht;for(;++Z<=G;){const ze=E[Z];switch(ze[1].type){case"listUnordered":case"listOrdered":case"blockQuote":{ze[0]==="enter"?se++:se--,Ht=void 0;break}case"lineEndingBlank":{ze[0]==="enter"&&(vt&&!Ht&&!se&&!Ut&&(Ut=Z),Ht=void 0);break}case"linePrefix":case"listItemValue":case"listItemMarker":case"listItemPrefix":case"listItemPrefixWhitespace":break;default:Ht=void 0}if(!se&&ze[0]==="enter"&&ze[1].type==="listItemPrefix"||se===-1&&ze[0]==="exit"&&(ze[1].type==="listUnordered"||ze[1].type==="listOrdered")){if(vt){let Ot=Z;for(lt=void 0;Ot--;){const Xe=E[Ot];if(Xe[1].type==="lineEnding"||Xe[1].type==="lineEndingBlank"){if(Xe[0]==="exit")continue;lt&&(E[lt][1].type="lineEndingBlank",Ke=!0),Xe[1].type="lineEnding",lt=Ot}else if(!(Xe[1].type==="linePrefix"||Xe[1].type==="blockQuotePrefix"||Xe[1].type==="blockQuotePrefixWhitespace"||Xe[1].type==="blockQuoteMarker"||Xe[1].type==="listItemIndent"))break}Ut&&(!lt||Ut<lt)&&(vt._spread=!0),vt.end=Object.assign({},lt?E[lt][1].start:ze[1].end),E.splice(lt||Z,0,["exit",vt,ze[2]]),Z++,G++}if(ze[1].type==="listItemPrefix"){const Ot={type:"listItem",_spread:!1,start:Object.assign({},ze[1].start),end:void 0};vt=Ot,E.splice(Z,0,["enter",Ot,ze[2]]),Z++,G++,Ut=void 0,Ht=!0}}}return E[A][1]._spread=Ke,G}function o(E,A){return G;function G(Z){l.call(this,E(Z),Z),A&&A.call(this,Z)}}function a(){this.stack.push({type:"fragment",children:[]})}function l(E,A,G){this.stack[this.stack.length-1].children.push(E),this.stack.push(E),this.tokenStack.push([A,G||void 0]),E.position={start:Et(A.start),end:void 0}}function s(E){return A;function A(G){E&&E.call(this,G),u.call(this,G)}}function u(E,A){const G=this.stack.pop(),Z=this.tokenStack.pop();if(Z)Z[0].type!==E.type&&(A?A.call(this,E,Z[0]):(Z[1]||As).call(this,E,Z[0]));else throw new Error("Cannot close `"+E.type+"` ("+Ln({start:E.start,end:E.end})+"): it’s not open");G.position.end=Et(E.end)}function f(){return Qi(this.stack.pop())}function c(){this.data.expectingFirstListItemValue=!0}function d(E){if(this.data.expectingFirstListItemValue){const A=this.stack[this.stack.length-2];A.start=Number.parseInt(this.sliceSerialize(E),10),this.data.expectingFirstListItemValue=void 0}}function p(){const E=this.resume(),A=this.stack[this.stack.length-1];A.lang=E}function m(){const E=this.resume(),A=this.stack[this.stack.length-1];A.meta=E}function h(){this.data.flowCodeInside||(this.buffer(),this.data.flowCodeInside=!0)}function k(){const E=this.resume(),A=this.stack[this.stack.length-1];A.value=E.replace(/^(\r?\n|\r)|(\r?\n|\r)$/g,""),this.data.flowCodeInside=void 0}function b(){const E=this.resume(),A=this.stack[this.stack.length-1];A.value=E.replace(/(\r?\n|\r)$/g,"")}function C(E){const A=this.resume(),G=this.stack[this.stack.length-1];G.label=A,G.identifier=it(this.sliceSerialize(E)).toLowerCase()}function T(){const E=this.resume(),A=this.stack[this.stack.length-1];A.title=E}function M(){const E=this.resume(),A=this.stack[this.stack.length-1];A.url=E}function D(E){const A=this.stack[this.stack.length-1];if(!A.depth){const G=this.sliceSerialize(E).length;A.depth=G}}function w(){this.data.setextHeadingSlurpLineEnding=!0}function O(E){const A=this.stack[this.stack.length-1];A.depth=this.sliceSerialize(E).codePointAt(0)===61?1:2}function Q(){this.data.setextHeadingSlurpLineEnding=void 0}function H(E){const G=this.stack[this.stack.length-1].children;let Z=G[G.length-1];(!Z||Z.type!=="text")&&(Z=Ko(),Z.position={start:Et(E.start),end:void 0},G.push(Z)),this.stack.push(Z)}function S(E){const A=this.stack.pop();A.value+=this.sliceSerialize(E),A.position.end=Et(E.end)}function z(E){const A=this.stack[this.stack.length-1];if(this.data.atHardBreak){const G=A.children[A.children.length-1];G.position.end=Et(E.end),this.data.atHardBreak=void 0;return}!this.data.setextHeadingSlurpLineEnding&&t.canContainEols.includes(A.type)&&(H.call(this,E),S.call(this,E))}function $(){this.data.atHardBreak=!0}function _(){const E=this.resume(),A=this.stack[this.stack.length-1];A.value=E}function R(){const E=this.resume(),A=this.stack[this.stack.length-1];A.value=E}function j(){const E=this.resume(),A=this.stack[this.stack.length-1];A.value=E}function B(){const E=this.stack[this.stack.length-1];if(this.data.inReference){const A=this.data.referenceType||"shortcut";E.type+="Reference",E.referenceType=A,delete E.url,delete E.title}else delete E.identifier,delete E.label;this.data.referenceType=void 0}function L(){const E=this.stack[this.stack.length-1];if(this.data.inReference){const A=this.data.referenceType||"shortcut";E.type+="Reference",E.referenceType=A,delete E.url,delete E.title}else delete E.identifier,delete E.label;this.data.referenceType=void 0}function q(E){const A=this.sliceSerialize(E),G=this.stack[this.stack.length-2];G.label=ix(A),G.identifier=it(A).toLowerCase()}function W(){const E=this.stack[this.stack.length-1],A=this.resume(),G=this.stack[this.stack.length-1];if(this.data.inReference=!0,G.type==="link"){const Z=E.children;G.children=Z}else G.alt=A}function g(){const E=this.resume(),A=this.stack[this.stack.length-1];A.url=E}function V(){const E=this.resume(),A=this.stack[this.stack.length-1];A.title=E}function K(){this.data.inReference=void 0}function y(){this.data.referenceType="collapsed"}function fe(E){const A=this.resume(),G=this.stack[this.stack.length-1];G.label=A,G.identifier=it(this.sliceSerialize(E)).toLowerCase(),this.data.referenceType="full"}function ge(E){this.data.characterReferenceType=E.type}function le(E){const A=this.sliceSerialize(E),G=this.data.characterReferenceType;let Z;G?(Z=ps(A,G==="characterReferenceMarkerNumeric"?10:16),this.data.characterReferenceType=void 0):Z=Zi(A);const se=this.stack[this.stack.length-1];se.value+=Z}function at(E){const A=this.stack.pop();A.position.end=Et(E.end)}function Me(E){S.call(this,E);const A=this.stack[this.stack.length-1];A.url=this.sliceSerialize(E)}function nt(E){S.call(this,E);const A=this.stack[this.stack.length-1];A.url="mailto:"+this.sliceSerialize(E)}function Ge(){return{type:"blockquote",children:[]}}function Pt(){return{type:"code",lang:null,meta:null,value:""}}function N(){return{type:"inlineCode",value:""}}function Bt(){return{type:"definition",identifier:"",label:null,title:null,url:""}}function It(){return{type:"emphasis",children:[]}}function mt(){return{type:"heading",depth:0,children:[]}}function At(){return{type:"break"}}function Qn(){return{type:"html",value:""}}function qr(){return{type:"image",title:null,url:"",alt:null}}function Nt(){return{type:"link",title:null,url:"",children:[]}}function Vr(E){return{type:"list",ordered:E.type==="listOrdered",start:null,spread:E._spread,children:[]}}function Yo(E){return{type:"listItem",spread:E._spread,checked:null,children:[]}}function Zn(){return{type:"paragraph",children:[]}}function Go(){return{type:"strong",children:[]}}function Ko(){return{type:"text",value:""}}function Yr(){return{type:"thematicBreak"}}}function Et(e){return{line:e.line,column:e.column,offset:e.offset}}function Is(e,t){let n=-1;for(;++n<t.length;){const r=t[n];Array.isArray(r)?Is(e,r):sx(e,r)}}function sx(e,t){let n;for(n in t)if(Ps.call(t,n))switch(n){case"canContainEols":{const r=t[n];r&&e[n].push(...r);break}case"transforms":{const r=t[n];r&&e[n].push(...r);break}case"enter":case"exit":{const r=t[n];r&&Object.assign(e[n],r);break}}}function As(e,t){throw e?new Error("Cannot close `"+e.type+"` ("+Ln({start:e.start,end:e.end})+"): a different token (`"+t.type+"`, "+Ln({start:t.start,end:t.end})+") is open"):new Error("Cannot close document, a token (`"+t.type+"`, "+Ln({start:t.start,end:t.end})+") is still open")}function ux(e){const t=this;t.parser=n;function n(r){return ax(r,{...t.data("settings"),...e,extensions:t.data("micromarkExtensions")||[],mdastExtensions:t.data("fromMarkdownExtensions")||[]})}}function cx(e,t){const n={type:"element",tagName:"blockquote",properties:{},children:e.wrap(e.all(t),!0)};return e.patch(t,n),e.applyData(t,n)}function fx(e,t){const n={type:"element",tagName:"br",properties:{},children:[]};return e.patch(t,n),[e.applyData(t,n),{type:"text",value:`
@@ -93,6 +93,4 @@ const theme2 = createTheme({ palette: {
 `))+1))}const a="#".repeat(i),l=n.enter("headingAtx"),s=n.enter("phrasing");o.move(a+" ");let u=n.containerPhrasing(e,{before:"# ",after:`
 `,...o.current()});return/^[\t ]/.test(u)&&(u=Yn(u.charCodeAt(0))+u.slice(1)),u=u?a+" "+u:a,n.options.closeAtx&&(u+=" "+a),s(),l(),u}gu.peek=Pb;function gu(e){return e.value||""}function Pb(){return"<"}yu.peek=Ib;function yu(e,t,n,r){const i=Eo(n),o=i==='"'?"Quote":"Apostrophe",a=n.enter("image");let l=n.enter("label");const s=n.createTracker(r);let u=s.move("![");return u+=s.move(n.safe(e.alt,{before:u,after:"]",...s.current()})),u+=s.move("]("),l(),!e.url&&e.title||/[\0- \u007F]/.test(e.url)?(l=n.enter("destinationLiteral"),u+=s.move("<"),u+=s.move(n.safe(e.url,{before:u,after:">",...s.current()})),u+=s.move(">")):(l=n.enter("destinationRaw"),u+=s.move(n.safe(e.url,{before:u,after:e.title?" ":")",...s.current()}))),l(),e.title&&(l=n.enter(`title${o}`),u+=s.move(" "+i),u+=s.move(n.safe(e.title,{before:u,after:i,...s.current()})),u+=s.move(i),l()),u+=s.move(")"),a(),u}function Ib(){return"!"}xu.peek=Ab;function xu(e,t,n,r){const i=e.referenceType,o=n.enter("imageReference");let a=n.enter("label");const l=n.createTracker(r);let s=l.move("![");const u=n.safe(e.alt,{before:s,after:"]",...l.current()});s+=l.move(u+"]["),a();const f=n.stack;n.stack=[],a=n.enter("reference");const c=n.safe(n.associationId(e),{before:s,after:"]",...l.current()});return a(),n.stack=f,o(),i==="full"||!u||u!==c?s+=l.move(c+"]"):i==="shortcut"?s=s.slice(0,-1):s+=l.move("]"),s}function Ab(){return"!"}bu.peek=Ob;function bu(e,t,n){let r=e.value||"",i="`",o=-1;for(;new RegExp("(^|[^`])"+i+"([^`]|$)").test(r);)i+="`";for(/[^ \r\n]/.test(r)&&(/^[ \r\n]/.test(r)&&/[ \r\n]$/.test(r)||/^`|`$/.test(r))&&(r=" "+r+" ");++o<n.unsafe.length;){const a=n.unsafe[o],l=n.compilePattern(a);let s;if(a.atBreak)for(;s=l.exec(r);){let u=s.index;r.charCodeAt(u)===10&&r.charCodeAt(u-1)===13&&u--,r=r.slice(0,u)+" "+r.slice(s.index+1)}}return i+r+i}function Ob(){return"`"}function vu(e,t){const n=Qi(e);return!!(!t.options.resourceLink&&e.url&&!e.title&&e.children&&e.children.length===1&&e.children[0].type==="text"&&(n===e.url||"mailto:"+n===e.url)&&/^[a-z][a-z+.-]+:/i.test(e.url)&&!/[\0- <>\u007F]/.test(e.url))}ku.peek=jb;function ku(e,t,n,r){const i=Eo(n),o=i==='"'?"Quote":"Apostrophe",a=n.createTracker(r);let l,s;if(vu(e,n)){const f=n.stack;n.stack=[],l=n.enter("autolink");let c=a.move("<");return c+=a.move(n.containerPhrasing(e,{before:c,after:">",...a.current()})),c+=a.move(">"),l(),n.stack=f,c}l=n.enter("link"),s=n.enter("label");let u=a.move("[");return u+=a.move(n.containerPhrasing(e,{before:u,after:"](",...a.current()})),u+=a.move("]("),s(),!e.url&&e.title||/[\0- \u007F]/.test(e.url)?(s=n.enter("destinationLiteral"),u+=a.move("<"),u+=a.move(n.safe(e.url,{before:u,after:">",...a.current()})),u+=a.move(">")):(s=n.enter("destinationRaw"),u+=a.move(n.safe(e.url,{before:u,after:e.title?" ":")",...a.current()}))),s(),e.title&&(s=n.enter(`title${o}`),u+=a.move(" "+i),u+=a.move(n.safe(e.title,{before:u,after:i,...a.current()})),u+=a.move(i),s()),u+=a.move(")"),l(),u}function jb(e,t,n){return vu(e,n)?"<":"["}wu.peek=$b;function wu(e,t,n,r){const i=e.referenceType,o=n.enter("linkReference");let a=n.enter("label");const l=n.createTracker(r);let s=l.move("[");const u=n.containerPhrasing(e,{before:s,after:"]",...l.current()});s+=l.move(u+"]["),a();const f=n.stack;n.stack=[],a=n.enter("reference");const c=n.safe(n.associationId(e),{before:s,after:"]",...l.current()});return a(),n.stack=f,o(),i==="full"||!u||u!==c?s+=l.move(c+"]"):i==="shortcut"?s=s.slice(0,-1):s+=l.move("]"),s}function $b(){return"["}function To(e){const t=e.options.bullet||"*";if(t!=="*"&&t!=="+"&&t!=="-")throw new Error("Cannot serialize items with `"+t+"` for `options.bullet`, expected `*`, `+`, or `-`");return t}function Mb(e){const t=To(e),n=e.options.bulletOther;if(!n)return t==="*"?"-":"*";if(n!=="*"&&n!=="+"&&n!=="-")throw new Error("Cannot serialize items with `"+n+"` for `options.bulletOther`, expected `*`, `+`, or `-`");if(n===t)throw new Error("Expected `bullet` (`"+t+"`) and `bulletOther` (`"+n+"`) to be different");return n}function zb(e){const t=e.options.bulletOrdered||".";if(t!=="."&&t!==")")throw new Error("Cannot serialize items with `"+t+"` for `options.bulletOrdered`, expected `.` or `)`");return t}function Su(e){const t=e.options.rule||"*";if(t!=="*"&&t!=="-"&&t!=="_")throw new Error("Cannot serialize rules with `"+t+"` for `options.rule`, expected `*`, `-`, or `_`");return t}function Db(e,t,n,r){const i=n.enter("list"),o=n.bulletCurrent;let a=e.ordered?zb(n):To(n);const l=e.ordered?a==="."?")":".":Mb(n);let s=t&&n.bulletLastUsed?a===n.bulletLastUsed:!1;if(!e.ordered){const f=e.children?e.children[0]:void 0;if((a==="*"||a==="-")&&f&&(!f.children||!f.children[0])&&n.stack[n.stack.length-1]==="list"&&n.stack[n.stack.length-2]==="listItem"&&n.stack[n.stack.length-3]==="list"&&n.stack[n.stack.length-4]==="listItem"&&n.indexStack[n.indexStack.length-1]===0&&n.indexStack[n.indexStack.length-2]===0&&n.indexStack[n.indexStack.length-3]===0&&(s=!0),Su(n)===a&&f){let c=-1;for(;++c<e.children.length;){const d=e.children[c];if(d&&d.type==="listItem"&&d.children&&d.children[0]&&d.children[0].type==="thematicBreak"){s=!0;break}}}}s&&(a=l),n.bulletCurrent=a;const u=n.containerFlow(e,r);return n.bulletLastUsed=a,n.bulletCurrent=o,i(),u}function Fb(e){const t=e.options.listItemIndent||"one";if(t!=="tab"&&t!=="one"&&t!=="mixed")throw new Error("Cannot serialize items with `"+t+"` for `options.listItemIndent`, expected `tab`, `one`, or `mixed`");return t}function Lb(e,t,n,r){const i=Fb(n);let o=n.bulletCurrent||To(n);t&&t.type==="list"&&t.ordered&&(o=(typeof t.start=="number"&&t.start>-1?t.start:1)+(n.options.incrementListMarker===!1?0:t.children.indexOf(e))+o);let a=o.length+1;(i==="tab"||i==="mixed"&&(t&&t.type==="list"&&t.spread||e.spread))&&(a=Math.ceil(a/4)*4);const l=n.createTracker(r);l.move(o+" ".repeat(a-o.length)),l.shift(a);const s=n.enter("listItem"),u=n.indentLines(n.containerFlow(e,l.current()),f);return s(),u;function f(c,d,p){return d?(p?"":" ".repeat(a))+c:(p?o:o+" ".repeat(a-o.length))+c}}function Bb(e,t,n,r){const i=n.enter("paragraph"),o=n.enter("phrasing"),a=n.containerPhrasing(e,r);return o(),i(),a}const Nb=Fr(["break","delete","emphasis","footnote","footnoteReference","image","imageReference","inlineCode","inlineMath","link","linkReference","mdxJsxTextElement","mdxTextExpression","strong","text","textDirective"]);function Ub(e,t,n,r){return(e.children.some(function(a){return Nb(a)})?n.containerPhrasing:n.containerFlow).call(n,e,r)}function Hb(e){const t=e.options.strong||"*";if(t!=="*"&&t!=="_")throw new Error("Cannot serialize strong with `"+t+"` for `options.strong`, expected `*`, or `_`");return t}_u.peek=Wb;function _u(e,t,n,r){const i=Hb(n),o=n.enter("strong"),a=n.createTracker(r),l=a.move(i+i);let s=a.move(n.containerPhrasing(e,{after:i,before:l,...a.current()}));const u=s.charCodeAt(0),f=Ur(r.before.charCodeAt(r.before.length-1),u,i);f.inside&&(s=Yn(u)+s.slice(1));const c=s.charCodeAt(s.length-1),d=Ur(r.after.charCodeAt(0),c,i);d.inside&&(s=s.slice(0,-1)+Yn(c));const p=a.move(i+i);return o(),n.attentionEncodeSurroundingInfo={after:d.outside,before:f.outside},l+s+p}function Wb(e,t,n){return n.options.strong||"*"}function qb(e,t,n,r){return n.safe(e.value,r)}function Vb(e){const t=e.options.ruleRepetition||3;if(t<3)throw new Error("Cannot serialize rules with repetition `"+t+"` for `options.ruleRepetition`, expected `3` or more");return t}function Yb(e,t,n){const r=(Su(n)+(n.options.ruleSpaces?" ":"")).repeat(Vb(n));return n.options.ruleSpaces?r.slice(0,-1):r}const Cu={blockquote:gb,break:hu,code:wb,definition:_b,emphasis:mu,hardBreak:hu,heading:Rb,html:gu,image:yu,imageReference:xu,inlineCode:bu,link:ku,linkReference:wu,list:Db,listItem:Lb,paragraph:Bb,root:Ub,strong:_u,text:qb,thematicBreak:Yb};function Gb(){return{enter:{table:Kb,tableData:Eu,tableHeader:Eu,tableRow:Jb},exit:{codeText:Qb,table:Xb,tableData:Ro,tableHeader:Ro,tableRow:Ro}}}function Kb(e){const t=e._align;this.enter({type:"table",align:t.map(function(n){return n==="none"?null:n}),children:[]},e),this.data.inTable=!0}function Xb(e){this.exit(e),this.data.inTable=void 0}function Jb(e){this.enter({type:"tableRow",children:[]},e)}function Ro(e){this.exit(e)}function Eu(e){this.enter({type:"tableCell",children:[]},e)}function Qb(e){let t=this.resume();this.data.inTable&&(t=t.replace(/\\([\\|])/g,Zb));const n=this.stack[this.stack.length-1];n.type,n.value=t,this.exit(e)}function Zb(e,t){return t==="|"?t:e}function e0(e){const t=e||{},n=t.tableCellPadding,r=t.tablePipeAlign,i=t.stringLength,o=n?" ":"|";return{unsafe:[{character:"\r",inConstruct:"tableCell"},{character:`
 `,inConstruct:"tableCell"},{atBreak:!0,character:"|",after:"[	 :-]"},{character:"|",inConstruct:"tableCell"},{atBreak:!0,character:":",after:"-"},{atBreak:!0,character:"-",after:"[:|-]"}],handlers:{inlineCode:d,table:a,tableCell:s,tableRow:l}};function a(p,m,h,k){return u(f(p,h,k),p.align)}function l(p,m,h,k){const b=c(p,h,k),C=u([b]);return C.slice(0,C.indexOf(`
-`))}function s(p,m,h,k){const b=h.enter("tableCell"),C=h.enter("phrasing"),T=h.containerPhrasing(p,{...k,before:o,after:o});return C(),b(),T}function u(p,m){return hb(p,{align:m,alignDelimiters:r,padding:n,stringLength:i})}function f(p,m,h){const k=p.children;let b=-1;const C=[],T=m.enter("table");for(;++b<k.length;)C[b]=c(k[b],m,h);return T(),C}function c(p,m,h){const k=p.children;let b=-1;const C=[],T=m.enter("tableRow");for(;++b<k.length;)C[b]=s(k[b],p,m,h);return T(),C}function d(p,m,h){let k=Cu.inlineCode(p,m,h);return h.stack.includes("tableCell")&&(k=k.replace(/\|/g,"\\$&")),k}}function t0(){return{exit:{taskListCheckValueChecked:Tu,taskListCheckValueUnchecked:Tu,paragraph:r0}}}function n0(){return{unsafe:[{atBreak:!0,character:"-",after:"[:|-]"}],handlers:{listItem:i0}}}function Tu(e){const t=this.stack[this.stack.length-2];t.type,t.checked=e.type==="taskListCheckValueChecked"}function r0(e){const t=this.stack[this.stack.length-2];if(t&&t.type==="listItem"&&typeof t.checked=="boolean"){const n=this.stack[this.stack.length-1];n.type;const r=n.children[0];if(r&&r.type==="text"){const i=t.children;let o=-1,a;for(;++o<i.length;){const l=i[o];if(l.type==="paragraph"){a=l;break}}a===n&&(r.value=r.value.slice(1),r.value.length===0?n.children.shift():n.position&&r.position&&typeof r.position.start.offset=="number"&&(r.position.start.column++,r.position.start.offset++,n.position.start=Object.assign({},r.position.start)))}}this.exit(e)}function i0(e,t,n,r){const i=e.children[0],o=typeof e.checked=="boolean"&&i&&i.type==="paragraph",a="["+(e.checked?"x":" ")+"] ",l=n.createTracker(r);o&&l.move(a);let s=Cu.listItem(e,t,n,{...r,...l.current()});return o&&(s=s.replace(/^(?:[*+-]|\d+\.)([\r\n]| {1,3})/,u)),s;function u(f){return f+a}}function o0(){return[D1(),ib(),sb(),Gb(),t0()]}function a0(e){return{extensions:[F1(),ob(e),ub(),e0(e),n0()]}}const l0={tokenize:d0,partial:!0},Ru={tokenize:h0,partial:!0},Pu={tokenize:m0,partial:!0},Iu={tokenize:g0,partial:!0},s0={tokenize:y0,partial:!0},Au={name:"wwwAutolink",tokenize:f0,previous:ju},Ou={name:"protocolAutolink",tokenize:p0,previous:$u},xt={name:"emailAutolink",tokenize:c0,previous:Mu},dt={};function u0(){return{text:dt}}let Ft=48;for(;Ft<123;)dt[Ft]=xt,Ft++,Ft===58?Ft=65:Ft===91&&(Ft=97);dt[43]=xt,dt[45]=xt,dt[46]=xt,dt[95]=xt,dt[72]=[xt,Ou],dt[104]=[xt,Ou],dt[87]=[xt,Au],dt[119]=[xt,Au];function c0(e,t,n){const r=this;let i,o;return a;function a(c){return!Po(c)||!Mu.call(r,r.previous)||Io(r.events)?n(c):(e.enter("literalAutolink"),e.enter("literalAutolinkEmail"),l(c))}function l(c){return Po(c)?(e.consume(c),l):c===64?(e.consume(c),s):n(c)}function s(c){return c===46?e.check(s0,f,u)(c):c===45||c===95||Oe(c)?(o=!0,e.consume(c),s):f(c)}function u(c){return e.consume(c),i=!0,s}function f(c){return o&&i&&je(r.previous)?(e.exit("literalAutolinkEmail"),e.exit("literalAutolink"),t(c)):n(c)}}function f0(e,t,n){const r=this;return i;function i(a){return a!==87&&a!==119||!ju.call(r,r.previous)||Io(r.events)?n(a):(e.enter("literalAutolink"),e.enter("literalAutolinkWww"),e.check(l0,e.attempt(Ru,e.attempt(Pu,o),n),n)(a))}function o(a){return e.exit("literalAutolinkWww"),e.exit("literalAutolink"),t(a)}}function p0(e,t,n){const r=this;let i="",o=!1;return a;function a(c){return(c===72||c===104)&&$u.call(r,r.previous)&&!Io(r.events)?(e.enter("literalAutolink"),e.enter("literalAutolinkHttp"),i+=String.fromCodePoint(c),e.consume(c),l):n(c)}function l(c){if(je(c)&&i.length<5)return i+=String.fromCodePoint(c),e.consume(c),l;if(c===58){const d=i.toLowerCase();if(d==="http"||d==="https")return e.consume(c),s}return n(c)}function s(c){return c===47?(e.consume(c),o?u:(o=!0,s)):n(c)}function u(c){return c===null||Pr(c)||de(c)||Dt(c)||Ir(c)?n(c):e.attempt(Ru,e.attempt(Pu,f),n)(c)}function f(c){return e.exit("literalAutolinkHttp"),e.exit("literalAutolink"),t(c)}}function d0(e,t,n){let r=0;return i;function i(a){return(a===87||a===119)&&r<3?(r++,e.consume(a),i):a===46&&r===3?(e.consume(a),o):n(a)}function o(a){return a===null?n(a):t(a)}}function h0(e,t,n){let r,i,o;return a;function a(u){return u===46||u===95?e.check(Iu,s,l)(u):u===null||de(u)||Dt(u)||u!==45&&Ir(u)?s(u):(o=!0,e.consume(u),a)}function l(u){return u===95?r=!0:(i=r,r=void 0),e.consume(u),a}function s(u){return i||r||!o?n(u):t(u)}}function m0(e,t){let n=0,r=0;return i;function i(a){return a===40?(n++,e.consume(a),i):a===41&&r<n?o(a):a===33||a===34||a===38||a===39||a===41||a===42||a===44||a===46||a===58||a===59||a===60||a===63||a===93||a===95||a===126?e.check(Iu,t,o)(a):a===null||de(a)||Dt(a)?t(a):(e.consume(a),i)}function o(a){return a===41&&r++,e.consume(a),i}}function g0(e,t,n){return r;function r(l){return l===33||l===34||l===39||l===41||l===42||l===44||l===46||l===58||l===59||l===63||l===95||l===126?(e.consume(l),r):l===38?(e.consume(l),o):l===93?(e.consume(l),i):l===60||l===null||de(l)||Dt(l)?t(l):n(l)}function i(l){return l===null||l===40||l===91||de(l)||Dt(l)?t(l):r(l)}function o(l){return je(l)?a(l):n(l)}function a(l){return l===59?(e.consume(l),r):je(l)?(e.consume(l),a):n(l)}}function y0(e,t,n){return r;function r(o){return e.consume(o),i}function i(o){return Oe(o)?n(o):t(o)}}function ju(e){return e===null||e===40||e===42||e===95||e===91||e===93||e===126||de(e)}function $u(e){return!je(e)}function Mu(e){return!(e===47||Po(e))}function Po(e){return e===43||e===45||e===46||e===95||Oe(e)}function Io(e){let t=e.length,n=!1;for(;t--;){const r=e[t][1];if((r.type==="labelLink"||r.type==="labelImage")&&!r._balanced){n=!0;break}if(r._gfmAutolinkLiteralWalkedInto){n=!1;break}}return e.length>0&&!n&&(e[e.length-1][1]._gfmAutolinkLiteralWalkedInto=!0),n}const x0={tokenize:E0,partial:!0};function b0(){return{document:{91:{name:"gfmFootnoteDefinition",tokenize:S0,continuation:{tokenize:_0},exit:C0}},text:{91:{name:"gfmFootnoteCall",tokenize:w0},93:{name:"gfmPotentialFootnoteCall",add:"after",tokenize:v0,resolveTo:k0}}}}function v0(e,t,n){const r=this;let i=r.events.length;const o=r.parser.gfmFootnotes||(r.parser.gfmFootnotes=[]);let a;for(;i--;){const s=r.events[i][1];if(s.type==="labelImage"){a=s;break}if(s.type==="gfmFootnoteCall"||s.type==="labelLink"||s.type==="label"||s.type==="image"||s.type==="link")break}return l;function l(s){if(!a||!a._balanced)return n(s);const u=it(r.sliceSerialize({start:a.end,end:r.now()}));return u.codePointAt(0)!==94||!o.includes(u.slice(1))?n(s):(e.enter("gfmFootnoteCallLabelMarker"),e.consume(s),e.exit("gfmFootnoteCallLabelMarker"),t(s))}}function k0(e,t){let n=e.length;for(;n--;)if(e[n][1].type==="labelImage"&&e[n][0]==="enter"){e[n][1];break}e[n+1][1].type="data",e[n+3][1].type="gfmFootnoteCallLabelMarker";const r={type:"gfmFootnoteCall",start:Object.assign({},e[n+3][1].start),end:Object.assign({},e[e.length-1][1].end)},i={type:"gfmFootnoteCallMarker",start:Object.assign({},e[n+3][1].end),end:Object.assign({},e[n+3][1].end)};i.end.column++,i.end.offset++,i.end._bufferIndex++;const o={type:"gfmFootnoteCallString",start:Object.assign({},i.end),end:Object.assign({},e[e.length-1][1].start)},a={type:"chunkString",contentType:"string",start:Object.assign({},o.start),end:Object.assign({},o.end)},l=[e[n+1],e[n+2],["enter",r,t],e[n+3],e[n+4],["enter",i,t],["exit",i,t],["enter",o,t],["enter",a,t],["exit",a,t],["exit",o,t],e[e.length-2],e[e.length-1],["exit",r,t]];return e.splice(n,e.length-n+1,...l),e}function w0(e,t,n){const r=this,i=r.parser.gfmFootnotes||(r.parser.gfmFootnotes=[]);let o=0,a;return l;function l(c){return e.enter("gfmFootnoteCall"),e.enter("gfmFootnoteCallLabelMarker"),e.consume(c),e.exit("gfmFootnoteCallLabelMarker"),s}function s(c){return c!==94?n(c):(e.enter("gfmFootnoteCallMarker"),e.consume(c),e.exit("gfmFootnoteCallMarker"),e.enter("gfmFootnoteCallString"),e.enter("chunkString").contentType="string",u)}function u(c){if(o>999||c===93&&!a||c===null||c===91||de(c))return n(c);if(c===93){e.exit("chunkString");const d=e.exit("gfmFootnoteCallString");return i.includes(it(r.sliceSerialize(d)))?(e.enter("gfmFootnoteCallLabelMarker"),e.consume(c),e.exit("gfmFootnoteCallLabelMarker"),e.exit("gfmFootnoteCall"),t):n(c)}return de(c)||(a=!0),o++,e.consume(c),c===92?f:u}function f(c){return c===91||c===92||c===93?(e.consume(c),o++,u):u(c)}}function S0(e,t,n){const r=this,i=r.parser.gfmFootnotes||(r.parser.gfmFootnotes=[]);let o,a=0,l;return s;function s(m){return e.enter("gfmFootnoteDefinition")._container=!0,e.enter("gfmFootnoteDefinitionLabel"),e.enter("gfmFootnoteDefinitionLabelMarker"),e.consume(m),e.exit("gfmFootnoteDefinitionLabelMarker"),u}function u(m){return m===94?(e.enter("gfmFootnoteDefinitionMarker"),e.consume(m),e.exit("gfmFootnoteDefinitionMarker"),e.enter("gfmFootnoteDefinitionLabelString"),e.enter("chunkString").contentType="string",f):n(m)}function f(m){if(a>999||m===93&&!l||m===null||m===91||de(m))return n(m);if(m===93){e.exit("chunkString");const h=e.exit("gfmFootnoteDefinitionLabelString");return o=it(r.sliceSerialize(h)),e.enter("gfmFootnoteDefinitionLabelMarker"),e.consume(m),e.exit("gfmFootnoteDefinitionLabelMarker"),e.exit("gfmFootnoteDefinitionLabel"),d}return de(m)||(l=!0),a++,e.consume(m),m===92?c:f}function c(m){return m===91||m===92||m===93?(e.consume(m),a++,f):f(m)}function d(m){return m===58?(e.enter("definitionMarker"),e.consume(m),e.exit("definitionMarker"),i.includes(o)||i.push(o),ne(e,p,"gfmFootnoteDefinitionWhitespace")):n(m)}function p(m){return t(m)}}function _0(e,t,n){return e.check(Nn,t,e.attempt(x0,t,n))}function C0(e){e.exit("gfmFootnoteDefinition")}function E0(e,t,n){const r=this;return ne(e,i,"gfmFootnoteDefinitionIndent",5);function i(o){const a=r.events[r.events.length-1];return a&&a[1].type==="gfmFootnoteDefinitionIndent"&&a[2].sliceSerialize(a[1],!0).length===4?t(o):n(o)}}function T0(e){let n=(e||{}).singleTilde;const r={name:"strikethrough",tokenize:o,resolveAll:i};return n==null&&(n=!0),{text:{126:r},insideSpan:{null:[r]},attentionMarkers:{null:[126]}};function i(a,l){let s=-1;for(;++s<a.length;)if(a[s][0]==="enter"&&a[s][1].type==="strikethroughSequenceTemporary"&&a[s][1]._close){let u=s;for(;u--;)if(a[u][0]==="exit"&&a[u][1].type==="strikethroughSequenceTemporary"&&a[u][1]._open&&a[s][1].end.offset-a[s][1].start.offset===a[u][1].end.offset-a[u][1].start.offset){a[s][1].type="strikethroughSequence",a[u][1].type="strikethroughSequence";const f={type:"strikethrough",start:Object.assign({},a[u][1].start),end:Object.assign({},a[s][1].end)},c={type:"strikethroughText",start:Object.assign({},a[u][1].end),end:Object.assign({},a[s][1].start)},d=[["enter",f,l],["enter",a[u][1],l],["exit",a[u][1],l],["enter",c,l]],p=l.parser.constructs.insideSpan.null;p&&Ve(d,d.length,0,Ar(p,a.slice(u+1,s),l)),Ve(d,d.length,0,[["exit",c,l],["enter",a[s][1],l],["exit",a[s][1],l],["exit",f,l]]),Ve(a,u-1,s-u+3,d),s=u+d.length-2;break}}for(s=-1;++s<a.length;)a[s][1].type==="strikethroughSequenceTemporary"&&(a[s][1].type="data");return a}function o(a,l,s){const u=this.previous,f=this.events;let c=0;return d;function d(m){return u===126&&f[f.length-1][1].type!=="characterEscape"?s(m):(a.enter("strikethroughSequenceTemporary"),p(m))}function p(m){const h=fn(u);if(m===126)return c>1?s(m):(a.consume(m),c++,p);if(c<2&&!n)return s(m);const k=a.exit("strikethroughSequenceTemporary"),b=fn(m);return k._open=!b||b===2&&!!h,k._close=!h||h===2&&!!b,l(m)}}}class R0{constructor(){this.map=[]}add(t,n,r){P0(this,t,n,r)}consume(t){if(this.map.sort(function(o,a){return o[0]-a[0]}),this.map.length===0)return;let n=this.map.length;const r=[];for(;n>0;)n-=1,r.push(t.slice(this.map[n][0]+this.map[n][1]),this.map[n][2]),t.length=this.map[n][0];r.push(t.slice()),t.length=0;let i=r.pop();for(;i;){for(const o of i)t.push(o);i=r.pop()}this.map.length=0}}function P0(e,t,n,r){let i=0;if(!(n===0&&r.length===0)){for(;i<e.map.length;){if(e.map[i][0]===t){e.map[i][1]+=n,e.map[i][2].push(...r);return}i+=1}e.map.push([t,n,r])}}function I0(e,t){let n=!1;const r=[];for(;t<e.length;){const i=e[t];if(n){if(i[0]==="enter")i[1].type==="tableContent"&&r.push(e[t+1][1].type==="tableDelimiterMarker"?"left":"none");else if(i[1].type==="tableContent"){if(e[t-1][1].type==="tableDelimiterMarker"){const o=r.length-1;r[o]=r[o]==="left"?"center":"right"}}else if(i[1].type==="tableDelimiterRow")break}else i[0]==="enter"&&i[1].type==="tableDelimiterRow"&&(n=!0);t+=1}return r}function A0(){return{flow:{null:{name:"table",tokenize:O0,resolveAll:j0}}}}function O0(e,t,n){const r=this;let i=0,o=0,a;return l;function l(S){let z=r.events.length-1;for(;z>-1;){const R=r.events[z][1].type;if(R==="lineEnding"||R==="linePrefix")z--;else break}const $=z>-1?r.events[z][1].type:null,_=$==="tableHead"||$==="tableRow"?w:s;return _===w&&r.parser.lazy[r.now().line]?n(S):_(S)}function s(S){return e.enter("tableHead"),e.enter("tableRow"),u(S)}function u(S){return S===124||(a=!0,o+=1),f(S)}function f(S){return S===null?n(S):U(S)?o>1?(o=0,r.interrupt=!0,e.exit("tableRow"),e.enter("lineEnding"),e.consume(S),e.exit("lineEnding"),p):n(S):ee(S)?ne(e,f,"whitespace")(S):(o+=1,a&&(a=!1,i+=1),S===124?(e.enter("tableCellDivider"),e.consume(S),e.exit("tableCellDivider"),a=!0,f):(e.enter("data"),c(S)))}function c(S){return S===null||S===124||de(S)?(e.exit("data"),f(S)):(e.consume(S),S===92?d:c)}function d(S){return S===92||S===124?(e.consume(S),c):c(S)}function p(S){return r.interrupt=!1,r.parser.lazy[r.now().line]?n(S):(e.enter("tableDelimiterRow"),a=!1,ee(S)?ne(e,m,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(S):m(S))}function m(S){return S===45||S===58?k(S):S===124?(a=!0,e.enter("tableCellDivider"),e.consume(S),e.exit("tableCellDivider"),h):D(S)}function h(S){return ee(S)?ne(e,k,"whitespace")(S):k(S)}function k(S){return S===58?(o+=1,a=!0,e.enter("tableDelimiterMarker"),e.consume(S),e.exit("tableDelimiterMarker"),b):S===45?(o+=1,b(S)):S===null||U(S)?M(S):D(S)}function b(S){return S===45?(e.enter("tableDelimiterFiller"),C(S)):D(S)}function C(S){return S===45?(e.consume(S),C):S===58?(a=!0,e.exit("tableDelimiterFiller"),e.enter("tableDelimiterMarker"),e.consume(S),e.exit("tableDelimiterMarker"),T):(e.exit("tableDelimiterFiller"),T(S))}function T(S){return ee(S)?ne(e,M,"whitespace")(S):M(S)}function M(S){return S===124?m(S):S===null||U(S)?!a||i!==o?D(S):(e.exit("tableDelimiterRow"),e.exit("tableHead"),t(S)):D(S)}function D(S){return n(S)}function w(S){return e.enter("tableRow"),O(S)}function O(S){return S===124?(e.enter("tableCellDivider"),e.consume(S),e.exit("tableCellDivider"),O):S===null||U(S)?(e.exit("tableRow"),t(S)):ee(S)?ne(e,O,"whitespace")(S):(e.enter("data"),Q(S))}function Q(S){return S===null||S===124||de(S)?(e.exit("data"),O(S)):(e.consume(S),S===92?H:Q)}function H(S){return S===92||S===124?(e.consume(S),Q):Q(S)}}function j0(e,t){let n=-1,r=!0,i=0,o=[0,0,0,0],a=[0,0,0,0],l=!1,s=0,u,f,c;const d=new R0;for(;++n<e.length;){const p=e[n],m=p[1];p[0]==="enter"?m.type==="tableHead"?(l=!1,s!==0&&(zu(d,t,s,u,f),f=void 0,s=0),u={type:"table",start:Object.assign({},m.start),end:Object.assign({},m.end)},d.add(n,0,[["enter",u,t]])):m.type==="tableRow"||m.type==="tableDelimiterRow"?(r=!0,c=void 0,o=[0,0,0,0],a=[0,n+1,0,0],l&&(l=!1,f={type:"tableBody",start:Object.assign({},m.start),end:Object.assign({},m.end)},d.add(n,0,[["enter",f,t]])),i=m.type==="tableDelimiterRow"?2:f?3:1):i&&(m.type==="data"||m.type==="tableDelimiterMarker"||m.type==="tableDelimiterFiller")?(r=!1,a[2]===0&&(o[1]!==0&&(a[0]=a[1],c=Hr(d,t,o,i,void 0,c),o=[0,0,0,0]),a[2]=n)):m.type==="tableCellDivider"&&(r?r=!1:(o[1]!==0&&(a[0]=a[1],c=Hr(d,t,o,i,void 0,c)),o=a,a=[o[1],n,0,0])):m.type==="tableHead"?(l=!0,s=n):m.type==="tableRow"||m.type==="tableDelimiterRow"?(s=n,o[1]!==0?(a[0]=a[1],c=Hr(d,t,o,i,n,c)):a[1]!==0&&(c=Hr(d,t,a,i,n,c)),i=0):i&&(m.type==="data"||m.type==="tableDelimiterMarker"||m.type==="tableDelimiterFiller")&&(a[3]=n)}for(s!==0&&zu(d,t,s,u,f),d.consume(t.events),n=-1;++n<t.events.length;){const p=t.events[n];p[0]==="enter"&&p[1].type==="table"&&(p[1]._align=I0(t.events,n))}return e}function Hr(e,t,n,r,i,o){const a=r===1?"tableHeader":r===2?"tableDelimiter":"tableData",l="tableContent";n[0]!==0&&(o.end=Object.assign({},dn(t.events,n[0])),e.add(n[0],0,[["exit",o,t]]));const s=dn(t.events,n[1]);if(o={type:a,start:Object.assign({},s),end:Object.assign({},s)},e.add(n[1],0,[["enter",o,t]]),n[2]!==0){const u=dn(t.events,n[2]),f=dn(t.events,n[3]),c={type:l,start:Object.assign({},u),end:Object.assign({},f)};if(e.add(n[2],0,[["enter",c,t]]),r!==2){const d=t.events[n[2]],p=t.events[n[3]];if(d[1].end=Object.assign({},p[1].end),d[1].type="chunkText",d[1].contentType="text",n[3]>n[2]+1){const m=n[2]+1,h=n[3]-n[2]-1;e.add(m,h,[])}}e.add(n[3]+1,0,[["exit",c,t]])}return i!==void 0&&(o.end=Object.assign({},dn(t.events,i)),e.add(i,0,[["exit",o,t]]),o=void 0),o}function zu(e,t,n,r,i){const o=[],a=dn(t.events,n);i&&(i.end=Object.assign({},a),o.push(["exit",i,t])),r.end=Object.assign({},a),o.push(["exit",r,t]),e.add(n+1,0,o)}function dn(e,t){const n=e[t],r=n[0]==="enter"?"start":"end";return n[1][r]}const $0={name:"tasklistCheck",tokenize:z0};function M0(){return{text:{91:$0}}}function z0(e,t,n){const r=this;return i;function i(s){return r.previous!==null||!r._gfmTasklistFirstContentOfListItem?n(s):(e.enter("taskListCheck"),e.enter("taskListCheckMarker"),e.consume(s),e.exit("taskListCheckMarker"),o)}function o(s){return de(s)?(e.enter("taskListCheckValueUnchecked"),e.consume(s),e.exit("taskListCheckValueUnchecked"),a):s===88||s===120?(e.enter("taskListCheckValueChecked"),e.consume(s),e.exit("taskListCheckValueChecked"),a):n(s)}function a(s){return s===93?(e.enter("taskListCheckMarker"),e.consume(s),e.exit("taskListCheckMarker"),e.exit("taskListCheck"),l):n(s)}function l(s){return U(s)?t(s):ee(s)?e.check({tokenize:D0},t,n)(s):n(s)}}function D0(e,t,n){return ne(e,r,"whitespace");function r(i){return i===null?n(i):t(i)}}function F0(e){return fs([u0(),b0(),T0(e),A0(),M0()])}const L0={};function B0(e){const t=this,n=e||L0,r=t.data(),i=r.micromarkExtensions||(r.micromarkExtensions=[]),o=r.fromMarkdownExtensions||(r.fromMarkdownExtensions=[]),a=r.toMarkdownExtensions||(r.toMarkdownExtensions=[]);i.push(F0(n)),o.push(o0()),a.push(a0(n))}var Ao={},N0=Se;Object.defineProperty(Ao,"__esModule",{value:!0});var Du=Ao.default=void 0,U0=N0(Re()),H0=Te();Du=Ao.default=(0,U0.default)((0,H0.jsx)("path",{d:"M16.59 8.59 12 13.17 7.41 8.59 6 10l6 6 6-6z"}),"ExpandMore");var Oo={},W0=Se;Object.defineProperty(Oo,"__esModule",{value:!0});var Fu=Oo.default=void 0,q0=W0(Re()),V0=Te();Fu=Oo.default=(0,q0.default)((0,V0.jsx)("path",{d:"m12 8-6 6 1.41 1.41L12 10.83l4.59 4.58L18 14z"}),"ExpandLess");var jo={},Y0=Se;Object.defineProperty(jo,"__esModule",{value:!0});var Lu=jo.default=void 0,G0=Y0(Re()),K0=Te();Lu=jo.default=(0,G0.default)((0,K0.jsx)("path",{d:"m22.7 19-9.1-9.1c.9-2.3.4-5-1.5-6.9-2-2-5-2.4-7.4-1.3L9 6 6 9 1.6 4.7C.4 7.1.9 10.1 2.9 12.1c1.9 1.9 4.6 2.4 6.9 1.5l9.1 9.1c.4.4 1 .4 1.4 0l2.3-2.3c.5-.4.5-1.1.1-1.4"}),"Build");var $o={},X0=Se;Object.defineProperty($o,"__esModule",{value:!0});var Bu=$o.default=void 0,J0=X0(Re()),Q0=Te();Bu=$o.default=(0,J0.default)((0,Q0.jsx)("path",{d:"M16.59 7.58 10 14.17l-3.59-3.58L5 12l5 5 8-8zM12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2m0 18c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8"}),"CheckCircleOutline");var Mo={},Z0=Se;Object.defineProperty(Mo,"__esModule",{value:!0});var Nu=Mo.default=void 0,ev=Z0(Re()),tv=Te();Nu=Mo.default=(0,ev.default)((0,tv.jsx)("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2M4 12c0-4.42 3.58-8 8-8 1.85 0 3.55.63 4.9 1.69L5.69 16.9C4.63 15.55 4 13.85 4 12m8 8c-1.85 0-3.55-.63-4.9-1.69L18.31 7.1C19.37 8.45 20 10.15 20 12c0 4.42-3.58 8-8 8"}),"Block");var zo={},nv=Se;Object.defineProperty(zo,"__esModule",{value:!0});var Uu=zo.default=void 0,rv=nv(Re()),iv=Te();Uu=zo.default=(0,rv.default)((0,iv.jsx)("path",{d:"M6 2v6h.01L6 8.01 10 12l-4 4 .01.01H6V22h12v-5.99h-.01L18 16l-4-4 4-3.99-.01-.01H18V2zm10 14.5V20H8v-3.5l4-4zm-4-5-4-4V4h8v3.5z"}),"HourglassEmpty");const ov=window.React.useState,bt=window.__mui__.Box,Gn=window.__mui__.Typography,av=window.__mui__.Collapse,lv=window.__mui__.IconButton,sv=window.__mui__.CircularProgress,uv=window.__foc__.useTheme,cv={executing:{label:"Running",color:"#3B82F6",icon:v.jsx(sv,{size:12,sx:{color:"#3B82F6"}})},completed:{label:"Done",color:"#10B981",icon:v.jsx(Bu,{sx:{fontSize:14,color:"#10B981"}})},blocked:{label:"Blocked",color:"#EF4444",icon:v.jsx(Nu,{sx:{fontSize:14,color:"#EF4444"}})},awaiting_confirmation:{label:"Awaiting Approval",color:"#F59E0B",icon:v.jsx(Uu,{sx:{fontSize:14,color:"#F59E0B"}})}},fv=({toolCall:e})=>{const t=uv(),[n,r]=ov(!1),i=cv[e.status],o=e.input&&Object.keys(e.input).length>0||e.result||e.blockedReason;return v.jsxs(bt,{sx:{border:`1px solid ${t.primary.plainBorder||"rgba(255,255,255,0.12)"}`,borderRadius:"8px",overflow:"hidden",my:1,fontSize:"0.8rem"},children:[v.jsxs(bt,{sx:{display:"flex",alignItems:"center",gap:1,px:1.5,py:1,bgcolor:t.background.level2||"rgba(255,255,255,0.05)",cursor:o?"pointer":"default"},onClick:()=>o&&r(a=>!a),children:[v.jsx(Lu,{sx:{fontSize:14,opacity:.7}}),v.jsx(Gn,{sx:{fontSize:"0.8rem",fontFamily:"monospace",flex:1},children:e.name}),v.jsxs(bt,{sx:{display:"flex",alignItems:"center",gap:.5},children:[i.icon,v.jsx(Gn,{sx:{fontSize:"0.75rem",color:i.color},children:i.label})]}),o&&v.jsx(lv,{size:"small",sx:{p:0,ml:.5},children:n?v.jsx(Fu,{sx:{fontSize:16}}):v.jsx(Du,{sx:{fontSize:16}})})]}),v.jsx(av,{in:n,children:v.jsxs(bt,{sx:{px:1.5,py:1,bgcolor:t.background.level1},children:[e.input&&Object.keys(e.input).length>0&&v.jsxs(bt,{sx:{mb:1},children:[v.jsx(Gn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.6,mb:.5,textTransform:"uppercase"},children:"Input"}),v.jsx(bt,{component:"pre",sx:{fontSize:"0.75rem",fontFamily:"monospace",bgcolor:t.background.level2,p:1,borderRadius:"4px",overflowX:"auto",m:0,whiteSpace:"pre-wrap",wordBreak:"break-all"},children:JSON.stringify(e.input,null,2)})]}),e.blockedReason&&v.jsx(bt,{sx:{mb:1},children:v.jsxs(Gn,{sx:{fontSize:"0.7rem",fontWeight:600,color:"#EF4444",mb:.5},children:["Blocked: ",e.blockedReason]})}),e.result&&v.jsxs(bt,{children:[v.jsx(Gn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.6,mb:.5,textTransform:"uppercase"},children:"Result"}),v.jsx(bt,{component:"pre",sx:{fontSize:"0.75rem",fontFamily:"monospace",bgcolor:t.background.level2,p:1,borderRadius:"4px",overflowX:"auto",m:0,whiteSpace:"pre-wrap",wordBreak:"break-all",maxHeight:"200px",overflow:"auto"},children:e.result})]})]})})]})},ot=window.__mui__.Box,Lt=window.__mui__.Typography,pv=window.__mui__.Avatar,dv=window.__foc__.useTheme,hv={p:({children:e})=>v.jsx(Lt,{component:"p",sx:{fontSize:"0.875rem",lineHeight:1.7,mb:1,mt:0},children:e}),code:({inline:e,children:t,className:n})=>e?v.jsx(ot,{component:"code",sx:{fontFamily:"monospace",fontSize:"0.8rem",bgcolor:"rgba(255,255,255,0.08)",px:.5,py:.25,borderRadius:"3px"},children:t}):v.jsx(ot,{component:"pre",sx:{fontFamily:"monospace",fontSize:"0.8rem",bgcolor:"rgba(0,0,0,0.3)",p:1.5,borderRadius:"6px",overflowX:"auto",my:1,whiteSpace:"pre-wrap",wordBreak:"break-word"},children:v.jsx("code",{className:n,children:t})}),h1:({children:e})=>v.jsx(Lt,{variant:"h6",sx:{fontWeight:700,mb:1,mt:1.5},children:e}),h2:({children:e})=>v.jsx(Lt,{sx:{fontWeight:700,fontSize:"1rem",mb:1,mt:1.5},children:e}),h3:({children:e})=>v.jsx(Lt,{sx:{fontWeight:600,fontSize:"0.9rem",mb:.75,mt:1},children:e}),ul:({children:e})=>v.jsx(ot,{component:"ul",sx:{pl:2.5,mb:1,mt:0},children:e}),ol:({children:e})=>v.jsx(ot,{component:"ol",sx:{pl:2.5,mb:1,mt:0},children:e}),li:({children:e})=>v.jsx(Lt,{component:"li",sx:{fontSize:"0.875rem",lineHeight:1.6,mb:.25},children:e}),blockquote:({children:e})=>v.jsx(ot,{sx:{borderLeft:"3px solid rgba(255,255,255,0.2)",pl:1.5,my:1,opacity:.8},children:e}),strong:({children:e})=>v.jsx(ot,{component:"strong",sx:{fontWeight:700},children:e})},mv=({message:e})=>{var r;const t=dv(),n=e.role==="user";return v.jsxs(ot,{sx:{display:"flex",gap:1.5,px:2,py:1.5,bgcolor:n?t.background.level1:t.background.header,alignItems:"flex-start"},children:[v.jsx(pv,{sx:{width:28,height:28,bgcolor:n?((r=t.primary)==null?void 0:r.main)||"#6366f1":"#D97706",flexShrink:0,mt:.25},children:n?v.jsx(zl,{sx:{fontSize:16}}):v.jsx(zn,{sx:{fontSize:16}})}),v.jsxs(ot,{sx:{flex:1,minWidth:0},children:[v.jsx(Lt,{sx:{fontWeight:600,fontSize:"0.8rem",mb:.5,opacity:.7},children:n?"You":"Claude"}),n?v.jsx(Lt,{sx:{fontSize:"0.875rem",lineHeight:1.7,whiteSpace:"pre-wrap"},children:e.content}):v.jsxs(v.Fragment,{children:[e.content&&v.jsx(ot,{sx:{"& > *:last-child":{mb:0}},children:v.jsx(T1,{remarkPlugins:[B0],components:hv,children:e.content})}),e.isStreaming&&!e.content&&v.jsx(ot,{sx:{display:"inline-flex",gap:"3px",alignItems:"center",mt:.5},children:[0,1,2].map(i=>v.jsx(ot,{sx:{width:6,height:6,borderRadius:"50%",bgcolor:"#D97706",animation:"pulse 1.2s ease-in-out infinite",animationDelay:`${i*.2}s`,"@keyframes pulse":{"0%, 80%, 100%":{opacity:.2},"40%":{opacity:1}}}},i))}),(e.toolCalls||[]).map(i=>v.jsx(fv,{toolCall:i},i.id))]})]})]})},gv=window.React.useEffect,yv=window.React.useRef,xv=window.__mui__.Box,Hu=window.recoil.useRecoilValue,bv=()=>{const e=Hu(We),t=Hu(ln),n=yv(null);return gv(()=>{var r;(r=n.current)==null||r.scrollIntoView({behavior:"smooth"})},[e,t]),v.jsxs(xv,{sx:{flex:1,overflow:"auto"},children:[e.map(r=>v.jsx(mv,{message:r},r.id)),v.jsx("div",{ref:n})]})},Wu=window.__mui__.Box,Do=window.__mui__.Typography,vv=window.__mui__.Avatar,kv=window.__mui__.Chip,wv=window.__foc__.useTheme,Sv=window.recoil.useRecoilValue,_v=[{label:"List my datasets",prompt:"List all my FiftyOne datasets."},{label:"Dataset summary",prompt:"Give me a summary of the current dataset."},{label:"Find duplicates",prompt:"Use the fiftyone-find-duplicates skill to find duplicate images in the current dataset."},{label:"Visualize embeddings",prompt:"Use the fiftyone-embeddings-visualization skill to visualize the current dataset in 2D."}],Cv=({onPromptClick:e})=>{const t=wv(),r=Sv(zi).activeSkills.slice(0,4).map(o=>({label:o.replace("fiftyone-","").replace(/-/g," "),prompt:`Use the ${o} skill.`})),i=r.length>0?r:_v;return v.jsxs(Wu,{sx:{display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",flex:1,p:3,textAlign:"center"},children:[v.jsx(vv,{sx:{width:56,height:56,bgcolor:"#D97706",mb:2},children:v.jsx(zn,{sx:{fontSize:32}})}),v.jsx(Do,{variant:"h6",sx:{mb:.5,fontWeight:700},children:"Voxel Agent"}),v.jsx(Do,{variant:"body2",sx:{maxWidth:380,mb:3,opacity:.65,lineHeight:1.6},children:"Ask questions about your datasets, run models, explore data, or use skills to automate complex FiftyOne workflows."}),v.jsx(Do,{variant:"caption",sx:{mb:1.5,opacity:.5,textTransform:"uppercase",letterSpacing:1},children:"Try asking"}),v.jsx(Wu,{sx:{display:"flex",flexWrap:"wrap",gap:1,justifyContent:"center",maxWidth:440},children:i.map((o,a)=>{var l,s,u;return v.jsx(kv,{icon:v.jsx(an,{sx:{fontSize:14}}),label:o.label,onClick:()=>e(o.prompt),sx:{cursor:"pointer",bgcolor:((l=t.background)==null?void 0:l.level1)||"rgba(255,255,255,0.05)",border:`1px solid ${((s=t.primary)==null?void 0:s.plainBorder)||"rgba(255,255,255,0.12)"}`,fontSize:"0.8rem","&:hover":{bgcolor:((u=t.background)==null?void 0:u.level2)||"rgba(255,255,255,0.1)",borderColor:"#D97706"},transition:"all 0.15s ease"}},a)})})]})};var Fo={},Ev=Se;Object.defineProperty(Fo,"__esModule",{value:!0});var qu=Fo.default=void 0,Tv=Ev(Re()),Rv=Te();qu=Fo.default=(0,Tv.default)((0,Rv.jsx)("path",{d:"M2.01 21 23 12 2.01 3 2 10l15 2-15 2z"}),"Send");var Lo={},Pv=Se;Object.defineProperty(Lo,"__esModule",{value:!0});var Vu=Lo.default=void 0,Iv=Pv(Re()),Av=Te();Vu=Lo.default=(0,Iv.default)((0,Av.jsx)("path",{d:"M6 6h12v12H6z"}),"Stop");var Bo={},Ov=Se;Object.defineProperty(Bo,"__esModule",{value:!0});var Yu=Bo.default=void 0,jv=Ov(Re()),$v=Te();Yu=Bo.default=(0,jv.default)((0,$v.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6zM8 9h8v10H8zm7.5-5-1-1h-5l-1 1H5v2h14V4z"}),"DeleteOutline");const hn=window.React.useCallback,mn=window.__foo__.useOperatorExecutor,gn="@adonaivera/claude-agent";function Mv(){const e=mn(`${gn}/send_message`);return hn(t=>e.execute(t),[e])}function zv(){const e=mn(`${gn}/confirm_operation`);return hn(t=>e.execute({pending_id:t}),[e])}function Dv(){const e=mn(`${gn}/cancel_operation`);return hn(t=>e.execute({pending_id:t}),[e])}function Fv(){const e=mn(`${gn}/load_config`);return hn(()=>e.execute({}),[e])}function Gu(){const e=mn(`${gn}/save_config`);return hn(t=>e.execute(t),[e])}function Lv(){const e=mn(`${gn}/clear_history`);return hn(()=>e.execute({}),[e])}const Bv=window.React.useRef,Nv=window.React.useEffect,Uv=window.__mui__.Box,Hv=window.__mui__.OutlinedInput,Ku=window.__mui__.IconButton,Xu=window.__mui__.Tooltip,Wv=window.__foc__.useTheme,qv=window.recoil.useRecoilState,Ju=window.recoil.useRecoilValue,Vv=({onSend:e})=>{var c,d,p,m;const t=Wv(),n=Bv(null),[r,i]=qv(Jh),o=Ju(ln),a=Ju(We),l=Lv(),s=()=>{const h=r.trim();!h||o||(i(""),e(h))},u=h=>{h.key==="Enter"&&!h.shiftKey&&(h.preventDefault(),s())};Nv(()=>{var h;o||(h=n.current)==null||h.focus()},[o]);const f=async()=>{await l()};return v.jsxs(Uv,{sx:{borderTop:`1px solid ${((c=t.primary)==null?void 0:c.plainBorder)||"rgba(255,255,255,0.08)"}`,p:1.5,display:"flex",gap:1,alignItems:"flex-end"},children:[a.length>0&&v.jsx(Xu,{title:"Clear history",children:v.jsx(Ku,{size:"small",onClick:f,sx:{mb:.25,opacity:.5,"&:hover":{opacity:1}},children:v.jsx(Yu,{sx:{fontSize:18}})})}),v.jsx(Hv,{inputRef:n,fullWidth:!0,multiline:!0,maxRows:6,value:r,onChange:h=>i(h.target.value),onKeyDown:u,disabled:o,placeholder:"Ask Claude about your data...",sx:{fontSize:"0.875rem","& .MuiOutlinedInput-notchedOutline":{borderColor:((d=t.primary)==null?void 0:d.plainBorder)||"rgba(255,255,255,0.15)"},"&:hover .MuiOutlinedInput-notchedOutline":{borderColor:((p=t.primary)==null?void 0:p.main)||"#6366f1"}},endAdornment:v.jsx(Xu,{title:o?"Stop":"Send (Enter)",children:v.jsx("span",{children:v.jsx(Ku,{disabled:!r.trim()&&!o,onClick:o?void 0:s,sx:{p:.5},children:o?v.jsx(Vu,{sx:{fontSize:20,color:"#EF4444"}}):v.jsx(qu,{sx:{fontSize:20,opacity:r.trim()?1:.3,color:r.trim()?((m=t.primary)==null?void 0:m.main)||"#6366f1":void 0}})})})})})]})};var No={},Yv=Se;Object.defineProperty(No,"__esModule",{value:!0});var Qu=No.default=void 0,Gv=Yv(Re()),Kv=Te();Qu=No.default=(0,Gv.default)((0,Kv.jsx)("path",{d:"M19 13h-6v6h-2v-6H5v-2h6V5h2v6h6z"}),"Add");var Uo={},Xv=Se;Object.defineProperty(Uo,"__esModule",{value:!0});var Zu=Uo.default=void 0,Jv=Xv(Re()),Qv=Te();Zu=Uo.default=(0,Jv.default)((0,Qv.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6zM19 4h-3.5l-1-1h-5l-1 1H5v2h14z"}),"Delete");const Zv=window.React.useState,ht=window.__mui__.Box,Kn=window.__mui__.Typography,ek=window.__mui__.TextField,ec=window.__mui__.Switch,tk=window.__mui__.FormControlLabel,nk=window.__mui__.Button,tc=window.__mui__.IconButton,rk=window.__mui__.Chip,nc=window.__mui__.Select,yn=window.__mui__.MenuItem,rc=window.__mui__.FormControl,ic=window.__mui__.InputLabel,oc=window.__mui__.Divider,ac=window.__mui__.Tooltip,ik=window.__foc__.useTheme,ok=window.recoil.useRecoilState,Wr=({children:e})=>v.jsx(Kn,{sx:{fontSize:"0.7rem",fontWeight:700,textTransform:"uppercase",letterSpacing:"0.08em",opacity:.5,mb:1.5,mt:2},children:e}),ak=()=>{ik();const[e,t]=ok(zi),[n,r]=Zv(!1),i=Gu(),o=(c,d)=>{t(p=>({...p,settings:{...p.settings,[c]:d}}))},a=c=>{t(d=>{const p=d.activeSkills.includes(c)?d.activeSkills.filter(m=>m!==c):[...d.activeSkills,c];return{...d,activeSkills:p}})},l=c=>{t(d=>({...d,mcpServers:d.mcpServers.map((p,m)=>m===c?{...p,enabled:!p.enabled}:p)}))},s=c=>{t(d=>({...d,mcpServers:d.mcpServers.filter((p,m)=>m!==c)}))},u=()=>{const c={label:"New MCP Server",command:"python",args:[],enabled:!1};t(d=>({...d,mcpServers:[...d.mcpServers,c]}))},f=async()=>{await i({mcpServers:e.mcpServers,activeSkills:e.activeSkills,settings:e.settings}),r(!0),setTimeout(()=>r(!1),2e3)};return v.jsxs(ht,{sx:{flex:1,overflow:"auto",p:2},children:[v.jsx(Wr,{children:"Model"}),v.jsxs(rc,{fullWidth:!0,size:"small",sx:{mb:1.5},children:[v.jsx(ic,{children:"Model"}),v.jsxs(nc,{value:e.settings.model,label:"Model",onChange:c=>o("model",c.target.value),children:[v.jsx(yn,{value:"claude-sonnet-4-20250514",children:"Claude Sonnet 4"}),v.jsx(yn,{value:"claude-opus-4-5",children:"Claude Opus 4.5"}),v.jsx(yn,{value:"claude-haiku-4-5-20251001",children:"Claude Haiku 4.5"})]})]}),v.jsx(ek,{fullWidth:!0,size:"small",label:"Max Tokens",type:"number",value:e.settings.maxTokens,onChange:c=>o("maxTokens",parseInt(c.target.value,10)||8192),sx:{mb:1.5},inputProps:{min:256,max:32e3,step:256}}),v.jsx(Wr,{children:"Permission Mode"}),v.jsxs(rc,{fullWidth:!0,size:"small",sx:{mb:1.5},children:[v.jsx(ic,{children:"Mode"}),v.jsxs(nc,{value:e.settings.permissionMode,label:"Mode",onChange:c=>o("permissionMode",c.target.value),children:[v.jsx(yn,{value:"auto",children:"Auto (confirm dangerous ops)"}),v.jsx(yn,{value:"confirm_all",children:"Confirm all tool calls"}),v.jsx(yn,{value:"block_all",children:"Block all tool calls"})]})]}),v.jsx(tk,{control:v.jsx(ec,{size:"small",checked:e.settings.persistHistory,onChange:c=>o("persistHistory",c.target.checked)}),label:v.jsx(Kn,{sx:{fontSize:"0.875rem"},children:"Persist conversation history"}),sx:{mb:1}}),v.jsx(oc,{sx:{my:2,opacity:.2}}),v.jsx(Wr,{children:"Active Skills"}),e.availableSkills.length===0?v.jsxs(Kn,{sx:{fontSize:"0.8rem",opacity:.5,mb:1.5},children:["No skills found. Place skill directories in"," ",v.jsx(ht,{component:"code",sx:{fontSize:"0.75rem"},children:"~/.fiftyone/skills/"})," ","or set the"," ",v.jsx(ht,{component:"code",sx:{fontSize:"0.75rem"},children:"FIFTYONE_SKILLS_DIR"})," ","secret."]}):v.jsx(ht,{sx:{display:"flex",flexWrap:"wrap",gap:.75,mb:1.5},children:e.availableSkills.map(c=>{const d=e.activeSkills.includes(c);return v.jsx(rk,{icon:v.jsx(an,{sx:{fontSize:12}}),label:c.replace("fiftyone-","").replace(/-/g," "),onClick:()=>a(c),variant:d?"filled":"outlined",size:"small",sx:{fontSize:"0.75rem",cursor:"pointer",bgcolor:d?"#D9770620":"transparent",borderColor:d?"#D97706":"rgba(255,255,255,0.2)",color:d?"#D97706":void 0}},c)})}),v.jsx(oc,{sx:{my:2,opacity:.2}}),v.jsxs(ht,{sx:{display:"flex",alignItems:"center",mb:1},children:[v.jsx(Wr,{children:"MCP Servers"}),v.jsx(ht,{sx:{flex:1}}),v.jsx(ac,{title:"Add MCP server",children:v.jsx(tc,{size:"small",onClick:u,children:v.jsx(Qu,{sx:{fontSize:18}})})})]}),e.mcpServers.map((c,d)=>v.jsxs(ht,{sx:{border:`1px solid ${c.enabled?"#D97706":"rgba(255,255,255,0.1)"}`,borderRadius:"8px",p:1.5,mb:1},children:[v.jsxs(ht,{sx:{display:"flex",alignItems:"center",justifyContent:"space-between",mb:1},children:[v.jsx(Kn,{sx:{fontSize:"0.85rem",fontWeight:600},children:c.label||"MCP Server"}),v.jsxs(ht,{sx:{display:"flex",alignItems:"center",gap:.5},children:[v.jsx(ec,{size:"small",checked:c.enabled,onChange:()=>l(d)}),v.jsx(ac,{title:"Remove",children:v.jsx(tc,{size:"small",onClick:()=>s(d),sx:{opacity:.5,"&:hover":{opacity:1}},children:v.jsx(Zu,{sx:{fontSize:16}})})})]})]}),v.jsxs(Kn,{sx:{fontSize:"0.75rem",fontFamily:"monospace",opacity:.6},children:[c.command," ",c.args.join(" ")]})]},d)),v.jsx(ht,{sx:{mt:3,display:"flex",justifyContent:"flex-end"},children:v.jsx(nk,{variant:"contained",onClick:f,sx:{bgcolor:n?"#10B981":"#D97706","&:hover":{bgcolor:n?"#059669":"#B45309"},transition:"background-color 0.2s"},children:n?"Saved!":"Save Settings"})})]})};var Ho={},lk=Se;Object.defineProperty(Ho,"__esModule",{value:!0});var lc=Ho.default=void 0,sk=lk(Re()),sc=Te();lc=Ho.default=(0,sk.default)([(0,sc.jsx)("path",{d:"M12 5.99 19.53 19H4.47zM12 2 1 21h22z"},"0"),(0,sc.jsx)("path",{d:"M13 16h-2v2h2zm0-6h-2v5h2z"},"1")],"WarningAmber");var Wo={},uk=Se;Object.defineProperty(Wo,"__esModule",{value:!0});var uc=Wo.default=void 0,ck=uk(Re()),fk=Te();uc=Wo.default=(0,ck.default)((0,fk.jsx)("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2M12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8"}),"ErrorOutline");const Xn=window.__mui__.Box,Jn=window.__mui__.Typography,cc=window.__mui__.Button,pk=window.__mui__.Chip,dk=window.__mui__.Backdrop,hk=window.__mui__.Paper,mk=window.__foc__.useTheme,gk=window.recoil.useRecoilState,yk=window.recoil.useSetRecoilState,xk=()=>{const e=mk(),[t,n]=gk(Ml),r=yk(We),i=zv(),o=Dv();if(!t)return null;const a=t.risk==="high",l=async()=>{n(null),r(u=>u.map(f=>f.id!==t.messageId?f:{...f,toolCalls:(f.toolCalls||[]).map(c=>c.id===t.toolCallId?{...c,status:"executing"}:c)})),await i(t.pendingId)},s=async()=>{r(u=>u.map(f=>f.id!==t.messageId?f:{...f,toolCalls:(f.toolCalls||[]).map(c=>c.id===t.toolCallId?{...c,status:"blocked",blockedReason:"Cancelled by user."}:c)})),n(null),await o(t.pendingId)};return v.jsx(dk,{open:!0,sx:{zIndex:9999,bgcolor:"rgba(0,0,0,0.7)"},children:v.jsxs(hk,{elevation:8,sx:{bgcolor:e.background.header||"#1a1a1a",border:`1px solid ${a?"#EF4444":"#F59E0B"}`,borderRadius:"12px",p:3,maxWidth:480,width:"90%"},children:[v.jsxs(Xn,{sx:{display:"flex",alignItems:"center",gap:1.5,mb:2},children:[a?v.jsx(uc,{sx:{fontSize:28,color:"#EF4444"}}):v.jsx(lc,{sx:{fontSize:28,color:"#F59E0B"}}),v.jsxs(Xn,{children:[v.jsx(Jn,{sx:{fontWeight:700,fontSize:"1rem"},children:"Confirm Operation"}),v.jsx(pk,{label:a?"HIGH RISK":"MEDIUM RISK",size:"small",sx:{bgcolor:a?"#EF444420":"#F59E0B20",color:a?"#EF4444":"#F59E0B",border:`1px solid ${a?"#EF4444":"#F59E0B"}`,fontSize:"0.65rem",height:"18px",fontWeight:700}})]})]}),v.jsx(Jn,{sx:{fontSize:"0.875rem",mb:2,lineHeight:1.6,opacity:.9},children:t.humanDescription}),v.jsxs(Xn,{sx:{bgcolor:e.background.level1||"rgba(0,0,0,0.3)",borderRadius:"8px",p:1.5,mb:2.5},children:[v.jsx(Jn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.5,mb:.5,textTransform:"uppercase"},children:"Tool"}),v.jsx(Jn,{sx:{fontSize:"0.875rem",fontFamily:"monospace",mb:1},children:t.toolName}),Object.keys(t.toolInput).length>0&&v.jsxs(v.Fragment,{children:[v.jsx(Jn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.5,mb:.5,textTransform:"uppercase"},children:"Parameters"}),v.jsx(Xn,{component:"pre",sx:{fontSize:"0.75rem",fontFamily:"monospace",bgcolor:e.background.level2,p:1,borderRadius:"4px",m:0,maxHeight:"120px",overflow:"auto",whiteSpace:"pre-wrap",wordBreak:"break-all"},children:JSON.stringify(t.toolInput,null,2)})]})]}),v.jsxs(Xn,{sx:{display:"flex",gap:1.5,justifyContent:"flex-end"},children:[v.jsx(cc,{variant:"outlined",onClick:s,sx:{borderColor:"rgba(255,255,255,0.2)",color:"rgba(255,255,255,0.7)","&:hover":{borderColor:"rgba(255,255,255,0.4)"}},children:"Cancel"}),v.jsx(cc,{variant:"contained",onClick:l,sx:{bgcolor:a?"#EF4444":"#F59E0B",color:"#fff",fontWeight:600,"&:hover":{bgcolor:a?"#DC2626":"#D97706"}},children:"Confirm"})]})]})})},bk=window.React.useEffect,Ye=window.__mui__.Box,xn=window.__mui__.Typography,vk=window.__mui__.Tabs,qo=window.__mui__.Tab,fc=window.__foc__.useTheme,Vo=window.recoil.useRecoilState,pc=window.recoil.useRecoilValue,kk=window.recoil.useSetRecoilState,wk=()=>{var p,m,h;const e=fc(),t=pc(We);pc(ln);const[n,r]=Vo(zi),[i,o]=Vo(em),[a,l]=Vo(tm),s=kk(We),u=Mv(),f=Fv(),c=Gu();bk(()=>{i||f().then(k=>{k&&(r(b=>({...b,mcpServers:k.mcp_servers||b.mcpServers,activeSkills:k.active_skills||b.activeSkills,availableSkills:k.available_skills||b.availableSkills,settings:{...b.settings,...k.settings||{}}})),k.history&&k.history.length>0&&s(k.history.map((b,C)=>({id:`history-${C}`,role:b.role,content:typeof b.content=="string"?b.content:"",timestamp:Date.now()-(k.history.length-C)*1e3})))),o(!0)}).catch(()=>o(!0))},[]);const d=async k=>{const b=`user-${Date.now()}`;s(D=>[...D,{id:b,role:"user",content:k,timestamp:Date.now()}]);const C=t.map(D=>({role:D.role,content:D.content})),T=n.mcpServers.find(D=>D.enabled),M=T?{command:T.command,args:T.args,enabled:!0}:void 0;if(await u({message:k,history:C,activeSkills:n.activeSkills,mcpConfig:M,model:n.settings.model,maxTokens:n.settings.maxTokens}),n.settings.persistHistory){const D=[...t,{role:"user",content:k}];await c({history:D})}};return v.jsxs(Ye,{sx:{display:"flex",flexDirection:"column",height:"100%",bgcolor:((p=e.background)==null?void 0:p.body)||"#141414",position:"relative"},children:[v.jsxs(Ye,{sx:{display:"flex",alignItems:"center",gap:1,px:2,py:1,borderBottom:`1px solid ${((m=e.primary)==null?void 0:m.plainBorder)||"rgba(255,255,255,0.08)"}`,bgcolor:((h=e.background)==null?void 0:h.header)||"#1a1a1a",flexShrink:0},children:[v.jsx(zn,{sx:{color:"#D97706",fontSize:20}}),v.jsx(xn,{sx:{fontWeight:700,fontSize:"0.875rem"},children:"Voxel Agent"}),v.jsx(Ye,{sx:{flex:1}}),v.jsxs(vk,{value:a,onChange:(k,b)=>l(b),sx:{minHeight:"unset","& .MuiTabs-indicator":{bgcolor:"#D97706"}},children:[v.jsx(qo,{value:"chat",icon:v.jsx(jl,{sx:{fontSize:16}}),iconPosition:"start",label:"Chat",sx:{minHeight:"unset",py:.5,px:1.5,fontSize:"0.75rem",fontWeight:600,minWidth:"unset",textTransform:"none","&.Mui-selected":{color:"#D97706"}}}),v.jsx(qo,{value:"skills",icon:v.jsx(an,{sx:{fontSize:16}}),iconPosition:"start",label:"Skills",sx:{minHeight:"unset",py:.5,px:1.5,fontSize:"0.75rem",fontWeight:600,minWidth:"unset",textTransform:"none","&.Mui-selected":{color:"#D97706"}}}),v.jsx(qo,{value:"settings",icon:v.jsx($l,{sx:{fontSize:16}}),iconPosition:"start",label:"Settings",sx:{minHeight:"unset",py:.5,px:1.5,fontSize:"0.75rem",fontWeight:600,minWidth:"unset",textTransform:"none","&.Mui-selected":{color:"#D97706"}}})]})]}),a==="chat"&&v.jsxs(v.Fragment,{children:[t.length===0?v.jsx(Cv,{onPromptClick:k=>{l("chat"),d(k)}}):v.jsx(bv,{}),v.jsx(Vv,{onSend:d})]}),a==="skills"&&v.jsx(Sk,{availableSkills:n.availableSkills,activeSkills:n.activeSkills,onToggle:k=>r(b=>({...b,activeSkills:b.activeSkills.includes(k)?b.activeSkills.filter(C=>C!==k):[...b.activeSkills,k]}))}),a==="settings"&&v.jsx(ak,{}),v.jsx(xk,{})]})},Sk=({availableSkills:e,activeSkills:t,onToggle:n})=>{const r=fc();return e.length===0?v.jsx(Ye,{sx:{flex:1,display:"flex",alignItems:"center",justifyContent:"center",p:3,textAlign:"center"},children:v.jsxs(Ye,{children:[v.jsx(an,{sx:{fontSize:40,opacity:.3,mb:2}}),v.jsx(xn,{sx:{fontSize:"0.9rem",fontWeight:600,mb:1},children:"No Skills Found"}),v.jsxs(xn,{sx:{fontSize:"0.8rem",opacity:.5},children:["Add skill directories to"," ",v.jsx(Ye,{component:"code",sx:{fontSize:"0.75rem"},children:"~/.fiftyone/skills/"})," ","or set the"," ",v.jsx(Ye,{component:"code",sx:{fontSize:"0.75rem"},children:"FIFTYONE_SKILLS_DIR"})," ","secret."]})]})}):v.jsxs(Ye,{sx:{flex:1,overflow:"auto",p:2},children:[v.jsx(xn,{sx:{fontSize:"0.8rem",opacity:.6,mb:2,lineHeight:1.5},children:"Toggle skills to inject their instructions into Claude's system prompt. Active skills appear below the message input."}),v.jsx(Ye,{sx:{display:"flex",flexDirection:"column",gap:1},children:e.map(i=>{var a;const o=t.includes(i);return v.jsxs(Ye,{onClick:()=>n(i),sx:{display:"flex",alignItems:"center",gap:1.5,p:1.5,border:`1px solid ${o?"#D97706":"rgba(255,255,255,0.1)"}`,borderRadius:"8px",cursor:"pointer",bgcolor:o?"#D9770610":((a=r.background)==null?void 0:a.level1)||"rgba(255,255,255,0.03)",transition:"all 0.15s ease","&:hover":{borderColor:"#D97706",bgcolor:"#D9770618"}},children:[v.jsx(an,{sx:{fontSize:18,color:o?"#D97706":void 0,opacity:o?1:.4}}),v.jsxs(Ye,{children:[v.jsx(xn,{sx:{fontSize:"0.875rem",fontWeight:600},children:i.replace("fiftyone-","").replace(/-/g," ")}),v.jsx(xn,{sx:{fontSize:"0.75rem",opacity:.5},children:i})]}),v.jsx(Ye,{sx:{flex:1}}),v.jsx(Ye,{sx:{width:8,height:8,borderRadius:"50%",bgcolor:o?"#D97706":"rgba(255,255,255,0.15)",flexShrink:0}})]},i)})})]})},Tt=window.__foo__.Operator,Rt=window.__foo__.OperatorConfig,$e=window.recoil.useSetRecoilState;class _k extends Tt{get config(){return new Rt({name:"stream_message_start",unlisted:!0})}useHooks(){return{setMessages:$e(We),setStreamingId:$e($i),setStreaming:$e(ln)}}async execute(t){const{setMessages:n,setStreamingId:r,setStreaming:i}=t.hooks,{message_id:o}=t.params,a={id:o,role:"assistant",content:"",toolCalls:[],isStreaming:!0,timestamp:Date.now()};n(l=>[...l,a]),r(o),i(!0)}}class Ck extends Tt{get config(){return new Rt({name:"stream_chunk",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{delta:r,message_id:i}=t.params;n(o=>o.map(a=>a.id===i?{...a,content:a.content+r}:a))}}class Ek extends Tt{get config(){return new Rt({name:"stream_complete",unlisted:!0})}useHooks(){return{setMessages:$e(We),setStreamingId:$e($i),setStreaming:$e(ln)}}async execute(t){const{setMessages:n,setStreamingId:r,setStreaming:i}=t.hooks,{message_id:o}=t.params;n(a=>a.map(l=>l.id===o?{...l,isStreaming:!1}:l)),r(null),i(!1)}}class Tk extends Tt{get config(){return new Rt({name:"stream_error",unlisted:!0})}useHooks(){return{setMessages:$e(We),setStreaming:$e(ln),setStreamingId:$e($i)}}async execute(t){const{setMessages:n,setStreaming:r,setStreamingId:i}=t.hooks,{error:o,message_id:a}=t.params;n(l=>l.map(s=>{if(s.id!==a)return s;const u=s.content?`
-
-`:"";return{...s,content:`${s.content}${u}⚠️ Error: ${o}`,isStreaming:!1}})),r(!1),i(null)}}class Rk extends Tt{get config(){return new Rt({name:"tool_call_start",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{tool_id:r,tool_name:i,message_id:o}=t.params,a={id:r,name:i,input:{},status:"executing"};n(l=>l.map(s=>s.id!==o?s:{...s,toolCalls:[...s.toolCalls||[],a]}))}}class Pk extends Tt{get config(){return new Rt({name:"tool_result",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{tool_id:r,result:i,message_id:o}=t.params;n(a=>a.map(l=>l.id!==o?l:{...l,toolCalls:(l.toolCalls||[]).map(s=>s.id===r?{...s,status:"completed",result:i}:s)}))}}class Ik extends Tt{get config(){return new Rt({name:"tool_blocked",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{tool_id:r,reason:i,message_id:o}=t.params;n(a=>a.map(l=>l.id!==o?l:{...l,toolCalls:(l.toolCalls||[]).map(s=>s.id===r?{...s,status:"blocked",blockedReason:i}:s)}))}}class Ak extends Tt{get config(){return new Rt({name:"confirmation_required",unlisted:!0})}useHooks(){return{setMessages:$e(We),setPendingConfirmation:$e(Ml)}}async execute(t){const{setMessages:n,setPendingConfirmation:r}=t.hooks,{pending_id:i,tool_id:o,tool_name:a,tool_input:l,risk:s,human_description:u,message_id:f}=t.params;n(d=>d.map(p=>{if(p.id!==f)return p;const h=(p.toolCalls||[]).some(k=>k.id===o)?(p.toolCalls||[]).map(k=>k.id===o?{...k,status:"awaiting_confirmation",input:l||{}}:k):[...p.toolCalls||[],{id:o,name:a,input:l||{},status:"awaiting_confirmation"}];return{...p,toolCalls:h}})),r({pendingId:i,toolCallId:o,toolName:a,toolInput:l||{},risk:s,humanDescription:u,messageId:f})}}const Ok=[_k,Ck,Ek,Tk,Rk,Pk,Ik,Ak],jk=window.__fop__.PluginComponentType,$k=window.__fop__.registerComponent,Mk=window.__foo__.registerOperator,zk="@adonaivera/claude-agent";$k({name:"claude_agent",label:"Voxel Agent",component:wk,type:jk.Panel,activator:Dk,Icon:zn});function Dk(){return!0}for(const e of Ok)Mk(e,zk)});
+`))}function s(p,m,h,k){const b=h.enter("tableCell"),C=h.enter("phrasing"),T=h.containerPhrasing(p,{...k,before:o,after:o});return C(),b(),T}function u(p,m){return hb(p,{align:m,alignDelimiters:r,padding:n,stringLength:i})}function f(p,m,h){const k=p.children;let b=-1;const C=[],T=m.enter("table");for(;++b<k.length;)C[b]=c(k[b],m,h);return T(),C}function c(p,m,h){const k=p.children;let b=-1;const C=[],T=m.enter("tableRow");for(;++b<k.length;)C[b]=s(k[b],p,m,h);return T(),C}function d(p,m,h){let k=Cu.inlineCode(p,m,h);return h.stack.includes("tableCell")&&(k=k.replace(/\|/g,"\\$&")),k}}function t0(){return{exit:{taskListCheckValueChecked:Tu,taskListCheckValueUnchecked:Tu,paragraph:r0}}}function n0(){return{unsafe:[{atBreak:!0,character:"-",after:"[:|-]"}],handlers:{listItem:i0}}}function Tu(e){const t=this.stack[this.stack.length-2];t.type,t.checked=e.type==="taskListCheckValueChecked"}function r0(e){const t=this.stack[this.stack.length-2];if(t&&t.type==="listItem"&&typeof t.checked=="boolean"){const n=this.stack[this.stack.length-1];n.type;const r=n.children[0];if(r&&r.type==="text"){const i=t.children;let o=-1,a;for(;++o<i.length;){const l=i[o];if(l.type==="paragraph"){a=l;break}}a===n&&(r.value=r.value.slice(1),r.value.length===0?n.children.shift():n.position&&r.position&&typeof r.position.start.offset=="number"&&(r.position.start.column++,r.position.start.offset++,n.position.start=Object.assign({},r.position.start)))}}this.exit(e)}function i0(e,t,n,r){const i=e.children[0],o=typeof e.checked=="boolean"&&i&&i.type==="paragraph",a="["+(e.checked?"x":" ")+"] ",l=n.createTracker(r);o&&l.move(a);let s=Cu.listItem(e,t,n,{...r,...l.current()});return o&&(s=s.replace(/^(?:[*+-]|\d+\.)([\r\n]| {1,3})/,u)),s;function u(f){return f+a}}function o0(){return[D1(),ib(),sb(),Gb(),t0()]}function a0(e){return{extensions:[F1(),ob(e),ub(),e0(e),n0()]}}const l0={tokenize:d0,partial:!0},Ru={tokenize:h0,partial:!0},Pu={tokenize:m0,partial:!0},Iu={tokenize:g0,partial:!0},s0={tokenize:y0,partial:!0},Au={name:"wwwAutolink",tokenize:f0,previous:ju},Ou={name:"protocolAutolink",tokenize:p0,previous:$u},xt={name:"emailAutolink",tokenize:c0,previous:Mu},dt={};function u0(){return{text:dt}}let Ft=48;for(;Ft<123;)dt[Ft]=xt,Ft++,Ft===58?Ft=65:Ft===91&&(Ft=97);dt[43]=xt,dt[45]=xt,dt[46]=xt,dt[95]=xt,dt[72]=[xt,Ou],dt[104]=[xt,Ou],dt[87]=[xt,Au],dt[119]=[xt,Au];function c0(e,t,n){const r=this;let i,o;return a;function a(c){return!Po(c)||!Mu.call(r,r.previous)||Io(r.events)?n(c):(e.enter("literalAutolink"),e.enter("literalAutolinkEmail"),l(c))}function l(c){return Po(c)?(e.consume(c),l):c===64?(e.consume(c),s):n(c)}function s(c){return c===46?e.check(s0,f,u)(c):c===45||c===95||Oe(c)?(o=!0,e.consume(c),s):f(c)}function u(c){return e.consume(c),i=!0,s}function f(c){return o&&i&&je(r.previous)?(e.exit("literalAutolinkEmail"),e.exit("literalAutolink"),t(c)):n(c)}}function f0(e,t,n){const r=this;return i;function i(a){return a!==87&&a!==119||!ju.call(r,r.previous)||Io(r.events)?n(a):(e.enter("literalAutolink"),e.enter("literalAutolinkWww"),e.check(l0,e.attempt(Ru,e.attempt(Pu,o),n),n)(a))}function o(a){return e.exit("literalAutolinkWww"),e.exit("literalAutolink"),t(a)}}function p0(e,t,n){const r=this;let i="",o=!1;return a;function a(c){return(c===72||c===104)&&$u.call(r,r.previous)&&!Io(r.events)?(e.enter("literalAutolink"),e.enter("literalAutolinkHttp"),i+=String.fromCodePoint(c),e.consume(c),l):n(c)}function l(c){if(je(c)&&i.length<5)return i+=String.fromCodePoint(c),e.consume(c),l;if(c===58){const d=i.toLowerCase();if(d==="http"||d==="https")return e.consume(c),s}return n(c)}function s(c){return c===47?(e.consume(c),o?u:(o=!0,s)):n(c)}function u(c){return c===null||Pr(c)||de(c)||Dt(c)||Ir(c)?n(c):e.attempt(Ru,e.attempt(Pu,f),n)(c)}function f(c){return e.exit("literalAutolinkHttp"),e.exit("literalAutolink"),t(c)}}function d0(e,t,n){let r=0;return i;function i(a){return(a===87||a===119)&&r<3?(r++,e.consume(a),i):a===46&&r===3?(e.consume(a),o):n(a)}function o(a){return a===null?n(a):t(a)}}function h0(e,t,n){let r,i,o;return a;function a(u){return u===46||u===95?e.check(Iu,s,l)(u):u===null||de(u)||Dt(u)||u!==45&&Ir(u)?s(u):(o=!0,e.consume(u),a)}function l(u){return u===95?r=!0:(i=r,r=void 0),e.consume(u),a}function s(u){return i||r||!o?n(u):t(u)}}function m0(e,t){let n=0,r=0;return i;function i(a){return a===40?(n++,e.consume(a),i):a===41&&r<n?o(a):a===33||a===34||a===38||a===39||a===41||a===42||a===44||a===46||a===58||a===59||a===60||a===63||a===93||a===95||a===126?e.check(Iu,t,o)(a):a===null||de(a)||Dt(a)?t(a):(e.consume(a),i)}function o(a){return a===41&&r++,e.consume(a),i}}function g0(e,t,n){return r;function r(l){return l===33||l===34||l===39||l===41||l===42||l===44||l===46||l===58||l===59||l===63||l===95||l===126?(e.consume(l),r):l===38?(e.consume(l),o):l===93?(e.consume(l),i):l===60||l===null||de(l)||Dt(l)?t(l):n(l)}function i(l){return l===null||l===40||l===91||de(l)||Dt(l)?t(l):r(l)}function o(l){return je(l)?a(l):n(l)}function a(l){return l===59?(e.consume(l),r):je(l)?(e.consume(l),a):n(l)}}function y0(e,t,n){return r;function r(o){return e.consume(o),i}function i(o){return Oe(o)?n(o):t(o)}}function ju(e){return e===null||e===40||e===42||e===95||e===91||e===93||e===126||de(e)}function $u(e){return!je(e)}function Mu(e){return!(e===47||Po(e))}function Po(e){return e===43||e===45||e===46||e===95||Oe(e)}function Io(e){let t=e.length,n=!1;for(;t--;){const r=e[t][1];if((r.type==="labelLink"||r.type==="labelImage")&&!r._balanced){n=!0;break}if(r._gfmAutolinkLiteralWalkedInto){n=!1;break}}return e.length>0&&!n&&(e[e.length-1][1]._gfmAutolinkLiteralWalkedInto=!0),n}const x0={tokenize:E0,partial:!0};function b0(){return{document:{91:{name:"gfmFootnoteDefinition",tokenize:S0,continuation:{tokenize:_0},exit:C0}},text:{91:{name:"gfmFootnoteCall",tokenize:w0},93:{name:"gfmPotentialFootnoteCall",add:"after",tokenize:v0,resolveTo:k0}}}}function v0(e,t,n){const r=this;let i=r.events.length;const o=r.parser.gfmFootnotes||(r.parser.gfmFootnotes=[]);let a;for(;i--;){const s=r.events[i][1];if(s.type==="labelImage"){a=s;break}if(s.type==="gfmFootnoteCall"||s.type==="labelLink"||s.type==="label"||s.type==="image"||s.type==="link")break}return l;function l(s){if(!a||!a._balanced)return n(s);const u=it(r.sliceSerialize({start:a.end,end:r.now()}));return u.codePointAt(0)!==94||!o.includes(u.slice(1))?n(s):(e.enter("gfmFootnoteCallLabelMarker"),e.consume(s),e.exit("gfmFootnoteCallLabelMarker"),t(s))}}function k0(e,t){let n=e.length;for(;n--;)if(e[n][1].type==="labelImage"&&e[n][0]==="enter"){e[n][1];break}e[n+1][1].type="data",e[n+3][1].type="gfmFootnoteCallLabelMarker";const r={type:"gfmFootnoteCall",start:Object.assign({},e[n+3][1].start),end:Object.assign({},e[e.length-1][1].end)},i={type:"gfmFootnoteCallMarker",start:Object.assign({},e[n+3][1].end),end:Object.assign({},e[n+3][1].end)};i.end.column++,i.end.offset++,i.end._bufferIndex++;const o={type:"gfmFootnoteCallString",start:Object.assign({},i.end),end:Object.assign({},e[e.length-1][1].start)},a={type:"chunkString",contentType:"string",start:Object.assign({},o.start),end:Object.assign({},o.end)},l=[e[n+1],e[n+2],["enter",r,t],e[n+3],e[n+4],["enter",i,t],["exit",i,t],["enter",o,t],["enter",a,t],["exit",a,t],["exit",o,t],e[e.length-2],e[e.length-1],["exit",r,t]];return e.splice(n,e.length-n+1,...l),e}function w0(e,t,n){const r=this,i=r.parser.gfmFootnotes||(r.parser.gfmFootnotes=[]);let o=0,a;return l;function l(c){return e.enter("gfmFootnoteCall"),e.enter("gfmFootnoteCallLabelMarker"),e.consume(c),e.exit("gfmFootnoteCallLabelMarker"),s}function s(c){return c!==94?n(c):(e.enter("gfmFootnoteCallMarker"),e.consume(c),e.exit("gfmFootnoteCallMarker"),e.enter("gfmFootnoteCallString"),e.enter("chunkString").contentType="string",u)}function u(c){if(o>999||c===93&&!a||c===null||c===91||de(c))return n(c);if(c===93){e.exit("chunkString");const d=e.exit("gfmFootnoteCallString");return i.includes(it(r.sliceSerialize(d)))?(e.enter("gfmFootnoteCallLabelMarker"),e.consume(c),e.exit("gfmFootnoteCallLabelMarker"),e.exit("gfmFootnoteCall"),t):n(c)}return de(c)||(a=!0),o++,e.consume(c),c===92?f:u}function f(c){return c===91||c===92||c===93?(e.consume(c),o++,u):u(c)}}function S0(e,t,n){const r=this,i=r.parser.gfmFootnotes||(r.parser.gfmFootnotes=[]);let o,a=0,l;return s;function s(m){return e.enter("gfmFootnoteDefinition")._container=!0,e.enter("gfmFootnoteDefinitionLabel"),e.enter("gfmFootnoteDefinitionLabelMarker"),e.consume(m),e.exit("gfmFootnoteDefinitionLabelMarker"),u}function u(m){return m===94?(e.enter("gfmFootnoteDefinitionMarker"),e.consume(m),e.exit("gfmFootnoteDefinitionMarker"),e.enter("gfmFootnoteDefinitionLabelString"),e.enter("chunkString").contentType="string",f):n(m)}function f(m){if(a>999||m===93&&!l||m===null||m===91||de(m))return n(m);if(m===93){e.exit("chunkString");const h=e.exit("gfmFootnoteDefinitionLabelString");return o=it(r.sliceSerialize(h)),e.enter("gfmFootnoteDefinitionLabelMarker"),e.consume(m),e.exit("gfmFootnoteDefinitionLabelMarker"),e.exit("gfmFootnoteDefinitionLabel"),d}return de(m)||(l=!0),a++,e.consume(m),m===92?c:f}function c(m){return m===91||m===92||m===93?(e.consume(m),a++,f):f(m)}function d(m){return m===58?(e.enter("definitionMarker"),e.consume(m),e.exit("definitionMarker"),i.includes(o)||i.push(o),ne(e,p,"gfmFootnoteDefinitionWhitespace")):n(m)}function p(m){return t(m)}}function _0(e,t,n){return e.check(Nn,t,e.attempt(x0,t,n))}function C0(e){e.exit("gfmFootnoteDefinition")}function E0(e,t,n){const r=this;return ne(e,i,"gfmFootnoteDefinitionIndent",5);function i(o){const a=r.events[r.events.length-1];return a&&a[1].type==="gfmFootnoteDefinitionIndent"&&a[2].sliceSerialize(a[1],!0).length===4?t(o):n(o)}}function T0(e){let n=(e||{}).singleTilde;const r={name:"strikethrough",tokenize:o,resolveAll:i};return n==null&&(n=!0),{text:{126:r},insideSpan:{null:[r]},attentionMarkers:{null:[126]}};function i(a,l){let s=-1;for(;++s<a.length;)if(a[s][0]==="enter"&&a[s][1].type==="strikethroughSequenceTemporary"&&a[s][1]._close){let u=s;for(;u--;)if(a[u][0]==="exit"&&a[u][1].type==="strikethroughSequenceTemporary"&&a[u][1]._open&&a[s][1].end.offset-a[s][1].start.offset===a[u][1].end.offset-a[u][1].start.offset){a[s][1].type="strikethroughSequence",a[u][1].type="strikethroughSequence";const f={type:"strikethrough",start:Object.assign({},a[u][1].start),end:Object.assign({},a[s][1].end)},c={type:"strikethroughText",start:Object.assign({},a[u][1].end),end:Object.assign({},a[s][1].start)},d=[["enter",f,l],["enter",a[u][1],l],["exit",a[u][1],l],["enter",c,l]],p=l.parser.constructs.insideSpan.null;p&&Ve(d,d.length,0,Ar(p,a.slice(u+1,s),l)),Ve(d,d.length,0,[["exit",c,l],["enter",a[s][1],l],["exit",a[s][1],l],["exit",f,l]]),Ve(a,u-1,s-u+3,d),s=u+d.length-2;break}}for(s=-1;++s<a.length;)a[s][1].type==="strikethroughSequenceTemporary"&&(a[s][1].type="data");return a}function o(a,l,s){const u=this.previous,f=this.events;let c=0;return d;function d(m){return u===126&&f[f.length-1][1].type!=="characterEscape"?s(m):(a.enter("strikethroughSequenceTemporary"),p(m))}function p(m){const h=fn(u);if(m===126)return c>1?s(m):(a.consume(m),c++,p);if(c<2&&!n)return s(m);const k=a.exit("strikethroughSequenceTemporary"),b=fn(m);return k._open=!b||b===2&&!!h,k._close=!h||h===2&&!!b,l(m)}}}class R0{constructor(){this.map=[]}add(t,n,r){P0(this,t,n,r)}consume(t){if(this.map.sort(function(o,a){return o[0]-a[0]}),this.map.length===0)return;let n=this.map.length;const r=[];for(;n>0;)n-=1,r.push(t.slice(this.map[n][0]+this.map[n][1]),this.map[n][2]),t.length=this.map[n][0];r.push(t.slice()),t.length=0;let i=r.pop();for(;i;){for(const o of i)t.push(o);i=r.pop()}this.map.length=0}}function P0(e,t,n,r){let i=0;if(!(n===0&&r.length===0)){for(;i<e.map.length;){if(e.map[i][0]===t){e.map[i][1]+=n,e.map[i][2].push(...r);return}i+=1}e.map.push([t,n,r])}}function I0(e,t){let n=!1;const r=[];for(;t<e.length;){const i=e[t];if(n){if(i[0]==="enter")i[1].type==="tableContent"&&r.push(e[t+1][1].type==="tableDelimiterMarker"?"left":"none");else if(i[1].type==="tableContent"){if(e[t-1][1].type==="tableDelimiterMarker"){const o=r.length-1;r[o]=r[o]==="left"?"center":"right"}}else if(i[1].type==="tableDelimiterRow")break}else i[0]==="enter"&&i[1].type==="tableDelimiterRow"&&(n=!0);t+=1}return r}function A0(){return{flow:{null:{name:"table",tokenize:O0,resolveAll:j0}}}}function O0(e,t,n){const r=this;let i=0,o=0,a;return l;function l(S){let z=r.events.length-1;for(;z>-1;){const R=r.events[z][1].type;if(R==="lineEnding"||R==="linePrefix")z--;else break}const $=z>-1?r.events[z][1].type:null,_=$==="tableHead"||$==="tableRow"?w:s;return _===w&&r.parser.lazy[r.now().line]?n(S):_(S)}function s(S){return e.enter("tableHead"),e.enter("tableRow"),u(S)}function u(S){return S===124||(a=!0,o+=1),f(S)}function f(S){return S===null?n(S):U(S)?o>1?(o=0,r.interrupt=!0,e.exit("tableRow"),e.enter("lineEnding"),e.consume(S),e.exit("lineEnding"),p):n(S):ee(S)?ne(e,f,"whitespace")(S):(o+=1,a&&(a=!1,i+=1),S===124?(e.enter("tableCellDivider"),e.consume(S),e.exit("tableCellDivider"),a=!0,f):(e.enter("data"),c(S)))}function c(S){return S===null||S===124||de(S)?(e.exit("data"),f(S)):(e.consume(S),S===92?d:c)}function d(S){return S===92||S===124?(e.consume(S),c):c(S)}function p(S){return r.interrupt=!1,r.parser.lazy[r.now().line]?n(S):(e.enter("tableDelimiterRow"),a=!1,ee(S)?ne(e,m,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(S):m(S))}function m(S){return S===45||S===58?k(S):S===124?(a=!0,e.enter("tableCellDivider"),e.consume(S),e.exit("tableCellDivider"),h):D(S)}function h(S){return ee(S)?ne(e,k,"whitespace")(S):k(S)}function k(S){return S===58?(o+=1,a=!0,e.enter("tableDelimiterMarker"),e.consume(S),e.exit("tableDelimiterMarker"),b):S===45?(o+=1,b(S)):S===null||U(S)?M(S):D(S)}function b(S){return S===45?(e.enter("tableDelimiterFiller"),C(S)):D(S)}function C(S){return S===45?(e.consume(S),C):S===58?(a=!0,e.exit("tableDelimiterFiller"),e.enter("tableDelimiterMarker"),e.consume(S),e.exit("tableDelimiterMarker"),T):(e.exit("tableDelimiterFiller"),T(S))}function T(S){return ee(S)?ne(e,M,"whitespace")(S):M(S)}function M(S){return S===124?m(S):S===null||U(S)?!a||i!==o?D(S):(e.exit("tableDelimiterRow"),e.exit("tableHead"),t(S)):D(S)}function D(S){return n(S)}function w(S){return e.enter("tableRow"),O(S)}function O(S){return S===124?(e.enter("tableCellDivider"),e.consume(S),e.exit("tableCellDivider"),O):S===null||U(S)?(e.exit("tableRow"),t(S)):ee(S)?ne(e,O,"whitespace")(S):(e.enter("data"),Q(S))}function Q(S){return S===null||S===124||de(S)?(e.exit("data"),O(S)):(e.consume(S),S===92?H:Q)}function H(S){return S===92||S===124?(e.consume(S),Q):Q(S)}}function j0(e,t){let n=-1,r=!0,i=0,o=[0,0,0,0],a=[0,0,0,0],l=!1,s=0,u,f,c;const d=new R0;for(;++n<e.length;){const p=e[n],m=p[1];p[0]==="enter"?m.type==="tableHead"?(l=!1,s!==0&&(zu(d,t,s,u,f),f=void 0,s=0),u={type:"table",start:Object.assign({},m.start),end:Object.assign({},m.end)},d.add(n,0,[["enter",u,t]])):m.type==="tableRow"||m.type==="tableDelimiterRow"?(r=!0,c=void 0,o=[0,0,0,0],a=[0,n+1,0,0],l&&(l=!1,f={type:"tableBody",start:Object.assign({},m.start),end:Object.assign({},m.end)},d.add(n,0,[["enter",f,t]])),i=m.type==="tableDelimiterRow"?2:f?3:1):i&&(m.type==="data"||m.type==="tableDelimiterMarker"||m.type==="tableDelimiterFiller")?(r=!1,a[2]===0&&(o[1]!==0&&(a[0]=a[1],c=Hr(d,t,o,i,void 0,c),o=[0,0,0,0]),a[2]=n)):m.type==="tableCellDivider"&&(r?r=!1:(o[1]!==0&&(a[0]=a[1],c=Hr(d,t,o,i,void 0,c)),o=a,a=[o[1],n,0,0])):m.type==="tableHead"?(l=!0,s=n):m.type==="tableRow"||m.type==="tableDelimiterRow"?(s=n,o[1]!==0?(a[0]=a[1],c=Hr(d,t,o,i,n,c)):a[1]!==0&&(c=Hr(d,t,a,i,n,c)),i=0):i&&(m.type==="data"||m.type==="tableDelimiterMarker"||m.type==="tableDelimiterFiller")&&(a[3]=n)}for(s!==0&&zu(d,t,s,u,f),d.consume(t.events),n=-1;++n<t.events.length;){const p=t.events[n];p[0]==="enter"&&p[1].type==="table"&&(p[1]._align=I0(t.events,n))}return e}function Hr(e,t,n,r,i,o){const a=r===1?"tableHeader":r===2?"tableDelimiter":"tableData",l="tableContent";n[0]!==0&&(o.end=Object.assign({},dn(t.events,n[0])),e.add(n[0],0,[["exit",o,t]]));const s=dn(t.events,n[1]);if(o={type:a,start:Object.assign({},s),end:Object.assign({},s)},e.add(n[1],0,[["enter",o,t]]),n[2]!==0){const u=dn(t.events,n[2]),f=dn(t.events,n[3]),c={type:l,start:Object.assign({},u),end:Object.assign({},f)};if(e.add(n[2],0,[["enter",c,t]]),r!==2){const d=t.events[n[2]],p=t.events[n[3]];if(d[1].end=Object.assign({},p[1].end),d[1].type="chunkText",d[1].contentType="text",n[3]>n[2]+1){const m=n[2]+1,h=n[3]-n[2]-1;e.add(m,h,[])}}e.add(n[3]+1,0,[["exit",c,t]])}return i!==void 0&&(o.end=Object.assign({},dn(t.events,i)),e.add(i,0,[["exit",o,t]]),o=void 0),o}function zu(e,t,n,r,i){const o=[],a=dn(t.events,n);i&&(i.end=Object.assign({},a),o.push(["exit",i,t])),r.end=Object.assign({},a),o.push(["exit",r,t]),e.add(n+1,0,o)}function dn(e,t){const n=e[t],r=n[0]==="enter"?"start":"end";return n[1][r]}const $0={name:"tasklistCheck",tokenize:z0};function M0(){return{text:{91:$0}}}function z0(e,t,n){const r=this;return i;function i(s){return r.previous!==null||!r._gfmTasklistFirstContentOfListItem?n(s):(e.enter("taskListCheck"),e.enter("taskListCheckMarker"),e.consume(s),e.exit("taskListCheckMarker"),o)}function o(s){return de(s)?(e.enter("taskListCheckValueUnchecked"),e.consume(s),e.exit("taskListCheckValueUnchecked"),a):s===88||s===120?(e.enter("taskListCheckValueChecked"),e.consume(s),e.exit("taskListCheckValueChecked"),a):n(s)}function a(s){return s===93?(e.enter("taskListCheckMarker"),e.consume(s),e.exit("taskListCheckMarker"),e.exit("taskListCheck"),l):n(s)}function l(s){return U(s)?t(s):ee(s)?e.check({tokenize:D0},t,n)(s):n(s)}}function D0(e,t,n){return ne(e,r,"whitespace");function r(i){return i===null?n(i):t(i)}}function F0(e){return fs([u0(),b0(),T0(e),A0(),M0()])}const L0={};function B0(e){const t=this,n=e||L0,r=t.data(),i=r.micromarkExtensions||(r.micromarkExtensions=[]),o=r.fromMarkdownExtensions||(r.fromMarkdownExtensions=[]),a=r.toMarkdownExtensions||(r.toMarkdownExtensions=[]);i.push(F0(n)),o.push(o0()),a.push(a0(n))}var Ao={},N0=Se;Object.defineProperty(Ao,"__esModule",{value:!0});var Du=Ao.default=void 0,U0=N0(Re()),H0=Te();Du=Ao.default=(0,U0.default)((0,H0.jsx)("path",{d:"M16.59 8.59 12 13.17 7.41 8.59 6 10l6 6 6-6z"}),"ExpandMore");var Oo={},W0=Se;Object.defineProperty(Oo,"__esModule",{value:!0});var Fu=Oo.default=void 0,q0=W0(Re()),V0=Te();Fu=Oo.default=(0,q0.default)((0,V0.jsx)("path",{d:"m12 8-6 6 1.41 1.41L12 10.83l4.59 4.58L18 14z"}),"ExpandLess");var jo={},Y0=Se;Object.defineProperty(jo,"__esModule",{value:!0});var Lu=jo.default=void 0,G0=Y0(Re()),K0=Te();Lu=jo.default=(0,G0.default)((0,K0.jsx)("path",{d:"m22.7 19-9.1-9.1c.9-2.3.4-5-1.5-6.9-2-2-5-2.4-7.4-1.3L9 6 6 9 1.6 4.7C.4 7.1.9 10.1 2.9 12.1c1.9 1.9 4.6 2.4 6.9 1.5l9.1 9.1c.4.4 1 .4 1.4 0l2.3-2.3c.5-.4.5-1.1.1-1.4"}),"Build");var $o={},X0=Se;Object.defineProperty($o,"__esModule",{value:!0});var Bu=$o.default=void 0,J0=X0(Re()),Q0=Te();Bu=$o.default=(0,J0.default)((0,Q0.jsx)("path",{d:"M16.59 7.58 10 14.17l-3.59-3.58L5 12l5 5 8-8zM12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2m0 18c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8"}),"CheckCircleOutline");var Mo={},Z0=Se;Object.defineProperty(Mo,"__esModule",{value:!0});var Nu=Mo.default=void 0,ev=Z0(Re()),tv=Te();Nu=Mo.default=(0,ev.default)((0,tv.jsx)("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2M4 12c0-4.42 3.58-8 8-8 1.85 0 3.55.63 4.9 1.69L5.69 16.9C4.63 15.55 4 13.85 4 12m8 8c-1.85 0-3.55-.63-4.9-1.69L18.31 7.1C19.37 8.45 20 10.15 20 12c0 4.42-3.58 8-8 8"}),"Block");var zo={},nv=Se;Object.defineProperty(zo,"__esModule",{value:!0});var Uu=zo.default=void 0,rv=nv(Re()),iv=Te();Uu=zo.default=(0,rv.default)((0,iv.jsx)("path",{d:"M6 2v6h.01L6 8.01 10 12l-4 4 .01.01H6V22h12v-5.99h-.01L18 16l-4-4 4-3.99-.01-.01H18V2zm10 14.5V20H8v-3.5l4-4zm-4-5-4-4V4h8v3.5z"}),"HourglassEmpty");const ov=window.React.useState,bt=window.__mui__.Box,Gn=window.__mui__.Typography,av=window.__mui__.Collapse,lv=window.__mui__.IconButton,sv=window.__mui__.CircularProgress,uv=window.__foc__.useTheme,cv={executing:{label:"Running",color:"#3B82F6",icon:v.jsx(sv,{size:12,sx:{color:"#3B82F6"}})},completed:{label:"Done",color:"#10B981",icon:v.jsx(Bu,{sx:{fontSize:14,color:"#10B981"}})},blocked:{label:"Blocked",color:"#EF4444",icon:v.jsx(Nu,{sx:{fontSize:14,color:"#EF4444"}})},awaiting_confirmation:{label:"Awaiting Approval",color:"#F59E0B",icon:v.jsx(Uu,{sx:{fontSize:14,color:"#F59E0B"}})}},fv=({toolCall:e})=>{const t=uv(),[n,r]=ov(!1),i=cv[e.status],o=e.input&&Object.keys(e.input).length>0||e.result||e.blockedReason;return v.jsxs(bt,{sx:{border:`1px solid ${t.primary.plainBorder||"rgba(255,255,255,0.12)"}`,borderRadius:"8px",overflow:"hidden",my:1,fontSize:"0.8rem"},children:[v.jsxs(bt,{sx:{display:"flex",alignItems:"center",gap:1,px:1.5,py:1,bgcolor:t.background.level2||"rgba(255,255,255,0.05)",cursor:o?"pointer":"default"},onClick:()=>o&&r(a=>!a),children:[v.jsx(Lu,{sx:{fontSize:14,opacity:.7}}),v.jsx(Gn,{sx:{fontSize:"0.8rem",fontFamily:"monospace",flex:1},children:e.name}),v.jsxs(bt,{sx:{display:"flex",alignItems:"center",gap:.5},children:[i.icon,v.jsx(Gn,{sx:{fontSize:"0.75rem",color:i.color},children:i.label})]}),o&&v.jsx(lv,{size:"small",sx:{p:0,ml:.5},children:n?v.jsx(Fu,{sx:{fontSize:16}}):v.jsx(Du,{sx:{fontSize:16}})})]}),v.jsx(av,{in:n,children:v.jsxs(bt,{sx:{px:1.5,py:1,bgcolor:t.background.level1},children:[e.input&&Object.keys(e.input).length>0&&v.jsxs(bt,{sx:{mb:1},children:[v.jsx(Gn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.6,mb:.5,textTransform:"uppercase"},children:"Input"}),v.jsx(bt,{component:"pre",sx:{fontSize:"0.75rem",fontFamily:"monospace",bgcolor:t.background.level2,p:1,borderRadius:"4px",overflowX:"auto",m:0,whiteSpace:"pre-wrap",wordBreak:"break-all"},children:JSON.stringify(e.input,null,2)})]}),e.blockedReason&&v.jsx(bt,{sx:{mb:1},children:v.jsxs(Gn,{sx:{fontSize:"0.7rem",fontWeight:600,color:"#EF4444",mb:.5},children:["Blocked: ",e.blockedReason]})}),e.result&&v.jsxs(bt,{children:[v.jsx(Gn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.6,mb:.5,textTransform:"uppercase"},children:"Result"}),v.jsx(bt,{component:"pre",sx:{fontSize:"0.75rem",fontFamily:"monospace",bgcolor:t.background.level2,p:1,borderRadius:"4px",overflowX:"auto",m:0,whiteSpace:"pre-wrap",wordBreak:"break-all",maxHeight:"200px",overflow:"auto"},children:e.result})]})]})})]})},ot=window.__mui__.Box,Lt=window.__mui__.Typography,pv=window.__mui__.Avatar,dv=window.__foc__.useTheme,hv={p:({children:e})=>v.jsx(Lt,{component:"p",sx:{fontSize:"0.875rem",lineHeight:1.7,mb:1,mt:0},children:e}),code:({inline:e,children:t,className:n})=>e?v.jsx(ot,{component:"code",sx:{fontFamily:"monospace",fontSize:"0.8rem",bgcolor:"rgba(255,255,255,0.08)",px:.5,py:.25,borderRadius:"3px"},children:t}):v.jsx(ot,{component:"pre",sx:{fontFamily:"monospace",fontSize:"0.8rem",bgcolor:"rgba(0,0,0,0.3)",p:1.5,borderRadius:"6px",overflowX:"auto",my:1,whiteSpace:"pre-wrap",wordBreak:"break-word"},children:v.jsx("code",{className:n,children:t})}),h1:({children:e})=>v.jsx(Lt,{variant:"h6",sx:{fontWeight:700,mb:1,mt:1.5},children:e}),h2:({children:e})=>v.jsx(Lt,{sx:{fontWeight:700,fontSize:"1rem",mb:1,mt:1.5},children:e}),h3:({children:e})=>v.jsx(Lt,{sx:{fontWeight:600,fontSize:"0.9rem",mb:.75,mt:1},children:e}),ul:({children:e})=>v.jsx(ot,{component:"ul",sx:{pl:2.5,mb:1,mt:0},children:e}),ol:({children:e})=>v.jsx(ot,{component:"ol",sx:{pl:2.5,mb:1,mt:0},children:e}),li:({children:e})=>v.jsx(Lt,{component:"li",sx:{fontSize:"0.875rem",lineHeight:1.6,mb:.25},children:e}),blockquote:({children:e})=>v.jsx(ot,{sx:{borderLeft:"3px solid rgba(255,255,255,0.2)",pl:1.5,my:1,opacity:.8},children:e}),strong:({children:e})=>v.jsx(ot,{component:"strong",sx:{fontWeight:700},children:e})},Xk=({message:e})=>{var r;const t=dv(),n=e.role==="user";return v.jsxs(ot,{sx:{display:"flex",gap:1.5,px:2,py:1.5,bgcolor:n?t.background.level1:t.background.header,alignItems:"flex-start"},children:[v.jsx(pv,{sx:{width:28,height:28,bgcolor:n?((r=t.primary)==null?void 0:r.main)||"#6366f1":"#D97706",flexShrink:0,mt:.25},children:n?v.jsx(zl,{sx:{fontSize:16}}):v.jsx(zn,{sx:{fontSize:16}})}),v.jsxs(ot,{sx:{flex:1,minWidth:0},children:[v.jsx(Lt,{sx:{fontWeight:600,fontSize:"0.8rem",mb:.5,opacity:.7},children:n?"You":"Claude"}),n?v.jsx(Lt,{sx:{fontSize:"0.875rem",lineHeight:1.7,whiteSpace:"pre-wrap"},children:e.content}):v.jsxs(v.Fragment,{children:[e.content&&v.jsx(ot,{sx:{"& > *:last-child":{mb:0}},children:v.jsx(T1,{remarkPlugins:[B0],components:hv,children:e.content})}),e.error&&v.jsxs(Lt,{sx:{fontSize:"0.875rem",lineHeight:1.7,color:"#EF4444",mt:e.content?1:0},children:["⚠️ Error: ",e.error]}),e.isStreaming&&!e.content&&v.jsx(ot,{sx:{display:"inline-flex",gap:"3px",alignItems:"center",mt:.5},children:[0,1,2].map(i=>v.jsx(ot,{sx:{width:6,height:6,borderRadius:"50%",bgcolor:"#D97706",animation:"pulse 1.2s ease-in-out infinite",animationDelay:`${i*.2}s`,"@keyframes pulse":{"0%, 80%, 100%":{opacity:.2},"40%":{opacity:1}}}},i))}),(e.toolCalls||[]).map(i=>v.jsx(fv,{toolCall:i},i.id))]})]})]})},mv=window.React.memo(Xk),gv=window.React.useEffect,yv=window.React.useRef,xv=window.__mui__.Box,Hu=window.recoil.useRecoilValue,bv=()=>{const e=Hu(We),t=Hu(ln),n=yv(null);return gv(()=>{var r;(r=n.current)==null||r.scrollIntoView({behavior:"smooth"})},[e,t]),v.jsxs(xv,{sx:{flex:1,overflow:"auto"},children:[e.map(r=>v.jsx(mv,{message:r},r.id)),v.jsx("div",{ref:n})]})},Wu=window.__mui__.Box,Do=window.__mui__.Typography,vv=window.__mui__.Avatar,kv=window.__mui__.Chip,wv=window.__foc__.useTheme,Sv=window.recoil.useRecoilValue,_v=[{label:"List my datasets",prompt:"List all my FiftyOne datasets."},{label:"Dataset summary",prompt:"Give me a summary of the current dataset."},{label:"Find duplicates",prompt:"Use the fiftyone-find-duplicates skill to find duplicate images in the current dataset."},{label:"Visualize embeddings",prompt:"Use the fiftyone-embeddings-visualization skill to visualize the current dataset in 2D."}],Cv=({onPromptClick:e})=>{const t=wv(),r=Sv(zi).activeSkills.slice(0,4).map(o=>({label:o.replace("fiftyone-","").replace(/-/g," "),prompt:`Use the ${o} skill.`})),i=r.length>0?r:_v;return v.jsxs(Wu,{sx:{display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",flex:1,p:3,textAlign:"center"},children:[v.jsx(vv,{sx:{width:56,height:56,bgcolor:"#D97706",mb:2},children:v.jsx(zn,{sx:{fontSize:32}})}),v.jsx(Do,{variant:"h6",sx:{mb:.5,fontWeight:700},children:"Voxel Agent"}),v.jsx(Do,{variant:"body2",sx:{maxWidth:380,mb:3,opacity:.65,lineHeight:1.6},children:"Ask questions about your datasets, run models, explore data, or use skills to automate complex FiftyOne workflows."}),v.jsx(Do,{variant:"caption",sx:{mb:1.5,opacity:.5,textTransform:"uppercase",letterSpacing:1},children:"Try asking"}),v.jsx(Wu,{sx:{display:"flex",flexWrap:"wrap",gap:1,justifyContent:"center",maxWidth:440},children:i.map((o,a)=>{var l,s,u;return v.jsx(kv,{icon:v.jsx(an,{sx:{fontSize:14}}),label:o.label,onClick:()=>e(o.prompt),sx:{cursor:"pointer",bgcolor:((l=t.background)==null?void 0:l.level1)||"rgba(255,255,255,0.05)",border:`1px solid ${((s=t.primary)==null?void 0:s.plainBorder)||"rgba(255,255,255,0.12)"}`,fontSize:"0.8rem","&:hover":{bgcolor:((u=t.background)==null?void 0:u.level2)||"rgba(255,255,255,0.1)",borderColor:"#D97706"},transition:"all 0.15s ease"}},a)})})]})};var Fo={},Ev=Se;Object.defineProperty(Fo,"__esModule",{value:!0});var qu=Fo.default=void 0,Tv=Ev(Re()),Rv=Te();qu=Fo.default=(0,Tv.default)((0,Rv.jsx)("path",{d:"M2.01 21 23 12 2.01 3 2 10l15 2-15 2z"}),"Send");var Lo={},Pv=Se;Object.defineProperty(Lo,"__esModule",{value:!0});var Vu=Lo.default=void 0,Iv=Pv(Re()),Av=Te();Vu=Lo.default=(0,Iv.default)((0,Av.jsx)("path",{d:"M6 6h12v12H6z"}),"Stop");var Bo={},Ov=Se;Object.defineProperty(Bo,"__esModule",{value:!0});var Yu=Bo.default=void 0,jv=Ov(Re()),$v=Te();Yu=Bo.default=(0,jv.default)((0,$v.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6zM8 9h8v10H8zm7.5-5-1-1h-5l-1 1H5v2h14V4z"}),"DeleteOutline");const hn=window.React.useCallback,mn=window.__foo__.useOperatorExecutor,gn="@adonaivera/claude-agent";function Mv(){const e=mn(`${gn}/send_message`);return hn(t=>e.execute(t),[e])}function zv(){const e=mn(`${gn}/confirm_operation`);return hn(t=>e.execute({pending_id:t}),[e])}function Dv(){const e=mn(`${gn}/cancel_operation`);return hn(t=>e.execute({pending_id:t}),[e])}function Fv(){const e=mn(`${gn}/load_config`);return hn(()=>e.execute({}),[e])}function Gu(){const e=mn(`${gn}/save_config`);return hn(t=>e.execute(t),[e])}function Lv(){const e=mn(`${gn}/clear_history`);return hn(()=>e.execute({}),[e])}const Bv=window.React.useRef,Nv=window.React.useEffect,Uv=window.__mui__.Box,Hv=window.__mui__.OutlinedInput,Ku=window.__mui__.IconButton,Xu=window.__mui__.Tooltip,Wv=window.__foc__.useTheme,qv=window.recoil.useRecoilState,Ju=window.recoil.useRecoilValue,Vv=({onSend:e})=>{var c,d,p,m;const t=Wv(),n=Bv(null),[r,i]=qv(Jh),o=Ju(ln),a=Ju(Kk),l=Lv(),s=()=>{const h=r.trim();!h||o||(i(""),e(h))},u=h=>{h.key==="Enter"&&!h.shiftKey&&(h.preventDefault(),s())};Nv(()=>{var h;o||(h=n.current)==null||h.focus()},[o]);const f=async()=>{await l()};return v.jsxs(Uv,{sx:{borderTop:`1px solid ${((c=t.primary)==null?void 0:c.plainBorder)||"rgba(255,255,255,0.08)"}`,p:1.5,display:"flex",gap:1,alignItems:"flex-end"},children:[a&&v.jsx(Xu,{title:"Clear history",children:v.jsx(Ku,{size:"small",onClick:f,sx:{mb:.25,opacity:.5,"&:hover":{opacity:1}},children:v.jsx(Yu,{sx:{fontSize:18}})})}),v.jsx(Hv,{inputRef:n,fullWidth:!0,multiline:!0,maxRows:6,value:r,onChange:h=>i(h.target.value),onKeyDown:u,disabled:o,placeholder:"Ask Claude about your data...",sx:{fontSize:"0.875rem","& .MuiOutlinedInput-notchedOutline":{borderColor:((d=t.primary)==null?void 0:d.plainBorder)||"rgba(255,255,255,0.15)"},"&:hover .MuiOutlinedInput-notchedOutline":{borderColor:((p=t.primary)==null?void 0:p.main)||"#6366f1"}},endAdornment:v.jsx(Xu,{title:o?"Stop":"Send (Enter)",children:v.jsx("span",{children:v.jsx(Ku,{disabled:!r.trim()&&!o,onClick:o?void 0:s,sx:{p:.5},children:o?v.jsx(Vu,{sx:{fontSize:20,color:"#EF4444"}}):v.jsx(qu,{sx:{fontSize:20,opacity:r.trim()?1:.3,color:r.trim()?((m=t.primary)==null?void 0:m.main)||"#6366f1":void 0}})})})})})]})};var No={},Yv=Se;Object.defineProperty(No,"__esModule",{value:!0});var Qu=No.default=void 0,Gv=Yv(Re()),Kv=Te();Qu=No.default=(0,Gv.default)((0,Kv.jsx)("path",{d:"M19 13h-6v6h-2v-6H5v-2h6V5h2v6h6z"}),"Add");var Uo={},Xv=Se;Object.defineProperty(Uo,"__esModule",{value:!0});var Zu=Uo.default=void 0,Jv=Xv(Re()),Qv=Te();Zu=Uo.default=(0,Jv.default)((0,Qv.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6zM19 4h-3.5l-1-1h-5l-1 1H5v2h14z"}),"Delete");const Zv=window.React.useState,ht=window.__mui__.Box,Kn=window.__mui__.Typography,ek=window.__mui__.TextField,ec=window.__mui__.Switch,tk=window.__mui__.FormControlLabel,nk=window.__mui__.Button,tc=window.__mui__.IconButton,rk=window.__mui__.Chip,nc=window.__mui__.Select,yn=window.__mui__.MenuItem,rc=window.__mui__.FormControl,ic=window.__mui__.InputLabel,oc=window.__mui__.Divider,ac=window.__mui__.Tooltip,ik=window.__foc__.useTheme,ok=window.recoil.useRecoilState,Wr=({children:e})=>v.jsx(Kn,{sx:{fontSize:"0.7rem",fontWeight:700,textTransform:"uppercase",letterSpacing:"0.08em",opacity:.5,mb:1.5,mt:2},children:e}),ak=()=>{ik();const[e,t]=ok(zi),[n,r]=Zv(!1),i=Gu(),o=(c,d)=>{t(p=>({...p,settings:{...p.settings,[c]:d}}))},a=c=>{t(d=>{const p=d.activeSkills.includes(c)?d.activeSkills.filter(m=>m!==c):[...d.activeSkills,c];return{...d,activeSkills:p}})},l=c=>{t(d=>({...d,mcpServers:d.mcpServers.map((p,m)=>m===c?{...p,enabled:!p.enabled}:p)}))},s=c=>{t(d=>({...d,mcpServers:d.mcpServers.filter((p,m)=>m!==c)}))},u=()=>{const c={label:"New MCP Server",command:"python",args:[],enabled:!1};t(d=>({...d,mcpServers:[...d.mcpServers,c]}))},f=async()=>{await i({mcpServers:e.mcpServers,activeSkills:e.activeSkills,settings:e.settings}),r(!0),setTimeout(()=>r(!1),2e3)};return v.jsxs(ht,{sx:{flex:1,overflow:"auto",p:2},children:[v.jsx(Wr,{children:"Model"}),v.jsxs(rc,{fullWidth:!0,size:"small",sx:{mb:1.5},children:[v.jsx(ic,{children:"Model"}),v.jsxs(nc,{value:e.settings.model,label:"Model",onChange:c=>o("model",c.target.value),children:[v.jsx(yn,{value:"claude-sonnet-4-20250514",children:"Claude Sonnet 4"}),v.jsx(yn,{value:"claude-opus-4-5",children:"Claude Opus 4.5"}),v.jsx(yn,{value:"claude-haiku-4-5-20251001",children:"Claude Haiku 4.5"})]})]}),v.jsx(ek,{fullWidth:!0,size:"small",label:"Max Tokens",type:"number",value:e.settings.maxTokens,onChange:c=>o("maxTokens",parseInt(c.target.value,10)||8192),sx:{mb:1.5},inputProps:{min:256,max:32e3,step:256}}),v.jsx(Wr,{children:"Permission Mode"}),v.jsxs(rc,{fullWidth:!0,size:"small",sx:{mb:1.5},children:[v.jsx(ic,{children:"Mode"}),v.jsxs(nc,{value:e.settings.permissionMode,label:"Mode",onChange:c=>o("permissionMode",c.target.value),children:[v.jsx(yn,{value:"auto",children:"Auto (confirm dangerous ops)"}),v.jsx(yn,{value:"confirm_all",children:"Confirm all tool calls"}),v.jsx(yn,{value:"block_all",children:"Block all tool calls"})]})]}),v.jsx(tk,{control:v.jsx(ec,{size:"small",checked:e.settings.persistHistory,onChange:c=>o("persistHistory",c.target.checked)}),label:v.jsx(Kn,{sx:{fontSize:"0.875rem"},children:"Persist conversation history"}),sx:{mb:1}}),v.jsx(oc,{sx:{my:2,opacity:.2}}),v.jsx(Wr,{children:"Active Skills"}),e.availableSkills.length===0?v.jsxs(Kn,{sx:{fontSize:"0.8rem",opacity:.5,mb:1.5},children:["No skills found. Place skill directories in"," ",v.jsx(ht,{component:"code",sx:{fontSize:"0.75rem"},children:"~/.fiftyone/skills/"})," ","or set the"," ",v.jsx(ht,{component:"code",sx:{fontSize:"0.75rem"},children:"FIFTYONE_SKILLS_DIR"})," ","secret."]}):v.jsx(ht,{sx:{display:"flex",flexWrap:"wrap",gap:.75,mb:1.5},children:e.availableSkills.map(c=>{const d=e.activeSkills.includes(c);return v.jsx(rk,{icon:v.jsx(an,{sx:{fontSize:12}}),label:c.replace("fiftyone-","").replace(/-/g," "),onClick:()=>a(c),variant:d?"filled":"outlined",size:"small",sx:{fontSize:"0.75rem",cursor:"pointer",bgcolor:d?"#D9770620":"transparent",borderColor:d?"#D97706":"rgba(255,255,255,0.2)",color:d?"#D97706":void 0}},c)})}),v.jsx(oc,{sx:{my:2,opacity:.2}}),v.jsxs(ht,{sx:{display:"flex",alignItems:"center",mb:1},children:[v.jsx(Wr,{children:"MCP Servers"}),v.jsx(ht,{sx:{flex:1}}),v.jsx(ac,{title:"Add MCP server",children:v.jsx(tc,{size:"small",onClick:u,children:v.jsx(Qu,{sx:{fontSize:18}})})})]}),e.mcpServers.map((c,d)=>v.jsxs(ht,{sx:{border:`1px solid ${c.enabled?"#D97706":"rgba(255,255,255,0.1)"}`,borderRadius:"8px",p:1.5,mb:1},children:[v.jsxs(ht,{sx:{display:"flex",alignItems:"center",justifyContent:"space-between",mb:1},children:[v.jsx(Kn,{sx:{fontSize:"0.85rem",fontWeight:600},children:c.label||"MCP Server"}),v.jsxs(ht,{sx:{display:"flex",alignItems:"center",gap:.5},children:[v.jsx(ec,{size:"small",checked:c.enabled,onChange:()=>l(d)}),v.jsx(ac,{title:"Remove",children:v.jsx(tc,{size:"small",onClick:()=>s(d),sx:{opacity:.5,"&:hover":{opacity:1}},children:v.jsx(Zu,{sx:{fontSize:16}})})})]})]}),v.jsxs(Kn,{sx:{fontSize:"0.75rem",fontFamily:"monospace",opacity:.6},children:[c.command," ",c.args.join(" ")]})]},d)),v.jsx(ht,{sx:{mt:3,display:"flex",justifyContent:"flex-end"},children:v.jsx(nk,{variant:"contained",onClick:f,sx:{bgcolor:n?"#10B981":"#D97706","&:hover":{bgcolor:n?"#059669":"#B45309"},transition:"background-color 0.2s"},children:n?"Saved!":"Save Settings"})})]})};var Ho={},lk=Se;Object.defineProperty(Ho,"__esModule",{value:!0});var lc=Ho.default=void 0,sk=lk(Re()),sc=Te();lc=Ho.default=(0,sk.default)([(0,sc.jsx)("path",{d:"M12 5.99 19.53 19H4.47zM12 2 1 21h22z"},"0"),(0,sc.jsx)("path",{d:"M13 16h-2v2h2zm0-6h-2v5h2z"},"1")],"WarningAmber");var Wo={},uk=Se;Object.defineProperty(Wo,"__esModule",{value:!0});var uc=Wo.default=void 0,ck=uk(Re()),fk=Te();uc=Wo.default=(0,ck.default)((0,fk.jsx)("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2M12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8"}),"ErrorOutline");const Xn=window.__mui__.Box,Jn=window.__mui__.Typography,cc=window.__mui__.Button,pk=window.__mui__.Chip,dk=window.__mui__.Backdrop,hk=window.__mui__.Paper,mk=window.__foc__.useTheme,gk=window.recoil.useRecoilState,yk=window.recoil.useSetRecoilState,xk=()=>{const e=mk(),[t,n]=gk(Ml),r=yk(We),i=zv(),o=Dv();if(!t)return null;const a=t.risk==="high",l=async()=>{n(null),r(u=>u.map(f=>f.id!==t.messageId?f:{...f,toolCalls:(f.toolCalls||[]).map(c=>c.id===t.toolCallId?{...c,status:"executing"}:c)})),await i(t.pendingId)},s=async()=>{r(u=>u.map(f=>f.id!==t.messageId?f:{...f,toolCalls:(f.toolCalls||[]).map(c=>c.id===t.toolCallId?{...c,status:"blocked",blockedReason:"Cancelled by user."}:c)})),n(null),await o(t.pendingId)};return v.jsx(dk,{open:!0,sx:{zIndex:9999,bgcolor:"rgba(0,0,0,0.7)"},children:v.jsxs(hk,{elevation:8,sx:{bgcolor:e.background.header||"#1a1a1a",border:`1px solid ${a?"#EF4444":"#F59E0B"}`,borderRadius:"12px",p:3,maxWidth:480,width:"90%"},children:[v.jsxs(Xn,{sx:{display:"flex",alignItems:"center",gap:1.5,mb:2},children:[a?v.jsx(uc,{sx:{fontSize:28,color:"#EF4444"}}):v.jsx(lc,{sx:{fontSize:28,color:"#F59E0B"}}),v.jsxs(Xn,{children:[v.jsx(Jn,{sx:{fontWeight:700,fontSize:"1rem"},children:"Confirm Operation"}),v.jsx(pk,{label:a?"HIGH RISK":"MEDIUM RISK",size:"small",sx:{bgcolor:a?"#EF444420":"#F59E0B20",color:a?"#EF4444":"#F59E0B",border:`1px solid ${a?"#EF4444":"#F59E0B"}`,fontSize:"0.65rem",height:"18px",fontWeight:700}})]})]}),v.jsx(Jn,{sx:{fontSize:"0.875rem",mb:2,lineHeight:1.6,opacity:.9},children:t.humanDescription}),v.jsxs(Xn,{sx:{bgcolor:e.background.level1||"rgba(0,0,0,0.3)",borderRadius:"8px",p:1.5,mb:2.5},children:[v.jsx(Jn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.5,mb:.5,textTransform:"uppercase"},children:"Tool"}),v.jsx(Jn,{sx:{fontSize:"0.875rem",fontFamily:"monospace",mb:1},children:t.toolName}),Object.keys(t.toolInput).length>0&&v.jsxs(v.Fragment,{children:[v.jsx(Jn,{sx:{fontSize:"0.7rem",fontWeight:600,opacity:.5,mb:.5,textTransform:"uppercase"},children:"Parameters"}),v.jsx(Xn,{component:"pre",sx:{fontSize:"0.75rem",fontFamily:"monospace",bgcolor:e.background.level2,p:1,borderRadius:"4px",m:0,maxHeight:"120px",overflow:"auto",whiteSpace:"pre-wrap",wordBreak:"break-all"},children:JSON.stringify(t.toolInput,null,2)})]})]}),v.jsxs(Xn,{sx:{display:"flex",gap:1.5,justifyContent:"flex-end"},children:[v.jsx(cc,{variant:"outlined",onClick:s,sx:{borderColor:"rgba(255,255,255,0.2)",color:"rgba(255,255,255,0.7)","&:hover":{borderColor:"rgba(255,255,255,0.4)"}},children:"Cancel"}),v.jsx(cc,{variant:"contained",onClick:l,sx:{bgcolor:a?"#EF4444":"#F59E0B",color:"#fff",fontWeight:600,"&:hover":{bgcolor:a?"#DC2626":"#D97706"}},children:"Confirm"})]})]})})},bk=window.React.useEffect,Ye=window.__mui__.Box,xn=window.__mui__.Typography,vk=window.__mui__.Tabs,qo=window.__mui__.Tab,fc=window.__foc__.useTheme,Vo=window.recoil.useRecoilState,pc=window.recoil.useRecoilValue,kk=window.recoil.useSetRecoilState,wk=()=>{var p,m,h;const e=fc(),t=pc(We);pc(ln);const[n,r]=Vo(zi),[i,o]=Vo(em),[a,l]=Vo(tm),s=kk(We),u=Mv(),f=Fv(),c=Gu();bk(()=>{i||f().then(k=>{k&&(r(b=>({...b,mcpServers:k.mcp_servers||b.mcpServers,activeSkills:k.active_skills||b.activeSkills,availableSkills:k.available_skills||b.availableSkills,settings:{...b.settings,...k.settings||{}}})),k.history&&k.history.length>0&&s(k.history.map((b,C)=>({id:`history-${C}`,role:b.role,content:typeof b.content=="string"?b.content:"",timestamp:Date.now()-(k.history.length-C)*1e3})))),o(!0)}).catch(()=>o(!0))},[]);const d=async k=>{const b=`user-${Date.now()}`;s(D=>[...D,{id:b,role:"user",content:k,timestamp:Date.now()}]);const C=t.map(D=>({role:D.role,content:D.content})),T=n.mcpServers.find(D=>D.enabled),M=T?{command:T.command,args:T.args,enabled:!0}:void 0;if(await u({message:k,history:C,activeSkills:n.activeSkills,mcpConfig:M,model:n.settings.model,maxTokens:n.settings.maxTokens}),n.settings.persistHistory)await c({history:[...C,{role:"user",content:k}]})};return v.jsxs(Ye,{sx:{display:"flex",flexDirection:"column",height:"100%",bgcolor:((p=e.background)==null?void 0:p.body)||"#141414",position:"relative"},children:[v.jsxs(Ye,{sx:{display:"flex",alignItems:"center",gap:1,px:2,py:1,borderBottom:`1px solid ${((m=e.primary)==null?void 0:m.plainBorder)||"rgba(255,255,255,0.08)"}`,bgcolor:((h=e.background)==null?void 0:h.header)||"#1a1a1a",flexShrink:0},children:[v.jsx(zn,{sx:{color:"#D97706",fontSize:20}}),v.jsx(xn,{sx:{fontWeight:700,fontSize:"0.875rem"},children:"Voxel Agent"}),v.jsx(Ye,{sx:{flex:1}}),v.jsxs(vk,{value:a,onChange:(k,b)=>l(b),sx:{minHeight:"unset","& .MuiTabs-indicator":{bgcolor:"#D97706"}},children:[v.jsx(qo,{value:"chat",icon:v.jsx(jl,{sx:{fontSize:16}}),iconPosition:"start",label:"Chat",sx:{minHeight:"unset",py:.5,px:1.5,fontSize:"0.75rem",fontWeight:600,minWidth:"unset",textTransform:"none","&.Mui-selected":{color:"#D97706"}}}),v.jsx(qo,{value:"skills",icon:v.jsx(an,{sx:{fontSize:16}}),iconPosition:"start",label:"Skills",sx:{minHeight:"unset",py:.5,px:1.5,fontSize:"0.75rem",fontWeight:600,minWidth:"unset",textTransform:"none","&.Mui-selected":{color:"#D97706"}}}),v.jsx(qo,{value:"settings",icon:v.jsx($l,{sx:{fontSize:16}}),iconPosition:"start",label:"Settings",sx:{minHeight:"unset",py:.5,px:1.5,fontSize:"0.75rem",fontWeight:600,minWidth:"unset",textTransform:"none","&.Mui-selected":{color:"#D97706"}}})]})]}),a==="chat"&&v.jsxs(v.Fragment,{children:[t.length===0?v.jsx(Cv,{onPromptClick:k=>{l("chat"),d(k)}}):v.jsx(bv,{}),v.jsx(Vv,{onSend:d})]}),a==="skills"&&v.jsx(Sk,{availableSkills:n.availableSkills,activeSkills:n.activeSkills,onToggle:k=>r(b=>({...b,activeSkills:b.activeSkills.includes(k)?b.activeSkills.filter(C=>C!==k):[...b.activeSkills,k]}))}),a==="settings"&&v.jsx(ak,{}),v.jsx(xk,{})]})},Sk=({availableSkills:e,activeSkills:t,onToggle:n})=>{const r=fc();return e.length===0?v.jsx(Ye,{sx:{flex:1,display:"flex",alignItems:"center",justifyContent:"center",p:3,textAlign:"center"},children:v.jsxs(Ye,{children:[v.jsx(an,{sx:{fontSize:40,opacity:.3,mb:2}}),v.jsx(xn,{sx:{fontSize:"0.9rem",fontWeight:600,mb:1},children:"No Skills Found"}),v.jsxs(xn,{sx:{fontSize:"0.8rem",opacity:.5},children:["Add skill directories to"," ",v.jsx(Ye,{component:"code",sx:{fontSize:"0.75rem"},children:"~/.fiftyone/skills/"})," ","or set the"," ",v.jsx(Ye,{component:"code",sx:{fontSize:"0.75rem"},children:"FIFTYONE_SKILLS_DIR"})," ","secret."]})]})}):v.jsxs(Ye,{sx:{flex:1,overflow:"auto",p:2},children:[v.jsx(xn,{sx:{fontSize:"0.8rem",opacity:.6,mb:2,lineHeight:1.5},children:"Toggle skills to inject their instructions into Claude's system prompt. Active skills appear below the message input."}),v.jsx(Ye,{sx:{display:"flex",flexDirection:"column",gap:1},children:e.map(i=>{var a;const o=t.includes(i);return v.jsxs(Ye,{onClick:()=>n(i),sx:{display:"flex",alignItems:"center",gap:1.5,p:1.5,border:`1px solid ${o?"#D97706":"rgba(255,255,255,0.1)"}`,borderRadius:"8px",cursor:"pointer",bgcolor:o?"#D9770610":((a=r.background)==null?void 0:a.level1)||"rgba(255,255,255,0.03)",transition:"all 0.15s ease","&:hover":{borderColor:"#D97706",bgcolor:"#D9770618"}},children:[v.jsx(an,{sx:{fontSize:18,color:o?"#D97706":void 0,opacity:o?1:.4}}),v.jsxs(Ye,{children:[v.jsx(xn,{sx:{fontSize:"0.875rem",fontWeight:600},children:i.replace("fiftyone-","").replace(/-/g," ")}),v.jsx(xn,{sx:{fontSize:"0.75rem",opacity:.5},children:i})]}),v.jsx(Ye,{sx:{flex:1}}),v.jsx(Ye,{sx:{width:8,height:8,borderRadius:"50%",bgcolor:o?"#D97706":"rgba(255,255,255,0.15)",flexShrink:0}})]},i)})})]})},Tt=window.__foo__.Operator,Rt=window.__foo__.OperatorConfig,$e=window.recoil.useSetRecoilState;class _k extends Tt{get config(){return new Rt({name:"stream_message_start",unlisted:!0})}useHooks(){return{setMessages:$e(We),setStreamingId:$e($i),setStreaming:$e(ln)}}async execute(t){const{setMessages:n,setStreamingId:r,setStreaming:i}=t.hooks,{message_id:o}=t.params,a={id:o,role:"assistant",content:"",toolCalls:[],isStreaming:!0,timestamp:Date.now()};n(l=>[...l,a]),r(o),i(!0)}}class Ck extends Tt{get config(){return new Rt({name:"stream_chunk",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{delta:r,message_id:i}=t.params;n(o=>o.map(a=>a.id===i?{...a,content:a.content+r}:a))}}class Ek extends Tt{get config(){return new Rt({name:"stream_complete",unlisted:!0})}useHooks(){return{setMessages:$e(We),setStreamingId:$e($i),setStreaming:$e(ln)}}async execute(t){const{setMessages:n,setStreamingId:r,setStreaming:i}=t.hooks,{message_id:o}=t.params;n(a=>a.map(l=>l.id===o?{...l,isStreaming:!1}:l)),r(null),i(!1)}}class Tk extends Tt{get config(){return new Rt({name:"stream_error",unlisted:!0})}useHooks(){return{setMessages:$e(We),setStreaming:$e(ln),setStreamingId:$e($i)}}async execute(t){const{setMessages:n,setStreaming:r,setStreamingId:i}=t.hooks,{error:o,message_id:a}=t.params;n(l=>l.map(s=>s.id===a?{...s,error:o,isStreaming:!1}:s)),r(!1),i(null)}}class Rk extends Tt{get config(){return new Rt({name:"tool_call_start",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{tool_id:r,tool_name:i,message_id:o}=t.params,a={id:r,name:i,input:{},status:"executing"};n(l=>l.map(s=>s.id!==o?s:{...s,toolCalls:[...s.toolCalls||[],a]}))}}class Pk extends Tt{get config(){return new Rt({name:"tool_result",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{tool_id:r,result:i,message_id:o}=t.params;n(a=>a.map(l=>l.id!==o?l:{...l,toolCalls:(l.toolCalls||[]).map(s=>s.id===r?{...s,status:"completed",result:i}:s)}))}}class Ik extends Tt{get config(){return new Rt({name:"tool_blocked",unlisted:!0})}useHooks(){return{setMessages:$e(We)}}async execute(t){const{setMessages:n}=t.hooks,{tool_id:r,reason:i,message_id:o}=t.params;n(a=>a.map(l=>l.id!==o?l:{...l,toolCalls:(l.toolCalls||[]).map(s=>s.id===r?{...s,status:"blocked",blockedReason:i}:s)}))}}class Ak extends Tt{get config(){return new Rt({name:"confirmation_required",unlisted:!0})}useHooks(){return{setMessages:$e(We),setPendingConfirmation:$e(Ml)}}async execute(t){const{setMessages:n,setPendingConfirmation:r}=t.hooks,{pending_id:i,tool_id:o,tool_name:a,tool_input:l,risk:s,human_description:u,message_id:f}=t.params;n(d=>d.map(p=>{if(p.id!==f)return p;const h=(p.toolCalls||[]).some(k=>k.id===o)?(p.toolCalls||[]).map(k=>k.id===o?{...k,status:"awaiting_confirmation",input:l||{}}:k):[...p.toolCalls||[],{id:o,name:a,input:l||{},status:"awaiting_confirmation"}];return{...p,toolCalls:h}})),r({pendingId:i,toolCallId:o,toolName:a,toolInput:l||{},risk:s,humanDescription:u,messageId:f})}}const Ok=[_k,Ck,Ek,Tk,Rk,Pk,Ik,Ak],jk=window.__fop__.PluginComponentType,$k=window.__fop__.registerComponent,Mk=window.__foo__.registerOperator,zk="@adonaivera/claude-agent";$k({name:"claude_agent",label:"Voxel Agent",component:wk,type:jk.Panel,activator:Dk,Icon:zn});function Dk(){return!0}for(const e of Ok)Mk(e,zk)});
@@ -100,11 +100,9 @@ export const ClaudeAgentPanel: React.FC = () => {
     });
 
     if (config.settings.persistHistory) {
-      const allMessages = [
-        ...messages,
-        { role: "user" as const, content: message },
-      ];
-      await saveConfig({ history: allMessages });
+      await saveConfig({
+        history: [...history, { role: "user" as const, content: message }],
+      });
     }
   };
 
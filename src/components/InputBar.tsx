@@ -12,7 +12,7 @@ import StopIcon from "@mui/icons-material/Stop";
 import DeleteOutlineIcon from "@mui/icons-material/DeleteOutline";
 import { useTheme } from "@fiftyone/components";
 import { useRecoilState, useRecoilValue } from "recoil";
-import { isStreamingAtom, inputValueAtom, messagesAtom } from "../state/chatAtoms";
+import { isStreamingAtom, inputValueAtom, hasMessagesSelector } from "../state/chatAtoms";
 import { useClearHistory } from "../hooks/usePluginClient";
 
 interface InputBarProps {
@@ -24,7 +24,7 @@ export const InputBar: React.FC<InputBarProps> = ({ onSend }) => {
   const inputRef = useRef<HTMLInputElement>(null);
   const [inputValue, setInputValue] = useRecoilState(inputValueAtom);
   const isStreaming = useRecoilValue(isStreamingAtom);
-  const messages = useRecoilValue(messagesAtom);
+  const hasMessages = useRecoilValue(hasMessagesSelector);
   const clearHistory = useClearHistory();
 
   const handleSend = () => {
@@ -61,7 +61,7 @@ export const InputBar: React.FC<InputBarProps> = ({ onSend }) => {
         alignItems: "flex-end",
       }}
     >
-      {messages.length > 0 && (
+      {hasMessages && (
         <Tooltip title="Clear history">
           <IconButton size="small" onClick={handleClear} sx={{ mb: 0.25, opacity: 0.5, "&:hover": { opacity: 1 } }}>
             <DeleteOutlineIcon sx={{ fontSize: 18 }} />
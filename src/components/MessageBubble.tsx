@@ -121,7 +121,7 @@ const MarkdownComponents = {
   ),
 };
 
-export const MessageBubble: React.FC<MessageBubbleProps> = ({ message }) => {
+const MessageBubbleImpl: React.FC<MessageBubbleProps> = ({ message }) => {
   const theme = useTheme();
   const isUser = message.role === "user";
 
@@ -177,6 +177,18 @@ export const MessageBubble: React.FC<MessageBubbleProps> = ({ message }) => {
                 </ReactMarkdown>
               </Box>
             )}
+            {message.error && (
+              <Typography
+                sx={{
+                  fontSize: "0.875rem",
+                  lineHeight: 1.7,
+                  color: "#EF4444",
+                  mt: message.content ? 1 : 0,
+                }}
+              >
+                ⚠️ Error: {message.error}
+              </Typography>
+            )}
             {message.isStreaming && !message.content && (
               <Box
                 sx={{
@@ -214,3 +226,8 @@ export const MessageBubble: React.FC<MessageBubbleProps> = ({ message }) => {
     </Box>
   );
 };
+
+// Stream operators replace only the message being updated, so memoizing on
+// the message object skips re-rendering (and re-parsing the markdown of)
+// every other bubble on each streamed chunk
+export const MessageBubble = React.memo(MessageBubbleImpl);
@@ -118,16 +118,12 @@ export class StreamError extends Operator {
     const { setMessages, setStreaming, setStreamingId } = ctx.hooks;
     const { error, message_id } = ctx.params;
 
+    // Keep the error out of ``content`` so it is never sent back to Claude
+    // as part of the chat history
     setMessages((prev) =>
-      prev.map((m) => {
-        if (m.id !== message_id) return m;
-        const separator = m.content ? "\n\n" : "";
-        return {
-          ...m,
-          content: `${m.content}${separator}⚠️ Error: ${error}`,
-          isStreaming: false,
-        };
-      })
+      prev.map((m) =>
+        m.id === message_id ? { ...m, error, isStreaming: false } : m
+      )
     );
     setStreaming(false);
     setStreamingId(null);
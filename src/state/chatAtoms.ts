@@ -5,7 +5,7 @@
  * | `voxel51.com <https://voxel51.com/>`_
  */
 
-import { atom } from "recoil";
+import { atom, selector } from "recoil";
 import type { Message, PendingConfirmation } from "../types";
 
 export const messagesAtom = atom<Message[]>({
@@ -13,6 +13,11 @@ export const messagesAtom = atom<Message[]>({
   default: [],
 });
 
+export const hasMessagesSelector = selector<boolean>({
+  key: "claudeAgent__hasMessages",
+  get: ({ get }) => get(messagesAtom).length > 0,
+});
+
 export const isStreamingAtom = atom<boolean>({
   key: "claudeAgent__isStreaming",
   default: false,
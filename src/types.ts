@@ -11,6 +11,7 @@ export interface Message {
   content: string;
   toolCalls?: ToolCall[];
   isStreaming?: boolean;
+  error?: string;
   timestamp?: number;
 }
 